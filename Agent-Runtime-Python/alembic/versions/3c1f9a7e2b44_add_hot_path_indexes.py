@@ -0,0 +1,71 @@
+"""add hot path indexes
+
+Indexes matching the access paths of get_agent_metrics, get_tenant_metrics
+and get_session_metrics. Created CONCURRENTLY so existing tables stay
+writable while the indexes build.
+
+Revision ID: 3c1f9a7e2b44
+Revises:
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1f9a7e2b44'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_agent_instance_sessions_active_agent_id",
+            "agent_instance_sessions",
+            ["agent_id"],
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_session_metrics_agent_id_date",
+            "session_metrics",
+            ["agent_id", "date"],
+            postgresql_include=["avg_llm_latency", "total_cost"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_session_metrics_session_id",
+            "session_metrics",
+            ["session_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_tenant_metrics_tenant_id_date",
+            "tenant_metrics",
+            ["tenant_id", "date"],
+            postgresql_include=["active_agents", "total_sessions", "total_cost"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, name in (
+            ("tenant_metrics", "ix_tenant_metrics_tenant_id_date"),
+            ("session_metrics", "ix_session_metrics_session_id"),
+            ("session_metrics", "ix_session_metrics_agent_id_date"),
+            ("agent_instance_sessions", "ix_agent_instance_sessions_active_agent_id"),
+        ):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
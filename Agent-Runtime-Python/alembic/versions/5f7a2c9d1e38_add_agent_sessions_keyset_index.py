@@ -0,0 +1,40 @@
+"""add agent sessions keyset index
+
+Supports listing an agent's sessions newest first with keyset pagination
+on (started_at, id). Created CONCURRENTLY like the other runtime indexes.
+
+Revision ID: 5f7a2c9d1e38
+Revises: 8d2e4b6a1c90
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f7a2c9d1e38'
+down_revision = '8d2e4b6a1c90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_agent_instance_sessions_agent_id_started_at",
+            "agent_instance_sessions",
+            ["agent_id", "started_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_agent_instance_sessions_agent_id_started_at",
+            table_name="agent_instance_sessions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,39 @@
+"""add agent daily metrics rollup
+
+Per-agent, per-day rollup of session_metrics maintained by Agent-Runtime as
+sessions end. Populate existing history with
+scripts/backfill_agent_daily_metrics.py.
+
+Revision ID: 8d2e4b6a1c90
+Revises: 3c1f9a7e2b44
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2e4b6a1c90'
+down_revision = '3c1f9a7e2b44'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "agent_daily_metrics",
+        sa.Column("agent_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("tenant_id", sa.Integer(), nullable=False),
+        sa.Column("session_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("latency_sum", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("latency_count", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_cost", sa.BigInteger(), server_default="0", nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint("agent_id", "date"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("agent_daily_metrics")
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Build the agent_daily_metrics rollup from existing session_metrics rows.
+
+Run once after applying the Alembic revision that creates the table, or any
+time the rollup needs rebuilding. Rows are overwritten, so re-running is safe.
+
+Usage:
+    python scripts/backfill_agent_daily_metrics.py [--agent-id ID]
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.db import AsyncSessionLocal, close_db
+from src.database.operations import backfill_agent_daily_metrics
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill agent_daily_metrics")
+    parser.add_argument("--agent-id", type=int, default=None, help="Only rebuild one agent")
+    args = parser.parse_args()
+
+    try:
+        async with AsyncSessionLocal() as db:
+            rows = await backfill_agent_daily_metrics(db, agent_id=args.agent_id)
+            await db.commit()
+        print(f"✅ Wrote {rows} agent_daily_metrics rows")
+        return 0
+    except Exception as e:
+        print(f"❌ Backfill failed: {e}")
+        return 1
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
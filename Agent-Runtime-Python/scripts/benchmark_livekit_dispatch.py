@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Benchmark agent dispatch latency: per-call LiveKitAPI clients vs shared clients.
+
+This script:
+1. Starts a local stand-in for the LiveKit AgentDispatchService Twirp endpoint
+   (optionally adding server-side latency)
+2. Dispatches N agents at each concurrency level, building a new LiveKitAPI
+   client per dispatch (the previous behaviour)
+3. Repeats with the shared client from LiveKitAPIRegistry
+4. Prints p50/p95/p99 latency, throughput and connections opened per mode
+
+No LiveKit server or database needed.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from aiohttp import web
+from livekit import api
+
+from src.livekit.api_client import LiveKitAPIRegistry
+
+API_KEY = "benchmark-key"
+API_SECRET = "benchmark-secret-at-least-32-characters"
+DISPATCH_PATH = "/twirp/livekit.AgentDispatchService/CreateDispatch"
+
+
+async def start_stand_in_server(latency_ms: float):
+    """Serve CreateDispatch on a free local port. Returns (runner, url, counters)."""
+    # Client (host, port) pairs seen: one per TCP connection opened
+    counters = {"requests": 0, "peers": set()}
+
+    async def create_dispatch(request: web.Request) -> web.Response:
+        counters["requests"] += 1
+        counters["peers"].add(request.transport.get_extra_info("peername"))
+        body = api.CreateAgentDispatchRequest.FromString(await request.read())
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+        dispatch = api.AgentDispatch(
+            id=f"AD_{counters['requests']}",
+            agent_name=body.agent_name,
+            room=body.room,
+            metadata=body.metadata,
+        )
+        return web.Response(
+            body=dispatch.SerializeToString(), content_type="application/protobuf"
+        )
+
+    app = web.Application()
+    app.router.add_post(DISPATCH_PATH, create_dispatch)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}", counters
+
+
+def _request(i: int):
+    return api.CreateAgentDispatchRequest(
+        agent_name="agent-1", room=f"room-{i}", metadata='{"agentId": 1}'
+    )
+
+
+async def dispatch_per_call(url: str, i: int) -> None:
+    """Previous behaviour: a fresh client (and connection) per dispatch."""
+    lkapi = api.LiveKitAPI(url, API_KEY, API_SECRET)
+    try:
+        await lkapi.agent_dispatch.create_dispatch(_request(i))
+    finally:
+        # The old code never closed it; close here so the run doesn't leak
+        await lkapi.aclose()
+
+
+async def run(mode: str, url: str, registry: LiveKitAPIRegistry, total: int, concurrency: int):
+    """Dispatch ``total`` agents with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def one(i: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            if mode == "per-call":
+                await dispatch_per_call(url, i)
+            else:
+                lkapi = registry.get(url, API_KEY, API_SECRET)
+                await lkapi.agent_dispatch.create_dispatch(_request(i))
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(total)))
+    elapsed = time.perf_counter() - started
+    return latencies, elapsed
+
+
+def percentile(values, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def main_async(args) -> int:
+    runner, url, counters = await start_stand_in_server(args.server_latency_ms)
+    print(f"🚀 Stand-in dispatch server at {url} (+{args.server_latency_ms}ms per request)")
+    print(f"📊 {args.dispatches} dispatches per run")
+    print(
+        f"{'mode':>10}{'conc':>6}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+        f"{'mean ms':>9}{'req/s':>9}{'conns':>7}"
+    )
+    try:
+        for concurrency in args.concurrency:
+            for mode in ("per-call", "shared"):
+                registry = LiveKitAPIRegistry(connection_limit=args.connection_limit)
+                # Warm up the shared client's pool outside the measurement
+                if mode == "shared":
+                    await run(mode, url, registry, concurrency, concurrency)
+                counters["peers"].clear()
+                latencies, elapsed = await run(
+                    mode, url, registry, args.dispatches, concurrency
+                )
+                connections = len(counters["peers"])
+                await registry.close()
+                print(
+                    f"{mode:>10}{concurrency:>6}"
+                    f"{percentile(latencies, 50):>9.2f}"
+                    f"{percentile(latencies, 95):>9.2f}"
+                    f"{percentile(latencies, 99):>9.2f}"
+                    f"{statistics.mean(latencies):>9.2f}"
+                    f"{args.dispatches / elapsed:>9.0f}"
+                    f"{connections:>7}"
+                )
+    finally:
+        await runner.cleanup()
+    print("✅ Done")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dispatches", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--server-latency-ms", type=float, default=0.0)
+    parser.add_argument("--connection-limit", type=int, default=100)
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark memory per tracked session: plain dicts vs SessionRecord.
+
+This script:
+1. Builds N sessions in the old per-session dict layout and measures the
+   traced allocation with tracemalloc
+2. Builds the same N sessions as SessionRecord objects and measures again
+3. Prints bytes per session for each size (default 10k, 100k and 1M)
+
+Session IDs, room names and timestamps are distinct per session in both
+layouts, so the difference is the container overhead. No database needed.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.runtime.session_record import SessionRecord
+
+STARTED_AT = datetime(2024, 1, 1)
+
+
+def build_dicts(count: int) -> dict:
+    """Build sessions in the previous Dict[str, Any] layout."""
+    sessions = {}
+    for i in range(count):
+        session_id = f"{i:021d}"
+        sessions[session_id] = {
+            "sessionId": session_id,
+            "agentId": i % 500,
+            "tenantId": i % 50,
+            "roomName": f"room-{i}",
+            "status": "active",
+            "startedAt": STARTED_AT + timedelta(seconds=i),
+            "participantCount": 1,
+        }
+    return sessions
+
+
+def build_records(count: int) -> dict:
+    """Build sessions as SessionRecord objects."""
+    sessions = {}
+    for i in range(count):
+        session_id = f"{i:021d}"
+        sessions[session_id] = SessionRecord(
+            session_id=session_id,
+            agent_id=i % 500,
+            tenant_id=i % 50,
+            room_name=f"room-{i}",
+            status="active",
+            started_at=STARTED_AT + timedelta(seconds=i),
+            participant_count=1,
+        )
+    return sessions
+
+
+def measure(builder, count: int) -> float:
+    """Return traced bytes per session held by the builder's result."""
+    gc.collect()
+    tracemalloc.start()
+    sessions = builder(count)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sessions
+    return current / count
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    args = parser.parse_args()
+
+    print("📊 Bytes per session")
+    print(f"{'sessions':>10}{'dict':>10}{'record':>10}{'saved':>10}")
+    for count in args.sizes:
+        dict_bytes = measure(build_dicts, count)
+        record_bytes = measure(build_records, count)
+        saved = 1 - record_bytes / dict_bytes
+        print(f"{count:>10,}{dict_bytes:>10.0f}{record_bytes:>10.0f}{saved:>10.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
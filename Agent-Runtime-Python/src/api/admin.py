@@ -0,0 +1,57 @@
+"""Admin API endpoints."""
+
+from typing import Optional
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+
+from src.api.agents import verify_api_key
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+class DrainRequest(BaseModel):
+    """Request model for starting a drain."""
+    deadlineSeconds: Optional[float] = None
+
+
+class DrainStatusResponse(BaseModel):
+    """Response model for drain status."""
+    state: str
+    reason: Optional[str]
+    liveSessions: int
+    startedAt: Optional[str]
+    elapsedSeconds: Optional[float]
+    deadlineSeconds: float
+    retryAfterSeconds: int
+    refused: int
+
+
+@router.get("/drain", response_model=DrainStatusResponse)
+async def get_drain_status(_: None = Depends(verify_api_key)):
+    """Get drain state and the number of sessions still live."""
+    from src.runtime.drain import drain_controller
+    return DrainStatusResponse(**drain_controller.get_stats())
+
+
+@router.post("/drain", response_model=DrainStatusResponse, status_code=202)
+async def start_drain(
+    request: Optional[DrainRequest] = None,
+    _: None = Depends(verify_api_key),
+):
+    """Stop taking new sessions and let live ones finish.
+
+    Readiness fails from now on; poll ``GET /api/admin/drain`` until the
+    state is ``drained`` (or ``expired``).
+    """
+    from src.runtime.drain import drain_controller
+    deadline_seconds = request.deadlineSeconds if request else None
+    drain_controller.start(reason="admin", deadline_seconds=deadline_seconds)
+    return DrainStatusResponse(**drain_controller.get_stats())
+
+
+@router.delete("/drain", response_model=DrainStatusResponse)
+async def cancel_drain(_: None = Depends(verify_api_key)):
+    """Leave drain mode and take new sessions again."""
+    from src.runtime.drain import drain_controller
+    drain_controller.resume()
+    return DrainStatusResponse(**drain_controller.get_stats())
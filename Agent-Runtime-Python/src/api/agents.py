@@ -1,12 +1,17 @@
 """Agent API endpoints."""
 
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Header
-from sqlalchemy.ext.asyncio import AsyncSession
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Header, Query, Response
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.db import get_db
+from src.api.sessions import SessionResponse
+from src.database.db import LazySession, get_lazy_db, get_read_db
+from src.database.operations import list_agent_sessions
 from src.config.config import get_config
+from src.runtime.session_record import SessionRecord
 
 router = APIRouter(prefix="/api/agents", tags=["agents"])
 
@@ -40,6 +45,47 @@ class AgentListResponse(BaseModel):
     agents: list[int]
 
 
+class TeardownProgressResponse(BaseModel):
+    """Progress of ending an unregistered agent's sessions."""
+    agentId: int
+    state: str
+    totalSessions: int
+    endedSessions: int
+    totalRooms: int
+    roomsReleased: int
+    startedAt: datetime
+    finishedAt: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class UnregisterAgentResponse(BaseModel):
+    """Response model for agent unregistration."""
+    success: bool
+    teardown: Optional[TeardownProgressResponse] = None
+
+
+class AgentSessionsResponse(BaseModel):
+    """Response model for a page of an agent's sessions."""
+    sessions: list[SessionResponse]
+    nextCursor: Optional[str] = None
+
+
+def _encode_cursor(started_at: datetime, row_id: int) -> str:
+    """Encode the keyset of the last row on a page as an opaque cursor."""
+    raw = f"{started_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        started_at, row_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(started_at), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 async def verify_api_key(
     authorization: Optional[str] = Header(None),
 ) -> None:
@@ -56,7 +102,7 @@ async def verify_api_key(
 @router.post("/register", response_model=RegisterAgentResponse)
 async def register_agent(
     request: RegisterAgentRequest,
-    db: AsyncSession = Depends(get_db),
+    db: LazySession = Depends(get_lazy_db),
     _: None = Depends(verify_api_key),
 ):
     """Register an agent with the runtime."""
@@ -70,25 +116,42 @@ async def register_agent(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.delete("/{agent_id}")
+@router.delete("/{agent_id}", response_model=UnregisterAgentResponse)
 async def unregister_agent(
     agent_id: int,
-    db: AsyncSession = Depends(get_db),
+    response: Response,
+    wait: bool = Query(True, description="Wait for the agent's sessions to be torn down"),
+    db: LazySession = Depends(get_lazy_db),
     _: None = Depends(verify_api_key),
 ):
-    """Unregister an agent from the runtime."""
+    """Unregister an agent from the runtime.
+    
+    With ``wait=false`` the agent's sessions are torn down in the background
+    and 202 is returned; poll ``GET /api/agents/{agent_id}/teardown``.
+    """
     try:
         from src.runtime.agent_runtime import agent_runtime
-        await agent_runtime.unregister_agent(agent_id)
-        return {"success": True}
+        progress = await agent_runtime.unregister_agent(agent_id, wait=wait)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    if progress and progress["state"] == "running":
+        response.status_code = 202
+    return UnregisterAgentResponse(success=True, teardown=progress)
+
+
+@router.get("/{agent_id}/teardown", response_model=TeardownProgressResponse)
+async def get_teardown_progress(agent_id: int):
+    """Get progress of an agent's latest unregister teardown."""
+    from src.runtime.agent_runtime import agent_runtime
+    progress = agent_runtime.get_teardown_progress(agent_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="No teardown for this agent")
+    return TeardownProgressResponse(**progress)
 
 
 @router.get("/{agent_id}", response_model=AgentStatusResponse)
 async def get_agent_status(
     agent_id: int,
-    db: AsyncSession = Depends(get_db),
 ):
     """Get the status of a specific agent."""
     try:
@@ -100,9 +163,7 @@ async def get_agent_status(
 
 
 @router.get("/", response_model=AgentListResponse)
-async def list_agents(
-    db: AsyncSession = Depends(get_db),
-):
+async def list_agents():
     """List all registered agents."""
     try:
         from src.runtime.agent_runtime import agent_runtime
@@ -111,3 +172,29 @@ async def list_agents(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+
+@router.get("/{agent_id}/sessions", response_model=AgentSessionsResponse)
+async def list_agent_sessions_endpoint(
+    agent_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    """List an agent's sessions, newest first, one page at a time."""
+    before = _decode_cursor(cursor) if cursor else None
+    try:
+        rows = await list_agent_sessions(db, agent_id, limit, before, status)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    next_cursor = None
+    if len(rows) == limit:
+        next_cursor = _encode_cursor(rows[-1].started_at, rows[-1].id)
+    return AgentSessionsResponse(
+        sessions=[
+            SessionResponse(**SessionRecord.from_model(row).to_dict())
+            for row in rows
+        ],
+        nextCursor=next_cursor,
+    )
@@ -35,6 +35,19 @@ async def health_check():
 @router.get("/ready", response_model=HealthResponse)
 async def readiness_check(db: AsyncSession = Depends(get_db)):
     """Readiness check endpoint (includes database connectivity check)."""
+    from src.runtime.drain import drain_controller
+    from src.runtime.warm_start import warm_start
+    if not warm_start.ready:
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "not ready", "reason": "warm start in progress"}
+        )
+    if drain_controller.draining:
+        raise HTTPException(
+            status_code=503,
+            detail={"status": "not ready", "reason": "draining"}
+        )
+    
     try:
         # Test database connection
         result = await db.execute(text("SELECT 1"))
@@ -1,12 +1,13 @@
 """Metrics API endpoints."""
 
-from typing import Optional
+from typing import Any, Optional, List, Dict
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from datetime import date
 
-from src.database.db import get_db
+from src.database.db import get_read_db, get_pool_stats, db_config
+from src.database.query_stats import query_stats
 from src.database.operations import (
     get_agent_metrics,
     get_tenant_metrics,
@@ -41,12 +42,179 @@ class SessionMetricsResponse(BaseModel):
     totalCost: float
 
 
+class TenantLiveStatusResponse(BaseModel):
+    """Response model for a tenant's live sessions on this instance."""
+    tenantId: int
+    liveSessions: int
+    byStatus: Dict[str, int]
+
+
+class ReaperMetricsResponse(BaseModel):
+    """Response model for stale-session reaper metrics."""
+    enabled: bool
+    reaped: Optional[int] = None
+    reapedConnecting: Optional[int] = None
+    runs: Optional[int] = None
+    failedRuns: Optional[int] = None
+    pending: Optional[int] = None
+
+
+class AgentCapacityStats(BaseModel):
+    """Session slot usage and join-queue metrics for one agent."""
+    agentId: int
+    activeSessions: int
+    reservedSlots: int
+    maxSessions: int
+    queueDepth: int
+    maxQueueSize: int
+    queued: int
+    rejected: int
+    timedOut: int
+    avgWaitMs: float
+    maxWaitMs: float
+
+
+class CapacityMetricsResponse(BaseModel):
+    """Response model for per-agent capacity metrics."""
+    agents: List[AgentCapacityStats]
+
+
+class TenantAdmissionStats(BaseModel):
+    """Admission queue and latency metrics for one tenant."""
+    tenantId: int
+    weight: float
+    queueDepth: int
+    inFlight: int
+    admitted: int
+    rejected: int
+    timedOut: int
+    avgAdmissionMs: float
+    maxAdmissionMs: float
+
+
+class AdmissionMetricsResponse(BaseModel):
+    """Response model for tenant admission scheduler metrics."""
+    concurrency: int
+    inFlight: int
+    queued: int
+    tenants: List[TenantAdmissionStats]
+
+
+class DispatchMetricsResponse(BaseModel):
+    """Response model for agent dispatch pipeline metrics."""
+    submitted: int
+    dispatched: int
+    retried: int
+    failed: int
+    shortCircuited: int
+    cancelled: int
+    queueDepth: int
+    pendingRetries: int
+    circuitState: str
+    circuitOpened: int
+
+
+class WarmStartMetricsResponse(BaseModel):
+    """Response model for startup warm-start results."""
+    state: str
+    agents: int
+    agentsFailed: int
+    sessions: int
+    sessionsOrphaned: int
+    durationMs: Optional[float] = None
+    error: Optional[str] = None
+
+
+class HeartbeatMetricsResponse(BaseModel):
+    """Response model for runtime instance heartbeat metrics."""
+    podName: str
+    intervalSeconds: float
+    beats: int
+    failures: int
+    markedDead: int
+    lastBeatAt: Optional[str] = None
+    lastError: Optional[str] = None
+    lastSample: Dict[str, Any]
+
+
+class PlacementMetricsResponse(BaseModel):
+    """Response model for cross-replica session placement metrics."""
+    podName: str
+    placedLocally: int
+    forwarded: int
+    forwardFailed: int
+    endsForwarded: int
+    refreshFailed: int
+    nodes: List[Dict[str, Any]]
+
+
+class SessionWriteMetricsResponse(BaseModel):
+    """Response model for session persistence metrics."""
+    writeBehind: Optional[Dict[str, int]] = None
+    coalescer: Optional[Dict[str, int]] = None
+
+
+class PoolMetricsResponse(BaseModel):
+    """Response model for database pool metrics."""
+    pooled: bool
+    size: Optional[int] = None
+    checkedIn: Optional[int] = None
+    checkedOut: Optional[int] = None
+    overflow: Optional[int] = None
+    maxOverflow: Optional[int] = None
+    connects: Optional[int] = None
+    checkouts: Optional[int] = None
+    checkins: Optional[int] = None
+    invalidations: Optional[int] = None
+    timeouts: Optional[int] = None
+    avgWaitMs: Optional[float] = None
+    maxWaitMs: Optional[float] = None
+
+
+class QueryStatementStats(BaseModel):
+    """Latency statistics for one statement fingerprint."""
+    fingerprint: str
+    count: int
+    totalMs: float
+    avgMs: float
+    maxMs: float
+    rows: int
+    poolWaitMs: float
+    errors: int
+    histogram: Dict[str, int]
+
+
+class QueryMetricsResponse(BaseModel):
+    """Response model for per-statement query metrics."""
+    enabled: bool
+    slowQueryMs: float
+    slowQueries: int
+    statements: List[QueryStatementStats]
+
+
+class SessionCacheMetricsResponse(BaseModel):
+    """Response model for session cache metrics."""
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    hitRate: float
+    size: int
+    pinned: int
+    maxSize: int
+    negativeHits: int
+    negativeSize: int
+    dbLoads: int
+    coalescedLoads: int
+    inflightLoads: int
+
+
 @router.get("/agent/{agent_id}", response_model=AgentMetricsResponse)
 async def get_agent_metrics_endpoint(
     agent_id: int,
     start_date: Optional[str] = Query(None, alias="startDate"),
     end_date: Optional[str] = Query(None, alias="endDate"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get metrics for a specific agent."""
     try:
@@ -66,7 +234,7 @@ async def get_tenant_metrics_endpoint(
     tenant_id: int,
     start_date: Optional[str] = Query(None, alias="startDate"),
     end_date: Optional[str] = Query(None, alias="endDate"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get metrics for a specific tenant."""
     try:
@@ -81,10 +249,17 @@ async def get_tenant_metrics_endpoint(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/tenant/{tenant_id}/live", response_model=TenantLiveStatusResponse)
+async def get_tenant_live_status_endpoint(tenant_id: int):
+    """Get a tenant's live session counts from memory (no database query)."""
+    from src.runtime.session_manager import session_manager
+    return TenantLiveStatusResponse(**session_manager.get_tenant_live_status(tenant_id))
+
+
 @router.get("/session/{session_id}", response_model=SessionMetricsResponse)
 async def get_session_metrics_endpoint(
     session_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """Get metrics for a specific session."""
     try:
@@ -98,3 +273,87 @@ async def get_session_metrics_endpoint(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/pool", response_model=PoolMetricsResponse)
+async def get_pool_metrics_endpoint():
+    """Get database connection pool metrics."""
+    return PoolMetricsResponse(**get_pool_stats())
+
+
+@router.get("/queries", response_model=QueryMetricsResponse)
+async def get_query_metrics_endpoint(limit: Optional[int] = Query(None, ge=1)):
+    """Get per-statement SQL latency metrics, slowest total first."""
+    return QueryMetricsResponse(
+        enabled=db_config.query_stats_enabled,
+        slowQueryMs=query_stats.slow_query_ms,
+        slowQueries=query_stats.slow_queries,
+        statements=query_stats.snapshot(limit),
+    )
+
+
+@router.get("/session-cache", response_model=SessionCacheMetricsResponse)
+async def get_session_cache_metrics_endpoint():
+    """Get in-memory session cache metrics."""
+    from src.runtime.session_manager import session_manager
+    return SessionCacheMetricsResponse(**session_manager.get_cache_stats())
+
+
+@router.get("/session-writes", response_model=SessionWriteMetricsResponse)
+async def get_session_write_metrics_endpoint():
+    """Get write-behind queue and status-update coalescing metrics."""
+    from src.runtime.session_manager import session_manager
+    return SessionWriteMetricsResponse(
+        writeBehind=session_manager.get_writer_stats(),
+        coalescer=session_manager.get_coalescer_stats(),
+    )
+
+
+@router.get("/reaper", response_model=ReaperMetricsResponse)
+async def get_reaper_metrics_endpoint():
+    """Get counts of sessions stuck connecting that the reaper ended."""
+    from src.runtime.session_manager import session_manager
+    stats = session_manager.get_reaper_stats()
+    if stats is None:
+        return ReaperMetricsResponse(enabled=False)
+    return ReaperMetricsResponse(enabled=True, **stats)
+
+
+@router.get("/warm-start", response_model=WarmStartMetricsResponse)
+async def get_warm_start_metrics_endpoint():
+    """Get what was reloaded from the database at startup."""
+    from src.runtime.warm_start import warm_start
+    return WarmStartMetricsResponse(**warm_start.get_stats())
+
+
+@router.get("/heartbeat", response_model=HeartbeatMetricsResponse)
+async def get_heartbeat_metrics_endpoint():
+    """Get heartbeat counters and the load figures last written."""
+    from src.runtime.heartbeat import heartbeat_writer
+    return HeartbeatMetricsResponse(**heartbeat_writer.get_stats())
+
+
+@router.get("/placement", response_model=PlacementMetricsResponse)
+async def get_placement_metrics_endpoint():
+    """Get local vs forwarded session counts and the replica loads last seen."""
+    from src.runtime.placement import session_placer
+    return PlacementMetricsResponse(**session_placer.get_stats())
+
+
+@router.get("/capacity", response_model=CapacityMetricsResponse)
+async def get_capacity_metrics_endpoint():
+    """Get per-agent session slots, join-queue depth and wait times."""
+    from src.runtime.agent_manager import agent_manager
+    return CapacityMetricsResponse(agents=agent_manager.get_capacity_stats())
+
+
+@router.get("/admission", response_model=AdmissionMetricsResponse)
+async def get_admission_metrics_endpoint():
+    """Get per-tenant session admission queues and latency."""
+    from src.runtime.admission import admission_scheduler
+    return AdmissionMetricsResponse(**admission_scheduler.get_stats())
+
+
+@router.get("/dispatch", response_model=DispatchMetricsResponse)
+async def get_dispatch_metrics_endpoint():
+    """Get agent dispatch retries, failures and circuit breaker state."""
+    from src.runtime.dispatch_pipeline import dispatch_pipeline
+    return DispatchMetricsResponse(**dispatch_pipeline.get_stats())
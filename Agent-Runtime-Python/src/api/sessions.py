@@ -1,17 +1,17 @@
 """Session API endpoints."""
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import BaseModel
 from datetime import datetime
 
-from src.database.db import get_db
+from src.database.db import LazySession, get_lazy_db
 from src.database.operations import (
     create_session,
     end_session as db_end_session,
     get_session_by_id,
 )
+from src.runtime.placement import FORWARD_SECRET_HEADER, FORWARDED_HEADER
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
@@ -56,22 +56,56 @@ class SessionResponse(BaseModel):
         }
 
 
+def _is_forwarded(forwarded_by: Optional[str], forward_secret: Optional[str]) -> bool:
+    """Whether another replica forwarded the request; rejects unauthenticated ones."""
+    if forwarded_by is None:
+        return False
+    from src.runtime.placement import session_placer
+    if not session_placer.is_trusted(forward_secret):
+        raise HTTPException(status_code=403, detail="Untrusted forwarded request")
+    return True
+
+
 @router.post("/create", response_model=CreateSessionResponse)
 async def create_session_endpoint(
     request: CreateSessionRequest,
-    db: AsyncSession = Depends(get_db),
+    db: LazySession = Depends(get_lazy_db),
+    forwarded_by: Optional[str] = Header(None, alias=FORWARDED_HEADER),
+    forward_secret: Optional[str] = Header(None, alias=FORWARD_SECRET_HEADER),
 ):
     """Create a new agent session."""
+    from src.runtime.admission import AdmissionRejectedError
+    from src.runtime.agent_instance import AgentAtCapacityError
+    from src.runtime.drain import DrainingError
+    from src.runtime.placement import PlacementForwardError
+    forwarded = _is_forwarded(forwarded_by, forward_secret)
     try:
         from src.runtime.agent_runtime import agent_runtime
         session = await agent_runtime.create_session(
-            request.agentId, request.tenantId, request.roomName, request.participantName
+            request.agentId,
+            request.tenantId,
+            request.roomName,
+            request.participantName,
+            forwarded=forwarded,
         )
         
         return CreateSessionResponse(
             success=True,
             session=SessionInfo(**session),
         )
+    except PlacementForwardError as e:
+        headers = {"Retry-After": e.retry_after} if e.retry_after else None
+        raise HTTPException(status_code=e.status, detail=e.detail, headers=headers)
+    except DrainingError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e),
+            headers={"Retry-After": str(e.retry_after_seconds)},
+        )
+    except AdmissionRejectedError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    except AgentAtCapacityError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -79,15 +113,24 @@ async def create_session_endpoint(
 @router.post("/{session_id}/end")
 async def end_session_endpoint(
     session_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: LazySession = Depends(get_lazy_db),
+    forwarded_by: Optional[str] = Header(None, alias=FORWARDED_HEADER),
+    forward_secret: Optional[str] = Header(None, alias=FORWARD_SECRET_HEADER),
 ):
     """End an active session."""
+    from src.runtime.placement import PlacementForwardError, PlacementUnavailableError
+    forwarded = _is_forwarded(forwarded_by, forward_secret)
     try:
         from src.runtime.agent_runtime import agent_runtime
-        await agent_runtime.end_session(session_id)
+        await agent_runtime.end_session(session_id, forwarded=forwarded)
         return {"success": True}
     except HTTPException:
         raise
+    except PlacementForwardError as e:
+        raise HTTPException(status_code=e.status, detail=e.detail)
+    except PlacementUnavailableError as e:
+        # The owning replica still holds the session; the caller should retry
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -95,7 +138,7 @@ async def end_session_endpoint(
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session(
     session_id: str,
-    db: AsyncSession = Depends(get_db),
+    db: LazySession = Depends(get_lazy_db),
 ):
     """Get session details."""
     try:
@@ -4,6 +4,7 @@ Matches the Node.js config structure exactly.
 """
 
 import os
+import socket
 from typing import Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
@@ -28,6 +29,185 @@ class RuntimeConfig(BaseSettings):
     api_key: Optional[str] = Field(default=None, description="API key for authentication")
     port: int = Field(default=8080, description="Server port", alias="PORT")
     host: str = Field(default="0.0.0.0", description="Server host")
+    session_write_behind: bool = Field(
+        default=False,
+        description="Persist session lifecycle writes from a background queue"
+    )
+    session_write_queue_size: int = Field(
+        default=10000,
+        description="Maximum pending session writes before callers wait"
+    )
+    session_write_batch_size: int = Field(
+        default=500,
+        description="Maximum session writes flushed per transaction"
+    )
+    session_cache_size: int = Field(
+        default=10000,
+        description="Maximum cached sessions loaded from the database (live sessions are not counted)"
+    )
+    session_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="Seconds a session loaded from the database stays cached"
+    )
+    session_negative_cache_ttl_seconds: float = Field(
+        default=5.0,
+        description="Seconds an unknown session ID is remembered as missing"
+    )
+    session_id_format: str = Field(
+        default="nanoid",
+        description="Session ID format: nanoid (random) or ulid (time-ordered)"
+    )
+    session_connecting_timeout_seconds: float = Field(
+        default=60.0,
+        description="End sessions still connecting after this long (0 disables)"
+    )
+    session_reaper_tick_seconds: float = Field(
+        default=1.0,
+        description="Resolution of the stale-session reaper"
+    )
+    session_update_coalesce_seconds: float = Field(
+        default=0.5,
+        description="Window for coalescing status and participant-count writes per session"
+    )
+    session_queue_size: int = Field(
+        default=0,
+        description="Joins per agent allowed to wait for a free session slot (0 rejects at capacity)"
+    )
+    session_queue_timeout_seconds: float = Field(
+        default=10.0,
+        description="How long a queued join waits for a slot before failing"
+    )
+    admission_concurrency: int = Field(
+        default=32,
+        description="Session creations admitted at once; beyond this tenants queue and are served by weight"
+    )
+    admission_queue_size: int = Field(
+        default=100,
+        description="Session creations a tenant may have waiting (resource_quota maxQueuedSessions overrides)"
+    )
+    admission_queue_timeout_seconds: float = Field(
+        default=30.0,
+        description="How long a session creation waits for admission before failing"
+    )
+    tenant_quota_ttl_seconds: float = Field(
+        default=60.0,
+        description="Seconds a tenant's resource_quota is cached"
+    )
+    livekit_api_connection_limit: int = Field(
+        default=100,
+        description="Open connections kept per LiveKit server API client"
+    )
+    livekit_api_timeout_seconds: float = Field(
+        default=10.0,
+        description="Timeout for LiveKit server API calls (e.g. agent dispatch)"
+    )
+    dispatch_workers: int = Field(
+        default=8,
+        description="Background tasks sending agent dispatches to LiveKit"
+    )
+    dispatch_queue_size: int = Field(
+        default=10000,
+        description="Pending dispatches before session creation waits"
+    )
+    dispatch_max_attempts: int = Field(
+        default=5,
+        description="Dispatch attempts before a session is marked failed"
+    )
+    dispatch_retry_base_seconds: float = Field(
+        default=0.5,
+        description="Base delay for exponential dispatch retry backoff (with jitter)"
+    )
+    dispatch_retry_max_seconds: float = Field(
+        default=30.0,
+        description="Maximum delay between dispatch retries"
+    )
+    dispatch_breaker_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive dispatch failures that open the circuit breaker"
+    )
+    dispatch_breaker_reset_seconds: float = Field(
+        default=30.0,
+        description="Seconds the dispatch circuit stays open before a trial call"
+    )
+    teardown_concurrency: int = Field(
+        default=16,
+        description="Rooms released in parallel when an agent is unregistered"
+    )
+    heartbeat: bool = Field(
+        default=True,
+        description="Write this pod's load and liveness to agent_runtime_instances"
+    )
+    heartbeat_interval_seconds: float = Field(
+        default=5.0,
+        description="Seconds between runtime instance heartbeats"
+    )
+    heartbeat_stale_seconds: float = Field(
+        default=30.0,
+        description="Instances without a heartbeat for this long are marked dead"
+    )
+    drain_deadline_seconds: float = Field(
+        default=25.0,
+        description="Seconds a drain waits for active sessions before shutdown continues"
+    )
+    drain_retry_after_seconds: int = Field(
+        default=5,
+        description="Retry-After sent with session requests refused while draining"
+    )
+    drain_on_sigterm: bool = Field(
+        default=True,
+        description="Drain before shutting down on SIGTERM"
+    )
+    pod_name: str = Field(
+        default_factory=socket.gethostname,
+        alias="POD_NAME",
+        description="Name this runtime instance is registered under (defaults to the hostname)"
+    )
+    pod_namespace: str = Field(
+        default="livekit",
+        alias="POD_NAMESPACE",
+        description="Kubernetes namespace recorded for this runtime instance"
+    )
+    pod_ip: Optional[str] = Field(
+        default=None,
+        alias="POD_IP",
+        description="Address other replicas use to reach this pod (defaults to the pod name)"
+    )
+    advertise_url: Optional[str] = Field(
+        default=None,
+        description="Base URL other replicas forward sessions to (overrides POD_IP)"
+    )
+    placement: bool = Field(
+        default=False,
+        description="Forward session creation to the least-loaded eligible replica"
+    )
+    placement_preferred_pods: int = Field(
+        default=3,
+        description="Replicas each agent is consistently hashed to"
+    )
+    placement_refresh_seconds: float = Field(
+        default=2.0,
+        description="Seconds replica load read from heartbeats is cached"
+    )
+    placement_local_slack: float = Field(
+        default=0.1,
+        description="Utilization margin within which a preferred local pod keeps the session"
+    )
+    placement_forward_timeout_seconds: float = Field(
+        default=5.0,
+        description="Timeout for forwarding a session creation to another replica"
+    )
+    placement_secret: Optional[str] = Field(
+        default=None,
+        description="Secret shared by replicas to authenticate forwarded requests"
+    )
+    warm_start: bool = Field(
+        default=True,
+        description="Reload deployed agents and this instance's live sessions at startup"
+    )
+    warm_start_concurrency: int = Field(
+        default=16,
+        description="Agent instances initialized in parallel during warm start"
+    )
 
 
 class DatabaseConfig(BaseSettings):
@@ -39,6 +219,56 @@ class DatabaseConfig(BaseSettings):
         alias="DATABASE_URL",
         description="PostgreSQL database URL"
     )
+    database_read_url: Optional[str] = Field(
+        default=None,
+        alias="DATABASE_READ_URL",
+        description="Optional read-replica URL for read-only queries"
+    )
+    read_your_writes_seconds: float = Field(
+        default=10.0,
+        alias="DATABASE_READ_YOUR_WRITES_SECONDS",
+        description="How long reads of sessions written by this process stay on the primary"
+    )
+    pool_size: int = Field(
+        default=10,
+        alias="DB_POOL_SIZE",
+        description="Persistent connections kept in the pool (0 disables pooling)"
+    )
+    max_overflow: int = Field(
+        default=20,
+        alias="DB_MAX_OVERFLOW",
+        description="Extra connections allowed above pool_size under load"
+    )
+    pool_timeout: float = Field(
+        default=30.0,
+        alias="DB_POOL_TIMEOUT",
+        description="Seconds to wait for a free pooled connection"
+    )
+    pool_recycle: int = Field(
+        default=1800,
+        alias="DB_POOL_RECYCLE",
+        description="Seconds after which a pooled connection is replaced"
+    )
+    pool_pre_ping: bool = Field(
+        default=True,
+        alias="DB_POOL_PRE_PING",
+        description="Test pooled connections for liveness on checkout"
+    )
+    pool_warm_size: int = Field(
+        default=5,
+        alias="DB_POOL_WARM_SIZE",
+        description="Connections opened at startup (capped at pool_size)"
+    )
+    query_stats_enabled: bool = Field(
+        default=False,
+        alias="DB_QUERY_STATS",
+        description="Record per-statement latency statistics"
+    )
+    slow_query_ms: float = Field(
+        default=250.0,
+        alias="DB_SLOW_QUERY_MS",
+        description="Log statements slower than this many milliseconds"
+    )
 
 
 class LangFuseConfig(BaseSettings):
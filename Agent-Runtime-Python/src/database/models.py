@@ -2,22 +2,28 @@
 
 These models are read-only compatible with Drizzle-managed tables.
 All column names, types, and constraints must match exactly.
+
+Secondary indexes declared in ``__table_args__`` are owned by Agent-Runtime
+and created by the Alembic revisions in ``alembic/versions``.
 """
 
 from datetime import datetime
 from typing import Optional
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     Date,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
     String,
     Text,
     DateTime,
     func,
+    text,
 )
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import relationship
@@ -213,6 +219,10 @@ class AgentRuntimeInstance(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
 
+# Session statuses after which a session never changes again
+TERMINAL_SESSION_STATUSES = ("ended", "failed")
+
+
 class AgentInstanceSession(Base):
     """Agent instance sessions table - primary table for Agent-Runtime.
 
@@ -220,6 +230,21 @@ class AgentInstanceSession(Base):
     from Agent-Builder.
     """
     __tablename__ = "agent_instance_sessions"
+    __table_args__ = (
+        # Active-session counts per agent (get_agent_metrics)
+        Index(
+            "ix_agent_instance_sessions_active_agent_id",
+            "agent_id",
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Keyset pagination of an agent's sessions (list_agent_sessions)
+        Index(
+            "ix_agent_instance_sessions_agent_id_started_at",
+            "agent_id",
+            "started_at",
+            "id",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     agent_id = Column(Integer, nullable=False)  # Reference to agents.id (Agent-Builder)
@@ -244,6 +269,17 @@ class AgentInstanceSession(Base):
 class SessionMetric(Base):
     """Session metrics table from Agent-Dashboard schema."""
     __tablename__ = "session_metrics"
+    __table_args__ = (
+        # Per-agent aggregates over a date range (get_agent_metrics)
+        Index(
+            "ix_session_metrics_agent_id_date",
+            "agent_id",
+            "date",
+            postgresql_include=["avg_llm_latency", "total_cost"],
+        ),
+        # Lookup by session (get_session_metrics)
+        Index("ix_session_metrics_session_id", "session_id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     session_id = Column(String(255), ForeignKey("agent_instance_sessions.session_id"), nullable=False)
@@ -286,6 +322,15 @@ class AgentMetric(Base):
 class TenantMetric(Base):
     """Tenant metrics table from Agent-Dashboard schema."""
     __tablename__ = "tenant_metrics"
+    __table_args__ = (
+        # Per-tenant aggregates over a date range (get_tenant_metrics)
+        Index(
+            "ix_tenant_metrics_tenant_id_date",
+            "tenant_id",
+            "date",
+            postgresql_include=["active_agents", "total_sessions", "total_cost"],
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     tenant_id = Column(Integer, nullable=False)
@@ -301,6 +346,25 @@ class TenantMetric(Base):
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
 
 
+class AgentDailyMetric(Base):
+    """Per-agent, per-day rollup of session metrics.
+
+    Owned by Agent-Runtime (created by Alembic, not Drizzle). Rows are
+    incremented as sessions end so agent metrics read one row per day
+    instead of one row per session.
+    """
+    __tablename__ = "agent_daily_metrics"
+
+    agent_id = Column(Integer, primary_key=True)
+    date = Column(Date, primary_key=True)
+    tenant_id = Column(Integer, nullable=False)
+    session_count = Column(Integer, default=0, nullable=False)
+    latency_sum = Column(BigInteger, default=0, nullable=False)
+    latency_count = Column(Integer, default=0, nullable=False)
+    total_cost = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
+
+
 class LangfuseTrace(Base):
     """LangFuse traces table from Agent-Dashboard schema."""
     __tablename__ = "langfuse_traces"
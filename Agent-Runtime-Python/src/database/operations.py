@@ -3,15 +3,38 @@
 All operations use async SQLAlchemy and are compatible with Drizzle-managed tables.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator, Iterable, Tuple
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import (
+    select,
+    insert,
+    update,
+    bindparam,
+    func,
+    and_,
+    or_,
+    cast,
+    literal,
+    literal_column,
+    tuple_,
+    text,
+    String,
+    Integer,
+    Numeric,
+    DateTime,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 from src.database.models import (
     Agent,
+    AgentDailyMetric,
     AgentInstanceSession,
+    AgentRuntimeInstance,
+    DeploymentStatusEnum,
+    Setting,
+    TERMINAL_SESSION_STATUSES,
     SessionMetric,
     AgentMetric,
     TenantMetric,
@@ -27,6 +50,177 @@ async def get_agent_by_id(session: AsyncSession, agent_id: int) -> Optional[Agen
     return result.scalar_one_or_none()
 
 
+# Rows fetched per round trip when streaming large result sets
+STREAM_BATCH_SIZE = 500
+
+
+async def stream_deployed_agents(
+    session: AsyncSession,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> AsyncIterator[Agent]:
+    """Stream every deployed agent with a server-side cursor."""
+    result = await session.stream_scalars(
+        select(Agent)
+        .where(Agent.deployment_status == DeploymentStatusEnum.DEPLOYED)
+        .order_by(Agent.id)
+        .execution_options(yield_per=batch_size)
+    )
+    async for agent in result:
+        yield agent
+
+
+async def get_settings(
+    session: AsyncSession,
+    keys: Iterable[str],
+) -> Dict[str, Optional[str]]:
+    """Get Agent-Builder settings by key (missing keys are omitted)."""
+    result = await session.execute(
+        select(Setting.key, Setting.value).where(Setting.key.in_(list(keys)))
+    )
+    return {key: value for key, value in result.all()}
+
+
+async def get_tenant_resource_quota(
+    session: AsyncSession,
+    tenant_id: int,
+) -> Optional[str]:
+    """Get a tenant's raw resource_quota JSON (None if unset or unknown)."""
+    result = await session.execute(
+        select(Tenant.resource_quota).where(Tenant.id == tenant_id)
+    )
+    return result.scalar_one_or_none()
+
+
+async def register_runtime_instance(
+    session: AsyncSession,
+    pod_name: str,
+    namespace: Optional[str] = None,
+    status: str = "running",
+) -> int:
+    """Insert or refresh this runtime's row in agent_runtime_instances.
+
+    The row is keyed by pod name, so a restarted pod keeps its ID and can
+    find the sessions it owned. Returns the row ID.
+    """
+    now = datetime.utcnow()
+    statement = pg_insert(AgentRuntimeInstance).values(
+        pod_name=pod_name,
+        namespace=namespace,
+        status=status,
+        started_at=now,
+        last_heartbeat=now,
+        created_at=now,
+        updated_at=now,
+    )
+    result = await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[AgentRuntimeInstance.pod_name],
+            set_={
+                "namespace": statement.excluded.namespace,
+                "status": statement.excluded.status,
+                "started_at": statement.excluded.started_at,
+                "last_heartbeat": statement.excluded.last_heartbeat,
+                "updated_at": statement.excluded.updated_at,
+            },
+        ).returning(AgentRuntimeInstance.id)
+    )
+    return result.scalar_one()
+
+
+async def record_runtime_heartbeat(
+    session: AsyncSession,
+    pod_name: str,
+    namespace: Optional[str] = None,
+    status: str = "running",
+    cpu_usage: Optional[int] = None,
+    memory_usage: Optional[int] = None,
+    active_agent_count: int = 0,
+    sessions_handled_delta: int = 0,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> int:
+    """Upsert this runtime's heartbeat and load figures. Returns the row ID.
+
+    ``started_at`` is only set when the row is first inserted.
+    ``sessions_handled_delta`` is added to ``total_sessions_handled``, so
+    the total survives restarts of the pod.
+    """
+    table = AgentRuntimeInstance.__table__
+    now = datetime.utcnow()
+    statement = pg_insert(table).values(
+        pod_name=pod_name,
+        namespace=namespace,
+        status=status,
+        started_at=now,
+        last_heartbeat=now,
+        cpu_usage=cpu_usage,
+        memory_usage=memory_usage,
+        active_agent_count=active_agent_count,
+        total_sessions_handled=sessions_handled_delta,
+        metadata=metadata,
+        created_at=now,
+        updated_at=now,
+    )
+    result = await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[table.c.pod_name],
+            set_={
+                **{
+                    column: statement.excluded[column]
+                    for column in (
+                        "namespace",
+                        "status",
+                        "last_heartbeat",
+                        "cpu_usage",
+                        "memory_usage",
+                        "active_agent_count",
+                        "metadata",
+                        "updated_at",
+                    )
+                },
+                "total_sessions_handled": (
+                    func.coalesce(table.c.total_sessions_handled, 0)
+                    + statement.excluded.total_sessions_handled
+                ),
+            },
+        ).returning(table.c.id)
+    )
+    return result.scalar_one()
+
+
+async def mark_stale_runtime_instances(
+    session: AsyncSession,
+    stale_before: datetime,
+) -> List[str]:
+    """Mark instances whose last heartbeat is older than ``stale_before`` dead.
+
+    Returns the pod names that were marked.
+    """
+    result = await session.execute(
+        update(AgentRuntimeInstance)
+        .where(
+            AgentRuntimeInstance.last_heartbeat < stale_before,
+            AgentRuntimeInstance.status.notin_(("dead", "stopped")),
+        )
+        .values(status="dead", updated_at=datetime.utcnow())
+        .returning(AgentRuntimeInstance.pod_name)
+    )
+    return list(result.scalars().all())
+
+
+async def list_live_runtime_instances(
+    session: AsyncSession,
+    heartbeat_after: datetime,
+) -> List[AgentRuntimeInstance]:
+    """List running instances that have sent a heartbeat since ``heartbeat_after``."""
+    result = await session.execute(
+        select(AgentRuntimeInstance).where(
+            AgentRuntimeInstance.status == "running",
+            AgentRuntimeInstance.last_heartbeat >= heartbeat_after,
+        )
+    )
+    return list(result.scalars().all())
+
+
 async def create_session(
     session: AsyncSession,
     agent_id: int,
@@ -53,6 +247,90 @@ async def create_session(
     return new_session
 
 
+async def create_sessions(
+    session: AsyncSession,
+    rows: List[Dict[str, Any]],
+) -> None:
+    """Insert many agent instance sessions with one multi-row INSERT.
+
+    Each row is keyed by AgentInstanceSession attribute names.
+    """
+    if not rows:
+        return
+    await session.execute(insert(AgentInstanceSession), rows)
+
+
+async def update_sessions(
+    session: AsyncSession,
+    updates: List[Dict[str, Any]],
+) -> None:
+    """Apply many per-session column updates keyed by session_id.
+
+    Updates that set the same columns are sent as one executemany UPDATE.
+    Sessions that have already ended or failed are left alone; end them
+    with ``end_sessions_at`` instead.
+    """
+    table = AgentInstanceSession.__table__
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for values in updates:
+        columns = tuple(sorted(k for k in values if k != "session_id"))
+        if columns:
+            groups.setdefault(columns, []).append(values)
+
+    for columns, group in groups.items():
+        statement = (
+            update(table)
+            .where(table.c.session_id == bindparam("match_session_id"))
+            .where(table.c.status.notin_(TERMINAL_SESSION_STATUSES))
+            .values({column: bindparam(f"new_{column}") for column in columns})
+        )
+        params = [
+            {
+                "match_session_id": values["session_id"],
+                **{f"new_{column}": values[column] for column in columns},
+            }
+            for values in group
+        ]
+        await session.execute(statement, params)
+
+
+_UPDATE_SESSION_STATES = text("""
+    UPDATE agent_instance_sessions AS s
+    SET status = v.status, participant_count = v.participant_count, updated_at = now()
+    FROM unnest(:session_ids, :statuses, :participant_counts)
+        AS v(session_id, status, participant_count)
+    WHERE s.session_id = v.session_id AND s.status NOT IN ('ended', 'failed')
+""").bindparams(
+    bindparam("session_ids", type_=ARRAY(String)),
+    bindparam("statuses", type_=ARRAY(String)),
+    bindparam("participant_counts", type_=ARRAY(Integer)),
+)
+
+
+async def update_session_states(
+    session: AsyncSession,
+    states: List[Dict[str, Any]],
+) -> int:
+    """Write status and participant_count for many live sessions in one UPDATE.
+
+    Each state has session_id, status and participant_count. Sessions that
+    have already ended or failed are left alone, so a late write never
+    reopens one.
+    Returns the number of rows updated.
+    """
+    if not states:
+        return 0
+    result = await session.execute(
+        _UPDATE_SESSION_STATES,
+        {
+            "session_ids": [state["session_id"] for state in states],
+            "statuses": [state["status"] for state in states],
+            "participant_counts": [state["participant_count"] for state in states],
+        },
+    )
+    return result.rowcount
+
+
 async def update_session_status(
     session: AsyncSession,
     session_id: str,
@@ -61,48 +339,125 @@ async def update_session_status(
     duration_seconds: Optional[int] = None,
     participant_count: Optional[int] = None,
 ) -> Optional[AgentInstanceSession]:
-    """Update session status."""
+    """Update session status in a single UPDATE ... RETURNING round trip.
+
+    Returns None if the session has already ended or failed.
+    """
+    values: Dict[str, Any] = {"status": status}
+    if ended_at:
+        values["ended_at"] = ended_at
+    if duration_seconds is not None:
+        values["duration_seconds"] = duration_seconds
+    if participant_count is not None:
+        values["participant_count"] = participant_count
+
     result = await session.execute(
-        select(AgentInstanceSession).where(
-            AgentInstanceSession.session_id == session_id
+        update(AgentInstanceSession)
+        .where(AgentInstanceSession.session_id == session_id)
+        .where(AgentInstanceSession.status.notin_(TERMINAL_SESSION_STATUSES))
+        .values(**values)
+        .returning(AgentInstanceSession)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+def _end_sessions_statement(ended_at: datetime):
+    """Build an UPDATE that ends sessions and computes duration from started_at in SQL.
+
+    Sessions that are already ended (or failed) are left untouched and not
+    returned.
+    """
+    ended_at_param = literal(ended_at, DateTime)
+    return (
+        update(AgentInstanceSession)
+        .where(AgentInstanceSession.status.notin_(TERMINAL_SESSION_STATUSES))
+        .values(
+            status="ended",
+            ended_at=ended_at_param,
+            duration_seconds=cast(
+                func.floor(
+                    func.extract("epoch", ended_at_param - AgentInstanceSession.started_at)
+                ),
+                Integer,
+            ),
         )
+        .returning(AgentInstanceSession)
+        .execution_options(populate_existing=True)
     )
-    agent_session = result.scalar_one_or_none()
-    
-    if agent_session:
-        agent_session.status = status
-        if ended_at:
-            agent_session.ended_at = ended_at
-        if duration_seconds is not None:
-            agent_session.duration_seconds = duration_seconds
-        if participant_count is not None:
-            agent_session.participant_count = participant_count
-        await session.flush()
-    
-    return agent_session
 
 
 async def end_session(
     session: AsyncSession,
     session_id: str,
 ) -> Optional[AgentInstanceSession]:
-    """End a session."""
+    """End a session in a single UPDATE ... RETURNING round trip."""
     result = await session.execute(
-        select(AgentInstanceSession).where(
+        _end_sessions_statement(datetime.utcnow()).where(
             AgentInstanceSession.session_id == session_id
         )
     )
-    agent_session = result.scalar_one_or_none()
-    
-    if agent_session:
-        agent_session.status = "ended"
-        agent_session.ended_at = datetime.utcnow()
-        if agent_session.started_at:
-            duration = (agent_session.ended_at - agent_session.started_at).total_seconds()
-            agent_session.duration_seconds = int(duration)
-        await session.flush()
-    
-    return agent_session
+    return result.scalar_one_or_none()
+
+
+async def end_sessions(
+    session: AsyncSession,
+    session_ids: List[str],
+) -> List[AgentInstanceSession]:
+    """End many sessions with one UPDATE ... RETURNING statement."""
+    if not session_ids:
+        return []
+
+    result = await session.execute(
+        _end_sessions_statement(datetime.utcnow()).where(
+            AgentInstanceSession.session_id.in_(session_ids)
+        )
+    )
+    return list(result.scalars().all())
+
+
+_END_SESSIONS_AT = text("""
+    UPDATE agent_instance_sessions AS s
+    SET status = v.status,
+        ended_at = v.ended_at,
+        duration_seconds = floor(extract(epoch FROM v.ended_at - s.started_at))::integer,
+        participant_count = coalesce(v.participant_count, s.participant_count),
+        updated_at = now()
+    FROM unnest(:session_ids, :statuses, :ended_ats, :participant_counts)
+        AS v(session_id, status, ended_at, participant_count)
+    WHERE s.session_id = v.session_id AND s.status NOT IN ('ended', 'failed')
+    RETURNING s.session_id
+""").bindparams(
+    bindparam("session_ids", type_=ARRAY(String)),
+    bindparam("statuses", type_=ARRAY(String)),
+    bindparam("ended_ats", type_=ARRAY(DateTime)),
+    bindparam("participant_counts", type_=ARRAY(Integer)),
+)
+
+
+async def end_sessions_at(
+    session: AsyncSession,
+    ends: List[Dict[str, Any]],
+) -> List[str]:
+    """End many sessions, each with its own final status and end time, in one UPDATE.
+
+    Each end has session_id, status ("ended" or "failed"), ended_at and
+    optionally participant_count. Like ``end_sessions``, sessions that are
+    already ended or failed are left alone.
+    Returns the IDs of the sessions this call ended.
+    """
+    if not ends:
+        return []
+    result = await session.execute(
+        _END_SESSIONS_AT,
+        {
+            "session_ids": [end["session_id"] for end in ends],
+            "statuses": [end["status"] for end in ends],
+            "ended_ats": [end["ended_at"] for end in ends],
+            "participant_counts": [end.get("participant_count") for end in ends],
+        },
+    )
+    return list(result.scalars().all())
 
 
 async def get_session_by_id(
@@ -118,33 +473,136 @@ async def get_session_by_id(
     return result.scalar_one_or_none()
 
 
+async def get_session_owner_pod(
+    session: AsyncSession,
+    session_id: str,
+) -> Optional[str]:
+    """Get the pod name of the runtime instance that owns a live session.
+
+    Returns None if the session is unknown, has ended or failed, or was
+    created before its runtime instance registered.
+    """
+    result = await session.execute(
+        select(AgentRuntimeInstance.pod_name)
+        .join(
+            AgentInstanceSession,
+            AgentInstanceSession.runtime_instance_id == AgentRuntimeInstance.id,
+        )
+        .where(
+            AgentInstanceSession.session_id == session_id,
+            AgentInstanceSession.status.notin_(TERMINAL_SESSION_STATUSES),
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def stream_live_sessions(
+    session: AsyncSession,
+    runtime_instance_id: int,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> AsyncIterator[AgentInstanceSession]:
+    """Stream a runtime instance's sessions that have not ended or failed."""
+    result = await session.stream_scalars(
+        select(AgentInstanceSession)
+        .where(
+            AgentInstanceSession.runtime_instance_id == runtime_instance_id,
+            AgentInstanceSession.status.notin_(TERMINAL_SESSION_STATUSES),
+        )
+        .execution_options(yield_per=batch_size)
+    )
+    async for db_session in result:
+        yield db_session
+
+
+# Upper bound on IDs per IN (...) list when bulk-loading sessions
+SESSION_ID_CHUNK_SIZE = 1000
+
+
+async def get_sessions_by_ids(
+    session: AsyncSession,
+    session_ids: Iterable[str],
+    chunk_size: int = SESSION_ID_CHUNK_SIZE,
+) -> List[AgentInstanceSession]:
+    """Get sessions by session_id with one IN query per chunk of IDs."""
+    session_ids = list(session_ids)
+    sessions: List[AgentInstanceSession] = []
+    for start in range(0, len(session_ids), chunk_size):
+        result = await session.execute(
+            select(AgentInstanceSession).where(
+                AgentInstanceSession.session_id.in_(
+                    session_ids[start:start + chunk_size]
+                )
+            )
+        )
+        sessions.extend(result.scalars().all())
+    return sessions
+
+
+async def list_agent_sessions(
+    session: AsyncSession,
+    agent_id: int,
+    limit: int = 50,
+    before: Optional[Tuple[datetime, int]] = None,
+    status: Optional[str] = None,
+) -> List[AgentInstanceSession]:
+    """List an agent's sessions, newest first.
+
+    Pages with a keyset: ``before`` is the (started_at, id) of the last row
+    of the previous page.
+    """
+    query = select(AgentInstanceSession).where(
+        AgentInstanceSession.agent_id == agent_id
+    )
+    if status:
+        query = query.where(AgentInstanceSession.status == status)
+    if before:
+        query = query.where(
+            tuple_(AgentInstanceSession.started_at, AgentInstanceSession.id)
+            < tuple_(literal(before[0], DateTime), literal(before[1], Integer))
+        )
+    result = await session.execute(
+        query.order_by(
+            AgentInstanceSession.started_at.desc(),
+            AgentInstanceSession.id.desc(),
+        ).limit(limit)
+    )
+    return list(result.scalars().all())
+
+
 async def get_agent_metrics(
     session: AsyncSession,
     agent_id: int,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
 ) -> Dict[str, Any]:
-    """Get metrics for a specific agent."""
-    # Query session metrics
+    """Get metrics for a specific agent.
+
+    Totals come from the agent_daily_metrics rollup, so cost grows with the
+    number of days in range rather than the number of sessions.
+    """
     query = select(
-        func.count(SessionMetric.id).label("total_sessions"),
-        func.avg(SessionMetric.avg_llm_latency).label("avg_latency"),
-        func.sum(SessionMetric.total_cost).label("total_cost"),
-    ).where(SessionMetric.agent_id == agent_id)
+        func.sum(AgentDailyMetric.session_count).label("total_sessions"),
+        (
+            cast(func.sum(AgentDailyMetric.latency_sum), Numeric)
+            / func.nullif(func.sum(AgentDailyMetric.latency_count), 0)
+        ).label("avg_latency"),
+        func.sum(AgentDailyMetric.total_cost).label("total_cost"),
+    ).where(AgentDailyMetric.agent_id == agent_id)
     
     if start_date:
-        query = query.where(SessionMetric.date >= start_date)
+        query = query.where(AgentDailyMetric.date >= start_date)
     if end_date:
-        query = query.where(SessionMetric.date <= end_date)
+        query = query.where(AgentDailyMetric.date <= end_date)
     
     result = await session.execute(query)
     row = result.first()
     
-    # Count active sessions
+    # Count active sessions. The status is rendered inline so the planner can
+    # match the partial index on active sessions even with prepared statements.
     active_sessions_query = select(func.count(AgentInstanceSession.id)).where(
         and_(
             AgentInstanceSession.agent_id == agent_id,
-            AgentInstanceSession.status == "active"
+            AgentInstanceSession.status == literal_column("'active'")
         )
     )
     active_result = await session.execute(active_sessions_query)
@@ -159,6 +617,94 @@ async def get_agent_metrics(
     }
 
 
+def _session_metrics_rollup_select():
+    """Aggregate session_metrics rows into agent_daily_metrics columns."""
+    return select(
+        SessionMetric.agent_id,
+        SessionMetric.date,
+        func.max(SessionMetric.tenant_id),
+        func.count(SessionMetric.id),
+        func.coalesce(func.sum(SessionMetric.avg_llm_latency), 0),
+        func.count(SessionMetric.avg_llm_latency),
+        func.coalesce(func.sum(SessionMetric.total_cost), 0),
+    ).group_by(SessionMetric.agent_id, SessionMetric.date)
+
+
+_ROLLUP_COLUMNS = [
+    "agent_id",
+    "date",
+    "tenant_id",
+    "session_count",
+    "latency_sum",
+    "latency_count",
+    "total_cost",
+]
+
+
+async def rollup_session_metrics(
+    session: AsyncSession,
+    session_ids: List[str],
+) -> None:
+    """Add the metrics of newly ended or failed sessions to agent_daily_metrics.
+
+    Pass only the IDs an ``end_session``/``end_sessions``/``end_sessions_at``
+    call returned, in the same transaction, so each session is added once.
+    session_metrics rows written after their session ended are not added;
+    ``backfill_agent_daily_metrics`` rebuilds the totals including them.
+    """
+    if not session_ids:
+        return
+
+    statement = pg_insert(AgentDailyMetric).from_select(
+        _ROLLUP_COLUMNS,
+        _session_metrics_rollup_select().where(SessionMetric.session_id.in_(session_ids)),
+    )
+    excluded = statement.excluded
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[AgentDailyMetric.agent_id, AgentDailyMetric.date],
+            set_={
+                "session_count": AgentDailyMetric.session_count + excluded.session_count,
+                "latency_sum": AgentDailyMetric.latency_sum + excluded.latency_sum,
+                "latency_count": AgentDailyMetric.latency_count + excluded.latency_count,
+                "total_cost": AgentDailyMetric.total_cost + excluded.total_cost,
+                "updated_at": func.now(),
+            },
+        )
+    )
+
+
+async def backfill_agent_daily_metrics(
+    session: AsyncSession,
+    agent_id: Optional[int] = None,
+) -> int:
+    """Rebuild agent_daily_metrics from session_metrics.
+
+    Existing rollup rows are overwritten, so this is safe to re-run.
+    Returns the number of rollup rows written.
+    """
+    aggregated = _session_metrics_rollup_select()
+    if agent_id is not None:
+        aggregated = aggregated.where(SessionMetric.agent_id == agent_id)
+
+    statement = pg_insert(AgentDailyMetric).from_select(_ROLLUP_COLUMNS, aggregated)
+    excluded = statement.excluded
+    result = await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[AgentDailyMetric.agent_id, AgentDailyMetric.date],
+            set_={
+                "tenant_id": excluded.tenant_id,
+                "session_count": excluded.session_count,
+                "latency_sum": excluded.latency_sum,
+                "latency_count": excluded.latency_count,
+                "total_cost": excluded.total_cost,
+                "updated_at": func.now(),
+            },
+        )
+    )
+    return result.rowcount
+
+
 async def get_tenant_metrics(
     session: AsyncSession,
     tenant_id: int,
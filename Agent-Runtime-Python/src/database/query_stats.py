@@ -0,0 +1,190 @@
+"""Per-statement SQL latency instrumentation using SQLAlchemy engine events."""
+
+import logging
+import re
+import time
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+# Statements beyond this many distinct fingerprints are counted under OTHER
+MAX_FINGERPRINTS = 500
+OTHER_FINGERPRINT = "<other>"
+
+_WHITESPACE = re.compile(r"\s+")
+_PARAM_LIST = re.compile(r"\(\s*(?:\$\d+|%\(\w+\)s|\?)(?:\s*,\s*(?:\$\d+|%\(\w+\)s|\?))+\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+
+
+def fingerprint(statement: str) -> str:
+    """Normalize a SQL statement so executions of the same query group together.
+
+    Collapses whitespace, replaces literals with ``?`` and expanded IN-lists
+    with ``(...)``.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING.sub("?", normalized)
+    normalized = _PARAM_LIST.sub("(...)", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    return normalized
+
+
+def parameter_shape(parameters: Any) -> Any:
+    """Describe bound parameters by type only, never by value."""
+    if parameters is None:
+        return None
+    if isinstance(parameters, dict):
+        return {key: _type_name(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (list, tuple, dict)):
+            return {"executemany": len(parameters), "first": parameter_shape(parameters[0])}
+        return [_type_name(value) for value in parameters]
+    return _type_name(parameters)
+
+
+def _type_name(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+class _StatementStats:
+    __slots__ = ("count", "total_ms", "max_ms", "rows", "pool_wait_ms", "errors", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.pool_wait_ms = 0.0
+        self.errors = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+
+class QueryStats:
+    """In-memory latency histograms keyed by statement fingerprint."""
+
+    def __init__(self, slow_query_ms: float = 250.0):
+        self.slow_query_ms = slow_query_ms
+        self._statements: Dict[str, _StatementStats] = {}
+        self.slow_queries = 0
+
+    def reset(self) -> None:
+        """Clear all recorded statistics."""
+        self._statements.clear()
+        self.slow_queries = 0
+
+    def _stats_for(self, key: str) -> _StatementStats:
+        stats = self._statements.get(key)
+        if stats is None:
+            if len(self._statements) >= MAX_FINGERPRINTS:
+                key = OTHER_FINGERPRINT
+                stats = self._statements.get(key)
+            if stats is None:
+                stats = self._statements[key] = _StatementStats()
+        return stats
+
+    def record(
+        self,
+        statement: str,
+        elapsed_ms: float,
+        rows: Optional[int] = None,
+        pool_wait_ms: float = 0.0,
+        parameters: Any = None,
+        error: bool = False,
+    ) -> None:
+        """Record one statement execution."""
+        key = fingerprint(statement)
+        stats = self._stats_for(key)
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.pool_wait_ms += pool_wait_ms
+        if elapsed_ms > stats.max_ms:
+            stats.max_ms = elapsed_ms
+        if rows is not None and rows > 0:
+            stats.rows += rows
+        if error:
+            stats.errors += 1
+
+        bucket = len(LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                bucket = i
+                break
+        stats.buckets[bucket] += 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            self.slow_queries += 1
+            logger.warning(
+                f"Slow query ({elapsed_ms:.1f} ms, rows={rows}, "
+                f"pool wait {pool_wait_ms:.1f} ms): {key} "
+                f"params={parameter_shape(parameters)}"
+            )
+
+    def snapshot(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return per-fingerprint statistics ordered by total time spent."""
+        bucket_labels = [f"le{bound}ms" for bound in LATENCY_BUCKETS_MS] + ["inf"]
+        entries = [
+            {
+                "fingerprint": key,
+                "count": stats.count,
+                "totalMs": round(stats.total_ms, 3),
+                "avgMs": round(stats.total_ms / stats.count, 3) if stats.count else 0.0,
+                "maxMs": round(stats.max_ms, 3),
+                "rows": stats.rows,
+                "poolWaitMs": round(stats.pool_wait_ms, 3),
+                "errors": stats.errors,
+                "histogram": dict(zip(bucket_labels, stats.buckets)),
+            }
+            for key, stats in self._statements.items()
+        ]
+        entries.sort(key=lambda entry: entry["totalMs"], reverse=True)
+        return entries[:limit] if limit else entries
+
+
+def instrument_engine(async_engine, stats: QueryStats) -> None:
+    """Record every cursor execution on an async engine into ``stats``.
+
+    Pool checkout wait recorded by InstrumentedQueuePool is attributed to
+    the first statement run on the checked-out connection.
+    """
+    sync_engine = async_engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_start = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - context._query_start) * 1000
+        rowcount = getattr(cursor, "rowcount", None)
+        stats.record(
+            statement,
+            elapsed_ms,
+            rows=rowcount if rowcount is not None and rowcount >= 0 else None,
+            pool_wait_ms=conn.info.pop("checkout_wait_ms", 0.0),
+            parameters=parameters,
+        )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _handle_error(exception_context):
+        context = exception_context.execution_context
+        start = getattr(context, "_query_start", None)
+        if start is None or exception_context.statement is None:
+            return
+        stats.record(
+            exception_context.statement,
+            (time.perf_counter() - start) * 1000,
+            parameters=exception_context.parameters,
+            error=True,
+        )
+
+
+# Global instance
+query_stats = QueryStats()
@@ -0,0 +1,98 @@
+"""Shared LiveKit server API clients."""
+
+import asyncio
+import logging
+from typing import Any, Dict, Tuple
+
+from src.config.config import get_config
+
+logger = logging.getLogger(__name__)
+
+ClientKey = Tuple[str, str, str]
+
+
+class LiveKitAPIRegistry:
+    """Process-wide LiveKitAPI clients, one per (url, api_key, api_secret).
+
+    Each client owns an aiohttp session whose connection pool is reused
+    across calls, so dispatches after the first skip TCP/TLS setup.
+    aiohttp sessions belong to the event loop that created them; a client
+    requested from a different loop is replaced rather than shared.
+    """
+
+    def __init__(
+        self,
+        connection_limit: int = 100,
+        timeout_seconds: float = 10.0,
+        keepalive_seconds: float = 30.0,
+    ):
+        self.connection_limit = connection_limit
+        self.timeout_seconds = timeout_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self._clients: Dict[ClientKey, Tuple[Any, Any, asyncio.AbstractEventLoop]] = {}
+        self._stats: Dict[str, int] = {"created": 0, "reused": 0, "closed": 0}
+
+    def get(self, url: str, api_key: str, api_secret: str):
+        """Get the shared client for a server and credentials, creating it if needed."""
+        import aiohttp
+        from livekit import api
+
+        key = (url, api_key, api_secret)
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(key)
+        if entry is not None:
+            client, session, client_loop = entry
+            if client_loop is loop and not session.closed:
+                self._stats["reused"] += 1
+                return client
+            # The loop it was bound to is gone; its connections went with it
+            del self._clients[key]
+
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=self.keepalive_seconds,
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+        )
+        client = api.LiveKitAPI(url, api_key, api_secret, session=session)
+        self._clients[key] = (client, session, loop)
+        self._stats["created"] += 1
+        return client
+
+    async def close(self) -> None:
+        """Close every client created on the running loop and forget the rest."""
+        loop = asyncio.get_running_loop()
+        clients, self._clients = self._clients, {}
+        for client, session, client_loop in clients.values():
+            if client_loop is not loop or session.closed:
+                continue
+            try:
+                await client.aclose()
+                # LiveKitAPI leaves sessions it was given to the caller
+                await session.close()
+                self._stats["closed"] += 1
+            except Exception as e:
+                logger.warning(f"Failed to close LiveKit API client: {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get client counts (credentials are never included)."""
+        return {**self._stats, "clients": len(self._clients)}
+
+
+def _create_registry() -> LiveKitAPIRegistry:
+    """Create the global client registry from runtime configuration."""
+    runtime_config = get_config().runtime
+    return LiveKitAPIRegistry(
+        connection_limit=runtime_config.livekit_api_connection_limit,
+        timeout_seconds=runtime_config.livekit_api_timeout_seconds,
+    )
+
+
+# Global instance
+livekit_api_clients = _create_registry()
+
+
+def get_livekit_api(url: str, api_key: str, api_secret: str):
+    """Get the shared LiveKitAPI client for a server and credentials."""
+    return livekit_api_clients.get(url, api_key, api_secret)
@@ -1,18 +1,58 @@
 """FastAPI application entry point for Agent Runtime."""
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 
-from src.api import agents, sessions, metrics, health
+from src.api import admin, agents, sessions, metrics, health
 from src.config.config import get_config
+from src.database.db import engine, read_engine, warm_pool, close_db
+from src.livekit.api_client import livekit_api_clients
+from src.runtime.dispatch_pipeline import dispatch_pipeline
+from src.runtime.drain import drain_controller
+from src.runtime.heartbeat import heartbeat_writer
+from src.runtime.placement import session_placer
+from src.runtime.session_manager import session_manager
+from src.runtime.warm_start import warm_start
 
 config = get_config()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup and shutdown."""
+    await warm_pool()
+    if read_engine is not engine:
+        await warm_pool(async_engine=read_engine)
+    session_manager.start_reaper()
+    if config.runtime.warm_start:
+        # /ready reports not ready until this finishes
+        warm_start.start()
+    if config.runtime.heartbeat:
+        heartbeat_writer.start()
+    if config.runtime.drain_on_sigterm:
+        # SIGTERM drains first, then hands over to uvicorn's shutdown
+        drain_controller.install_signal_handler()
+    yield
+    if drain_controller.draining:
+        # A drain started while serving (SIGTERM or admin) gets to finish;
+        # none is started now, as no end call can arrive any more
+        await drain_controller.wait()
+    await warm_start.wait()
+    await heartbeat_writer.close()
+    await dispatch_pipeline.close()
+    await session_manager.close()
+    await livekit_api_clients.close()
+    await session_placer.close()
+    await close_db()
+
+
 app = FastAPI(
     title="Agent Runtime API",
     version="1.0.0",
     description="Agent Runtime service for LiveKit agents with BitHuman avatar support",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -29,6 +69,7 @@ app.include_router(agents.router)
 app.include_router(sessions.router)
 app.include_router(metrics.router)
 app.include_router(health.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -0,0 +1,343 @@
+"""Tenant admission - weighted-fair scheduling of session creation."""
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from src.config.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionRejectedError(ValueError):
+    """Raised when a tenant is over quota or its admission queue is full."""
+
+
+class TenantQuota(NamedTuple):
+    """Admission settings for one tenant."""
+    weight: float = 1.0
+    max_sessions: Optional[int] = None
+    max_queued: Optional[int] = None
+
+
+def parse_resource_quota(raw: Optional[str]) -> TenantQuota:
+    """Read admission settings from a tenant's resource_quota JSON.
+
+    Recognised keys are ``sessionWeight`` (share of admissions under
+    contention, default 1), ``maxConcurrentSessions`` (live sessions on this
+    instance) and ``maxQueuedSessions``. Anything missing or malformed falls
+    back to the default.
+    """
+    try:
+        quota = json.loads(raw) if raw else {}
+    except ValueError:
+        quota = {}
+    if not isinstance(quota, dict):
+        quota = {}
+
+    def positive(key: str, cast: Callable[[Any], Any]) -> Optional[Any]:
+        try:
+            value = cast(quota[key])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return value if value > 0 else None
+
+    return TenantQuota(
+        weight=positive("sessionWeight", float) or 1.0,
+        max_sessions=positive("maxConcurrentSessions", int),
+        max_queued=positive("maxQueuedSessions", int),
+    )
+
+
+# Returns a tenant's raw resource_quota JSON
+QuotaLoader = Callable[[int], Awaitable[Optional[str]]]
+
+
+class _TenantQueue:
+    """Waiting admissions and counters for one tenant."""
+
+    __slots__ = (
+        "waiters",
+        "weight",
+        "finish",
+        "in_flight",
+        "creating",
+        "admitted",
+        "rejected",
+        "timed_out",
+        "total_wait_ms",
+        "max_wait_ms",
+    )
+
+    def __init__(self):
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.weight = 1.0
+        # Virtual time at which this tenant's next admission is due
+        self.finish = 0.0
+        self.in_flight = 0
+        # Admitted sessions not yet live (live ones count via live_sessions)
+        self.creating = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+
+
+class Admission:
+    """One admission held by ``AdmissionScheduler.admit``."""
+
+    __slots__ = ("_queue", "live")
+
+    def __init__(self, queue: _TenantQueue):
+        self._queue = queue
+        self.live = False
+
+    def mark_live(self) -> None:
+        """Stop counting this admission against its tenant's quota.
+
+        Called once the admitted session is live, from which point the
+        scheduler's ``live_sessions`` counts it.
+        """
+        if not self.live:
+            self.live = True
+            self._queue.creating -= 1
+
+
+class AdmissionScheduler:
+    """Admits session creation with weighted fairness between tenants.
+
+    At most ``concurrency`` admissions run at once. While there is spare
+    capacity requests go straight through; beyond that each tenant waits
+    in its own bounded FIFO, and freed slots go to the backlogged tenant
+    with the earliest virtual finish time. Each admission advances a
+    tenant's finish time by ``1 / weight``, so under contention tenants
+    are served in proportion to their weights, and a burst from one
+    tenant only delays that tenant.
+
+    Quotas are read from ``Tenant.resource_quota`` through ``quota_loader``
+    and cached for ``quota_ttl_seconds``. A tenant's quota usage is its live
+    sessions plus admitted sessions not yet live plus waiting requests.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 32,
+        queue_size: int = 100,
+        queue_timeout_seconds: float = 30.0,
+        quota_loader: Optional[QuotaLoader] = None,
+        quota_ttl_seconds: float = 60.0,
+        live_sessions: Callable[[int], int] = lambda tenant_id: 0,
+    ):
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self._quota_loader = quota_loader
+        self.quota_ttl_seconds = quota_ttl_seconds
+        # tenant_id -> (quota, expires_at)
+        self._quotas: Dict[int, Tuple[TenantQuota, float]] = {}
+        self._live_sessions = live_sessions
+        self._queues: Dict[int, _TenantQueue] = {}
+        self._backlogged: Dict[int, _TenantQueue] = {}
+        self._in_flight = 0
+        self._virtual_time = 0.0
+
+    @asynccontextmanager
+    async def admit(self, tenant_id: int) -> AsyncIterator[Admission]:
+        """Hold an admission slot for the tenant while the body runs.
+
+        The body's session counts against the tenant's quota as "creating"
+        until it calls ``mark_live`` on the yielded admission.
+        """
+        await self.acquire(tenant_id)
+        admission = Admission(self._queues[tenant_id])
+        try:
+            yield admission
+        finally:
+            self.release(tenant_id, creating=not admission.live)
+
+    async def acquire(self, tenant_id: int) -> None:
+        """Wait for the tenant's turn. Raises AdmissionRejectedError."""
+        quota = await self._get_quota(tenant_id)
+        queue = self._queues.get(tenant_id)
+        if queue is None:
+            queue = self._queues[tenant_id] = _TenantQueue()
+        queue.weight = quota.weight
+
+        if quota.max_sessions is not None:
+            pending = self._live_sessions(tenant_id) + queue.creating + len(queue.waiters)
+            if pending >= quota.max_sessions:
+                queue.rejected += 1
+                raise AdmissionRejectedError(
+                    f"Tenant {tenant_id} is at its session quota ({quota.max_sessions})"
+                )
+
+        if not self._backlogged and self._in_flight < self.concurrency:
+            self._start(queue)
+            self._record_wait(queue, 0.0)
+            return
+
+        max_queued = quota.max_queued if quota.max_queued is not None else self.queue_size
+        if len(queue.waiters) >= max_queued:
+            queue.rejected += 1
+            raise AdmissionRejectedError(
+                f"Tenant {tenant_id} has too many sessions waiting ({max_queued})"
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        if not queue.waiters:
+            # A newly backlogged tenant can't bank credit from idle time
+            queue.finish = max(queue.finish, self._virtual_time)
+            self._backlogged[tenant_id] = queue
+        queue.waiters.append(waiter)
+        started = time.perf_counter()
+        try:
+            # The slot is taken on our behalf before the waiter is woken
+            await asyncio.wait_for(
+                asyncio.shield(waiter), timeout=self.queue_timeout_seconds
+            )
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just as we gave up: pass the slot on
+                self.release(tenant_id)
+            else:
+                waiter.cancel()
+                queue.waiters.remove(waiter)
+                if not queue.waiters:
+                    self._backlogged.pop(tenant_id, None)
+            if isinstance(e, asyncio.TimeoutError):
+                queue.timed_out += 1
+                raise AdmissionRejectedError(
+                    f"Tenant {tenant_id} was not admitted within "
+                    f"{self.queue_timeout_seconds}s"
+                ) from None
+            raise
+        self._record_wait(queue, (time.perf_counter() - started) * 1000)
+
+    def release(self, tenant_id: int, creating: bool = True) -> None:
+        """Return an admission slot and admit the next waiter, if any.
+
+        ``creating=False`` means the admission's session already went live
+        and stopped counting as creating.
+        """
+        queue = self._queues[tenant_id]
+        self._in_flight -= 1
+        queue.in_flight -= 1
+        if creating:
+            queue.creating -= 1
+        self._dispatch()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler load and per-tenant admission metrics."""
+        return {
+            "concurrency": self.concurrency,
+            "inFlight": self._in_flight,
+            "queued": sum(len(q.waiters) for q in self._backlogged.values()),
+            "tenants": [
+                self._tenant_stats(tenant_id, queue)
+                for tenant_id, queue in self._queues.items()
+            ],
+        }
+
+    def get_tenant_stats(self, tenant_id: int) -> Optional[Dict[str, Any]]:
+        """Get one tenant's admission metrics, if it has requested any."""
+        queue = self._queues.get(tenant_id)
+        return self._tenant_stats(tenant_id, queue) if queue else None
+
+    def _start(self, queue: _TenantQueue) -> None:
+        self._in_flight += 1
+        queue.in_flight += 1
+        queue.creating += 1
+
+    def _dispatch(self) -> None:
+        """Hand free slots to backlogged tenants by earliest finish time."""
+        while self._backlogged and self._in_flight < self.concurrency:
+            tenant_id, queue = min(
+                self._backlogged.items(), key=lambda item: item[1].finish
+            )
+            waiter = queue.waiters.popleft()
+            if not queue.waiters:
+                del self._backlogged[tenant_id]
+            self._virtual_time = queue.finish
+            queue.finish += 1.0 / queue.weight
+            self._start(queue)
+            waiter.set_result(None)
+
+    @staticmethod
+    def _record_wait(queue: _TenantQueue, wait_ms: float) -> None:
+        queue.admitted += 1
+        queue.total_wait_ms += wait_ms
+        queue.max_wait_ms = max(queue.max_wait_ms, wait_ms)
+
+    @staticmethod
+    def _tenant_stats(tenant_id: int, queue: _TenantQueue) -> Dict[str, Any]:
+        return {
+            "tenantId": tenant_id,
+            "weight": queue.weight,
+            "queueDepth": len(queue.waiters),
+            "inFlight": queue.in_flight,
+            "admitted": queue.admitted,
+            "rejected": queue.rejected,
+            "timedOut": queue.timed_out,
+            "avgAdmissionMs": (
+                round(queue.total_wait_ms / queue.admitted, 2) if queue.admitted else 0.0
+            ),
+            "maxAdmissionMs": round(queue.max_wait_ms, 2),
+        }
+
+    async def _get_quota(self, tenant_id: int) -> TenantQuota:
+        cached = self._quotas.get(tenant_id)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+        raw = None
+        if self._quota_loader is not None:
+            try:
+                raw = await self._quota_loader(tenant_id)
+            except Exception as e:
+                # Admit with the default quota rather than failing the request
+                logger.warning(f"Failed to load quota for tenant {tenant_id}: {e}")
+        quota = parse_resource_quota(raw)
+        self._quotas[tenant_id] = (quota, time.monotonic() + self.quota_ttl_seconds)
+        return quota
+
+
+async def load_tenant_quota(tenant_id: int) -> Optional[str]:
+    """Load a tenant's resource_quota from the read database."""
+    from src.database.db import AsyncReadSessionLocal
+    from src.database.operations import get_tenant_resource_quota
+    async with AsyncReadSessionLocal() as db:
+        return await get_tenant_resource_quota(db, tenant_id)
+
+
+def _create_admission_scheduler() -> AdmissionScheduler:
+    """Create the global admission scheduler from runtime configuration."""
+    from src.runtime.session_manager import session_manager
+    runtime_config = get_config().runtime
+    return AdmissionScheduler(
+        concurrency=runtime_config.admission_concurrency,
+        queue_size=runtime_config.admission_queue_size,
+        queue_timeout_seconds=runtime_config.admission_queue_timeout_seconds,
+        quota_loader=load_tenant_quota,
+        quota_ttl_seconds=runtime_config.tenant_quota_ttl_seconds,
+        live_sessions=lambda tenant_id: (
+            session_manager.get_tenant_live_status(tenant_id)["liveSessions"]
+        ),
+    )
+
+
+# Global instance
+admission_scheduler = _create_admission_scheduler()
@@ -1,22 +1,112 @@
 """Agent Instance - manages individual agent instances."""
 
+import asyncio
 import json
 import logging
-from typing import Dict, Any, Set, Optional
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Any, List, Set, Optional, Tuple
+from src.config.config import get_config
 from src.langfuse.langfuse_client import LangFuseClient
+from src.runtime.session_record import SessionRecord
 
 logger = logging.getLogger(__name__)
 
 
+class AgentAtCapacityError(ValueError):
+    """Raised when an agent has no free session slot (and none freed in time)."""
+
+
+class TeardownProgress:
+    """Progress of ending an agent's sessions when it is unregistered."""
+    
+    __slots__ = (
+        "agent_id",
+        "state",
+        "total_sessions",
+        "ended_sessions",
+        "total_rooms",
+        "rooms_released",
+        "started_at",
+        "finished_at",
+        "error",
+    )
+    
+    def __init__(self, agent_id: int):
+        self.agent_id = agent_id
+        self.state = "running"
+        self.total_sessions = 0
+        self.ended_sessions = 0
+        self.total_rooms = 0
+        self.rooms_released = 0
+        self.started_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+    
+    def finish(self, error: Optional[Exception] = None) -> None:
+        """Record that teardown completed (or failed)."""
+        self.state = "failed" if error else "completed"
+        self.error = str(error) if error else None
+        self.finished_at = datetime.utcnow()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the camelCase API format."""
+        return {
+            "agentId": self.agent_id,
+            "state": self.state,
+            "totalSessions": self.total_sessions,
+            "endedSessions": self.ended_sessions,
+            "totalRooms": self.total_rooms,
+            "roomsReleased": self.rooms_released,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+            "error": self.error,
+        }
+
+
 class AgentInstance:
-    """Manages a single agent instance."""
+    """Manages a single agent instance.
+    
+    Session slots are reserved synchronously at the start of ``join_room``,
+    before any await, so concurrent joins can never overshoot
+    ``maxConcurrentSessions``. When ``queue_size`` is positive, joins that
+    arrive at capacity wait in FIFO order for up to
+    ``queue_timeout_seconds``; a freed slot is handed straight to the
+    oldest waiter so new arrivals can't jump the queue.
+    """
     
-    def __init__(self, agent_id: int, config: Dict[str, Any]):
+    def __init__(
+        self,
+        agent_id: int,
+        config: Dict[str, Any],
+        queue_size: Optional[int] = None,
+        queue_timeout_seconds: Optional[float] = None,
+    ):
+        runtime_config = get_config().runtime
         self.agent_id = agent_id
         self.config = config
         self.langfuse_client = LangFuseClient(config.get("langfuseConfig", {}))
         self.active_sessions: Set[str] = set()
         self.initialized = False
+        self.queue_size = (
+            runtime_config.session_queue_size if queue_size is None else queue_size
+        )
+        self.queue_timeout_seconds = (
+            runtime_config.session_queue_timeout_seconds
+            if queue_timeout_seconds is None
+            else queue_timeout_seconds
+        )
+        # Slots taken by joins that have not finished yet
+        self._reserved = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._queue_stats: Dict[str, float] = {
+            "queued": 0,
+            "rejected": 0,
+            "timedOut": 0,
+            "totalWaitMs": 0.0,
+            "maxWaitMs": 0.0,
+        }
         # TODO: Add LiveKit agent session
         # self.agent_session: Optional[AgentSession] = None
     
@@ -30,86 +120,210 @@ class AgentInstance:
         """Update agent configuration."""
         self.config = config
         self.langfuse_client = LangFuseClient(config.get("langfuseConfig", {}))
+        # A raised maxConcurrentSessions may free slots for waiting joins
+        self._wake_waiters()
         # TODO: Update LiveKit agent session configuration
     
-    async def join_room(self, room_name: str) -> Dict[str, Any]:
+    async def join_room(self, room_name: str) -> SessionRecord:
         """Join a LiveKit room.
         
         Note: LiveKit agent server handles the actual room connection
         via job dispatch. This method just tracks the session and
         optionally dispatches the agent explicitly if needed.
+        
+        The session stays connecting until the dispatch pipeline has sent
+        the dispatch, which marks it active (or failed).
         """
-        max_sessions = self.config.get("maxConcurrentSessions", 10)
-        if len(self.active_sessions) >= max_sessions:
-            raise ValueError(
-                f"Agent {self.agent_id} is at capacity ({max_sessions} sessions)"
-            )
+        await self._reserve_slot()
         
-        # Create session in session manager
-        from src.runtime.session_manager import session_manager
-        session = await session_manager.create_session(
-            self.agent_id,
-            self.config.get("tenantId"),
-            room_name,
-        )
+        try:
+            # Create session in session manager
+            from src.runtime.session_manager import session_manager
+            session = await session_manager.create_session(
+                self.agent_id,
+                self.config.get("tenantId"),
+                room_name,
+            )
+        except BaseException:
+            self._release_reservation()
+            raise
         
         # Get session_id from the created session
-        session_id = session["sessionId"]
+        session_id = session.session_id
+        
+        # The reservation becomes the session's slot
+        self._reserved -= 1
+        self.active_sessions.add(session_id)
         
         # Dispatch agent to room using LiveKit AgentDispatchService
         # This tells LiveKit to dispatch the agent to the room
         # The agent server will handle the actual connection
         agent_name = f"agent-{self.agent_id}"
-        await self._dispatch_agent_to_room(room_name, agent_name, session_id)
-        
-        self.active_sessions.add(session_id)
-        await session_manager.update_session_status(session_id, "active")
+        if not await self._dispatch_agent_to_room(room_name, agent_name, session_id):
+            # No explicit dispatch to wait for
+            await session_manager.activate_session(session_id)
         
         return session
     
+    @property
+    def max_sessions(self) -> int:
+        """Configured session capacity."""
+        return self.config.get("maxConcurrentSessions", 10)
+    
+    def _has_free_slot(self) -> bool:
+        return len(self.active_sessions) + self._reserved < self.max_sessions
+    
+    async def _reserve_slot(self) -> None:
+        """Reserve a session slot, waiting in the queue if one is configured."""
+        # Check and take the slot with no await in between
+        if not self._waiters and self._has_free_slot():
+            self._reserved += 1
+            return
+        
+        if len(self._waiters) >= self.queue_size:
+            self._queue_stats["rejected"] += 1
+            raise AgentAtCapacityError(
+                f"Agent {self.agent_id} is at capacity ({self.max_sessions} sessions)"
+            )
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._queue_stats["queued"] += 1
+        started = time.perf_counter()
+        try:
+            # The slot is reserved on our behalf before the waiter is woken
+            await asyncio.wait_for(
+                asyncio.shield(waiter), timeout=self.queue_timeout_seconds
+            )
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                if waiter.exception() is None:
+                    # Woken and given a slot just as we gave up: pass it on
+                    self._release_reservation()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.TimeoutError):
+                self._queue_stats["timedOut"] += 1
+                raise AgentAtCapacityError(
+                    f"Agent {self.agent_id} is at capacity ({self.max_sessions} sessions); "
+                    f"no slot freed within {self.queue_timeout_seconds}s"
+                ) from None
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - started) * 1000
+            self._queue_stats["totalWaitMs"] += wait_ms
+            self._queue_stats["maxWaitMs"] = max(self._queue_stats["maxWaitMs"], wait_ms)
+    
+    def _release_reservation(self) -> None:
+        """Give back a reserved slot that never became a session."""
+        self._reserved -= 1
+        self._wake_waiters()
+    
+    def _wake_waiters(self) -> None:
+        """Hand free slots to waiting joins, oldest first."""
+        while self._waiters and self._has_free_slot():
+            waiter = self._waiters.popleft()
+            self._reserved += 1
+            waiter.set_result(None)
+    
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """Get slot usage and wait-queue metrics."""
+        queued = self._queue_stats["queued"]
+        return {
+            "agentId": self.agent_id,
+            "activeSessions": len(self.active_sessions),
+            "reservedSlots": self._reserved,
+            "maxSessions": self.max_sessions,
+            "queueDepth": len(self._waiters),
+            "maxQueueSize": self.queue_size,
+            "queued": int(queued),
+            "rejected": int(self._queue_stats["rejected"]),
+            "timedOut": int(self._queue_stats["timedOut"]),
+            "avgWaitMs": round(self._queue_stats["totalWaitMs"] / queued, 2) if queued else 0.0,
+            "maxWaitMs": round(self._queue_stats["maxWaitMs"], 2),
+        }
+    
     async def _dispatch_agent_to_room(
         self, room_name: str, agent_name: str, session_id: str
+    ) -> bool:
+        """Queue a dispatch of the agent to the room.
+        
+        The LiveKit call is made by the background dispatch pipeline, which
+        retries it and marks the session active once it succeeds, or failed
+        if it never does. Returns False if no dispatch was queued.
+        """
+        credentials = self._livekit_credentials()
+        if not credentials:
+            # Session is still created, agent may connect via automatic dispatch
+            logger.warning("LiveKit credentials not configured, agent dispatch may fail")
+            return False
+        
+        async def send() -> None:
+            await self._send_dispatch(*credentials, room_name, agent_name, session_id)
+        
+        from src.runtime.dispatch_pipeline import DispatchJob, dispatch_pipeline
+        await dispatch_pipeline.submit(DispatchJob(session_id, send))
+        return True
+    
+    def _livekit_credentials(self) -> Optional[Tuple[str, str, str]]:
+        """LiveKit (url, api_key, api_secret), or None if not configured."""
+        import os
+        
+        # Use LiveKit service from same namespace
+        livekit_url = (self.config.get("livekitConfig") or {}).get("url") or os.getenv("LIVEKIT_URL", "ws://livekit-service.livekit:7880")
+        api_key = (self.config.get("livekitConfig") or {}).get("apiKey") or os.getenv("LIVEKIT_API_KEY")
+        api_secret = (self.config.get("livekitConfig") or {}).get("apiSecret") or os.getenv("LIVEKIT_API_SECRET")
+        
+        if not all([livekit_url, api_key, api_secret]):
+            return None
+        return livekit_url, api_key, api_secret
+    
+    async def _send_dispatch(
+        self,
+        livekit_url: str,
+        api_key: str,
+        api_secret: str,
+        room_name: str,
+        agent_name: str,
+        session_id: str,
     ) -> None:
-        """Dispatch agent to room using LiveKit API."""
-        try:
-            from livekit import api
-            import os
-            
-            # Use LiveKit service from same namespace
-            livekit_url = self.config.get("livekitConfig", {}).get("url") or os.getenv("LIVEKIT_URL", "ws://livekit-service.livekit:7880")
-            api_key = self.config.get("livekitConfig", {}).get("apiKey") or os.getenv("LIVEKIT_API_KEY")
-            api_secret = self.config.get("livekitConfig", {}).get("apiSecret") or os.getenv("LIVEKIT_API_SECRET")
-            
-            if not all([livekit_url, api_key, api_secret]):
-                logger.warning("LiveKit credentials not configured, agent dispatch may fail")
-                return
-            
-            # Create LiveKit API client
-            lkapi = api.LiveKitAPI(livekit_url, api_key, api_secret)
-            
-            # Dispatch agent with metadata
-            metadata = json.dumps({
-                "agentId": self.agent_id,
-                "sessionId": session_id,
-                "tenantId": self.config.get("tenantId"),
-            })
-            
-            await lkapi.agent_dispatch.create_dispatch(
-                api.CreateAgentDispatchRequest(
-                    agent_name=agent_name,
-                    room=room_name,
-                    metadata=metadata,
-                )
+        """Create the agent dispatch with the LiveKit API. Raises on failure."""
+        from livekit import api
+        
+        # Shared client, so dispatches reuse pooled connections
+        from src.livekit.api_client import get_livekit_api
+        lkapi = get_livekit_api(livekit_url, api_key, api_secret)
+        
+        # Dispatch agent with metadata
+        metadata = json.dumps({
+            "agentId": self.agent_id,
+            "sessionId": session_id,
+            "tenantId": self.config.get("tenantId"),
+        })
+        
+        await lkapi.agent_dispatch.create_dispatch(
+            api.CreateAgentDispatchRequest(
+                agent_name=agent_name,
+                room=room_name,
+                metadata=metadata,
             )
-            
-            logger.info(f"Dispatched agent {agent_name} to room {room_name}")
-        except Exception as e:
-            logger.error(f"Failed to dispatch agent to room: {e}", exc_info=True)
-            # Don't raise - session is still created, agent may connect via automatic dispatch
+        )
+        
+        logger.info(f"Dispatched agent {agent_name} to room {room_name}")
+    
+    def restore_session(self, session_id: str) -> None:
+        """Take a capacity slot for a live session reloaded at startup."""
+        self.active_sessions.add(session_id)
+    
+    def release_session(self, session_id: str) -> None:
+        """Free a capacity slot for a session ended elsewhere (e.g. reaped)."""
+        self.active_sessions.discard(session_id)
+        self._wake_waiters()
     
     async def leave_room(self, session_id: str) -> None:
         """Leave a LiveKit room."""
-        self.active_sessions.discard(session_id)
+        self.release_session(session_id)
         from src.runtime.session_manager import session_manager
         await session_manager.end_session(session_id)
     
@@ -118,19 +332,79 @@ class AgentInstance:
         return {
             "active": self.initialized,
             "activeSessions": len(self.active_sessions),
-            "maxSessions": self.config.get("maxConcurrentSessions", 10),
+            "maxSessions": self.max_sessions,
         }
     
-    async def cleanup(self) -> None:
-        """Cleanup agent instance."""
-        # End all active sessions
-        from src.runtime.session_manager import session_manager
-        for session_id in list(self.active_sessions):
-            await self.leave_room(session_id)
+    async def cleanup(
+        self,
+        progress: Optional[TeardownProgress] = None,
+        concurrency: Optional[int] = None,
+    ) -> TeardownProgress:
+        """Cleanup agent instance.
         
-        # Disconnect from LiveKit
-        # TODO: Implement cleanup
+        Ends every active session with one bulk update, then removes the
+        agent's dispatches from their rooms, ``concurrency`` rooms at a time.
+        """
+        progress = progress or TeardownProgress(self.agent_id)
+        if concurrency is None:
+            concurrency = get_config().runtime.teardown_concurrency
+        try:
+            # Joins still waiting for a slot will never get one
+            while self._waiters:
+                self._waiters.popleft().set_exception(
+                    AgentAtCapacityError(f"Agent {self.agent_id} was unregistered")
+                )
+            
+            # End all active sessions
+            from src.runtime.dispatch_pipeline import dispatch_pipeline
+            from src.runtime.session_manager import session_manager
+            session_ids = list(self.active_sessions)
+            progress.total_sessions = len(session_ids)
+            dispatch_pipeline.cancel(session_ids)
+            ended = await session_manager.end_sessions(session_ids)
+            self.active_sessions.clear()
+            progress.ended_sessions = len(ended)
+            
+            # Disconnect from LiveKit
+            await self._remove_dispatches(
+                [session.room_name for session in ended], progress, concurrency
+            )
+            progress.finish()
+        except Exception as e:
+            logger.error(f"Failed to clean up agent {self.agent_id}: {e}")
+            progress.finish(e)
         self.initialized = False
+        return progress
+    
+    async def _remove_dispatches(
+        self,
+        room_names: List[str],
+        progress: TeardownProgress,
+        concurrency: int,
+    ) -> None:
+        """Remove this agent's dispatches from rooms, a bounded number at once."""
+        room_names = set(room_names)
+        progress.total_rooms = len(room_names)
+        credentials = self._livekit_credentials()
+        if not credentials or not room_names:
+            return
+        from src.livekit.api_client import get_livekit_api
+        lkapi = get_livekit_api(*credentials)
+        agent_name = f"agent-{self.agent_id}"
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def remove(room_name: str) -> None:
+            async with semaphore:
+                try:
+                    dispatches = await lkapi.agent_dispatch.list_dispatch(room_name)
+                    for dispatch in dispatches:
+                        if dispatch.agent_name == agent_name:
+                            await lkapi.agent_dispatch.delete_dispatch(dispatch.id, room_name)
+                    progress.rooms_released += 1
+                except Exception as e:
+                    logger.warning(f"Failed to remove agent from room {room_name}: {e}")
+        
+        await asyncio.gather(*(remove(room_name) for room_name in room_names))
     
     def get_langfuse_client(self) -> LangFuseClient:
         """Get LangFuse client."""
@@ -1,15 +1,24 @@
 """Agent Manager - manages agent instances."""
 
-from typing import Dict, Any, Optional
-from src.runtime.agent_instance import AgentInstance
+import asyncio
+import logging
+from typing import Dict, Any, Optional, List, Tuple
+from src.runtime.agent_instance import AgentInstance, TeardownProgress
+
+logger = logging.getLogger(__name__)
 
 
 class AgentManager:
     """Manages agent instances."""
     
-    def __init__(self):
+    def __init__(self, teardown_retention_seconds: float = 300.0):
         self._agent_instances: Dict[int, AgentInstance] = {}
         self._configs: Dict[int, Dict[str, Any]] = {}
+        # Latest teardown per unregistered agent, kept for a while after it
+        # finishes so callers can poll the result
+        self.teardown_retention_seconds = teardown_retention_seconds
+        self._teardowns: Dict[int, TeardownProgress] = {}
+        self._teardown_tasks: Dict[int, asyncio.Task] = {}
     
     async def register_agent(
         self,
@@ -29,15 +38,79 @@ class AgentManager:
             instance = self._agent_instances[agent_id]
             await instance.update_config(config)
     
-    async def unregister_agent(self, agent_id: int) -> None:
-        """Unregister an agent."""
-        instance = self._agent_instances.get(agent_id)
-        if instance:
-            await instance.cleanup()
-            del self._agent_instances[agent_id]
+    async def register_agents(
+        self,
+        configs: List[Tuple[int, Dict[str, Any]]],
+        concurrency: int = 16
+    ) -> int:
+        """Register many agents, initializing up to ``concurrency`` at once.
+        
+        An agent that fails to initialize is logged and skipped. Returns the
+        number registered.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def register(agent_id: int, config: Dict[str, Any]) -> bool:
+            async with semaphore:
+                try:
+                    await self.register_agent(agent_id, config)
+                    return True
+                except Exception as e:
+                    logger.error(f"Failed to register agent {agent_id}: {e}")
+                    return False
+        
+        results = await asyncio.gather(
+            *(register(agent_id, config) for agent_id, config in configs)
+        )
+        return sum(results)
+    
+    async def unregister_agent(
+        self,
+        agent_id: int,
+        wait: bool = True
+    ) -> Optional[TeardownProgress]:
+        """Unregister an agent.
         
-        if agent_id in self._configs:
-            del self._configs[agent_id]
+        The agent stops taking sessions at once. With ``wait=False`` its
+        sessions are torn down in the background; follow along with
+        ``get_teardown_progress``. Returns None if it wasn't registered.
+        """
+        instance = self._agent_instances.pop(agent_id, None)
+        self._configs.pop(agent_id, None)
+        if not instance:
+            return None
+        
+        progress = TeardownProgress(agent_id)
+        self._teardowns[agent_id] = progress
+        if wait:
+            try:
+                await instance.cleanup(progress)
+            finally:
+                self._forget_teardown_later(agent_id, progress)
+            return progress
+        
+        task = asyncio.create_task(instance.cleanup(progress))
+        self._teardown_tasks[agent_id] = task
+        
+        def finished(done: asyncio.Task) -> None:
+            if self._teardown_tasks.get(agent_id) is done:
+                del self._teardown_tasks[agent_id]
+            self._forget_teardown_later(agent_id, progress)
+        
+        task.add_done_callback(finished)
+        return progress
+    
+    def _forget_teardown_later(self, agent_id: int, progress: TeardownProgress) -> None:
+        """Drop a finished teardown once its retention period has passed."""
+        def forget() -> None:
+            if self._teardowns.get(agent_id) is progress:
+                del self._teardowns[agent_id]
+        
+        asyncio.get_running_loop().call_later(self.teardown_retention_seconds, forget)
+    
+    def get_teardown_progress(self, agent_id: int) -> Optional[TeardownProgress]:
+        """Get the latest teardown of an unregistered agent."""
+        return self._teardowns.get(agent_id)
     
     def get_agent_instance(self, agent_id: int) -> Optional[AgentInstance]:
         """Get agent instance by ID."""
@@ -51,6 +124,13 @@ class AgentManager:
         """List all registered agent IDs."""
         return list(self._agent_instances.keys())
     
+    def get_capacity_stats(self) -> List[Dict[str, Any]]:
+        """Get session slot usage and join-queue metrics for every agent."""
+        return [
+            instance.get_queue_stats()
+            for instance in self._agent_instances.values()
+        ]
+    
     async def get_agent_status(self, agent_id: int) -> Dict[str, Any]:
         """Get agent status."""
         instance = self._agent_instances.get(agent_id)
@@ -1,10 +1,17 @@
 """Agent Runtime main class."""
 
+import logging
 from typing import Dict, Any, Optional
+from src.config.config import get_config
+from src.runtime.admission import admission_scheduler
 from src.runtime.agent_manager import agent_manager
+from src.runtime.drain import drain_controller
+from src.runtime.placement import PlacementUnavailableError, session_placer
 from src.runtime.session_manager import session_manager
 from nanoid import generate as nanoid_generate
 
+logger = logging.getLogger(__name__)
+
 
 class AgentRuntime:
     """Main agent runtime class."""
@@ -18,36 +25,87 @@ class AgentRuntime:
         """Register an agent with the runtime."""
         await agent_manager.register_agent(agent_id, config)
     
-    async def unregister_agent(self, agent_id: int) -> None:
-        """Unregister an agent from the runtime."""
-        await agent_manager.unregister_agent(agent_id)
+    async def unregister_agent(
+        self,
+        agent_id: int,
+        wait: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Unregister an agent from the runtime.
+        
+        Returns teardown progress, or None if the agent wasn't registered.
+        """
+        progress = await agent_manager.unregister_agent(agent_id, wait=wait)
+        return progress.to_dict() if progress else None
+    
+    def get_teardown_progress(self, agent_id: int) -> Optional[Dict[str, Any]]:
+        """Get progress of an agent's latest unregister teardown."""
+        progress = agent_manager.get_teardown_progress(agent_id)
+        return progress.to_dict() if progress else None
     
     async def create_session(
         self,
         agent_id: int,
         tenant_id: int,
         room_name: str,
-        participant_name: Optional[str] = None
+        participant_name: Optional[str] = None,
+        forwarded: bool = False,
     ) -> Dict[str, str]:
-        """Create a new agent session."""
+        """Create a new agent session.
+        
+        With placement enabled the session may be created on another
+        replica; ``forwarded`` marks requests that already were.
+        """
+        # Refuse before queueing so a draining pod sheds load at once
+        drain_controller.check()
+        if get_config().runtime.placement and not forwarded:
+            node = await session_placer.choose(agent_id)
+            if node is not None and node.pod_name != session_placer.pod_name:
+                try:
+                    return await session_placer.forward(node, {
+                        "agentId": agent_id,
+                        "tenantId": tenant_id,
+                        "roomName": room_name,
+                        "participantName": participant_name,
+                    })
+                except PlacementUnavailableError as e:
+                    logger.warning(f"Creating session locally, forward failed: {e}")
+            session_placer.placed_locally()
+        
         instance = agent_manager.get_agent_instance(agent_id)
         if not instance:
             raise ValueError(f"Agent {agent_id} not registered")
         
-        # join_room will create the session and return it
-        session = await instance.join_room(room_name)
+        # join_room will create the session and return it; tenants take
+        # turns by weight when creations pile up
+        async with admission_scheduler.admit(tenant_id) as admission:
+            session = await instance.join_room(room_name)
+            # Counted as live from here on, not as an admission in progress
+            admission.mark_live()
         
-        return {"sessionId": session["sessionId"], "roomName": room_name}
+        return {"sessionId": session.session_id, "roomName": room_name}
     
-    async def end_session(self, session_id: str) -> None:
-        """End an agent session."""
+    async def end_session(self, session_id: str, forwarded: bool = False) -> None:
+        """End an agent session.
+        
+        With placement enabled, a session live on another replica is ended
+        there, so that replica frees its slot; ``forwarded`` marks requests
+        that already were.
+        """
+        if (
+            get_config().runtime.placement
+            and not forwarded
+            and not session_manager.is_live(session_id)
+            and await session_placer.forward_end(session_id)
+        ):
+            return
+        
         session = await session_manager.get_session(session_id)
         if not session:
             # Try to end session anyway (might be in database but not in cache)
             await session_manager.end_session(session_id)
             return
         
-        instance = agent_manager.get_agent_instance(session["agentId"])
+        instance = agent_manager.get_agent_instance(session.agent_id)
         if instance:
             await instance.leave_room(session_id)
         else:
@@ -60,16 +118,7 @@ class AgentRuntime:
             return None
         
         # Convert to dict format expected by API
-        return {
-            "sessionId": session["sessionId"],
-            "agentId": session["agentId"],
-            "tenantId": session["tenantId"],
-            "roomName": session["roomName"],
-            "status": session["status"],
-            "startedAt": session["startedAt"],
-            "endedAt": session.get("endedAt"),
-            "participantCount": session.get("participantCount", 0),
-        }
+        return session.to_dict()
     
     async def get_agent_status(self, agent_id: int) -> Dict[str, Any]:
         """Get agent status."""
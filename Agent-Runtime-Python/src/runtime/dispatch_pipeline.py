@@ -0,0 +1,308 @@
+"""Dispatch Pipeline - sends agent dispatches in the background with retries."""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Set
+
+from src.config.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the dispatch API while the circuit is open."""
+
+
+class CircuitBreaker:
+    """Stops calling a failing dependency for a while.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail fast. Once ``reset_timeout_seconds`` have passed one trial
+    call is let through (half-open): success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        """Whether a call may be made now."""
+        if self.state == "closed":
+            return True
+        if self.state == "open":
+            if time.monotonic() - self._opened_at < self.reset_timeout_seconds:
+                return False
+            self.state = "half_open"
+        # Half-open: only one trial call at a time
+        if self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        self.state = "closed"
+        self._failures = 0
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the circuit at the threshold."""
+        self._failures += 1
+        self._trial_in_flight = False
+        if self.state == "half_open" or self._failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+                logger.warning(
+                    f"Dispatch circuit opened after {self._failures} failures"
+                )
+            self.state = "open"
+            self._opened_at = time.monotonic()
+
+
+class DispatchJob:
+    """One agent dispatch for a session."""
+
+    __slots__ = ("session_id", "send", "attempts", "cancelled")
+
+    def __init__(self, session_id: str, send: Callable[[], Awaitable[None]]):
+        self.session_id = session_id
+        # Makes the dispatch call; raises on failure
+        self.send = send
+        self.attempts = 0
+        self.cancelled = False
+
+
+# Client errors that clear up by themselves: request timeout, rate limited
+RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+
+def is_retryable(error: Exception) -> bool:
+    """Transport errors, 5xx, 408 and 429 responses are retried; other 4xx are not."""
+    status = getattr(error, "status", None)
+    if not isinstance(status, int) or status in RETRYABLE_CLIENT_STATUSES:
+        return True
+    return not 400 <= status < 500
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """The delay the server asked for with ``Retry-After``, if any.
+
+    Read from a ``retry_after`` attribute, response ``headers`` or the
+    error ``metadata`` (as on livekit.api.ServerError). Only the
+    delay-seconds form is understood.
+    """
+    value = getattr(error, "retry_after", None)
+    for source in ("headers", "metadata"):
+        if value is None:
+            mapping = getattr(error, source, None) or {}
+            value = mapping.get("Retry-After") or mapping.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+# Called with the session ID once a dispatch has succeeded or finally failed
+DispatchCallback = Callable[[str], Awaitable[None]]
+
+
+class DispatchPipeline:
+    """Runs agent dispatches off the request path.
+
+    ``submit`` queues a job and returns at once; worker tasks send it.
+    Failed sends are retried with exponential backoff and full jitter
+    (a random delay up to ``retry_base_seconds * 2**attempt``, capped at
+    ``retry_max_seconds``), without holding a worker; a ``Retry-After``
+    from the server, up to ``retry_max_seconds``, is waited out first. A circuit breaker
+    shared by all jobs turns sends into immediate failures while the
+    dispatch API is down. ``on_dispatched`` is called with a job's session
+    ID once it is sent; when a job runs out of attempts, or gets a
+    non-retryable error, ``on_failed`` is called instead.
+    """
+
+    def __init__(
+        self,
+        on_failed: DispatchCallback,
+        on_dispatched: Optional[DispatchCallback] = None,
+        workers: int = 8,
+        max_queue_size: int = 10000,
+        max_attempts: int = 5,
+        retry_base_seconds: float = 0.5,
+        retry_max_seconds: float = 30.0,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self._on_failed = on_failed
+        self._on_dispatched = on_dispatched
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self.retry_max_seconds = retry_max_seconds
+        self.breaker = breaker or CircuitBreaker()
+        self.max_queue_size = max_queue_size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._workers: Set[asyncio.Task] = set()
+        self._retries: Set[asyncio.Task] = set()
+        # Jobs not yet dispatched or given up on, by session ID
+        self._pending: Dict[str, DispatchJob] = {}
+        self._stats: Dict[str, int] = {
+            "submitted": 0,
+            "dispatched": 0,
+            "retried": 0,
+            "failed": 0,
+            "shortCircuited": 0,
+            "cancelled": 0,
+        }
+
+    async def submit(self, job: DispatchJob) -> None:
+        """Queue a dispatch; waits only if the queue is full."""
+        self.start()
+        self._stats["submitted"] += 1
+        self._pending[job.session_id] = job
+        await self._queue.put(job)
+    
+    def cancel(self, session_ids: Iterable[str]) -> int:
+        """Drop pending dispatches for sessions that have ended."""
+        cancelled = 0
+        for session_id in session_ids:
+            job = self._pending.pop(session_id, None)
+            if job is not None:
+                job.cancelled = True
+                cancelled += 1
+        self._stats["cancelled"] += cancelled
+        return cancelled
+
+    def start(self) -> None:
+        """Start the worker tasks if they are not already running."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Queue and tasks belong to the loop that created them
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._workers = set()
+            self._retries = set()
+            self._pending = {}
+        self._workers = {task for task in self._workers if not task.done()}
+        for _ in range(self.workers - len(self._workers)):
+            self._workers.add(asyncio.create_task(self._run()))
+
+    async def drain(self) -> None:
+        """Wait until every queued job and pending retry has finished."""
+        while True:
+            await self._queue.join()
+            if not self._retries:
+                return
+            await asyncio.wait(set(self._retries))
+
+    async def close(self, timeout_seconds: float = 5.0) -> None:
+        """Give in-flight dispatches a moment to finish, then stop."""
+        if self._workers:
+            try:
+                await asyncio.wait_for(self.drain(), timeout=timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.warning("Stopping dispatch pipeline with dispatches pending")
+        for task in self._workers | self._retries:
+            task.cancel()
+        await asyncio.gather(*self._workers, *self._retries, return_exceptions=True)
+        self._workers.clear()
+        self._retries.clear()
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get dispatch counters, queue depth and circuit state."""
+        return {
+            **self._stats,
+            "queueDepth": self._queue.qsize(),
+            "pendingRetries": len(self._retries),
+            "circuitState": self.breaker.state,
+            "circuitOpened": self.breaker.times_opened,
+        }
+
+    def backoff_seconds(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (1-based), with full jitter."""
+        ceiling = min(self.retry_max_seconds, self.retry_base_seconds * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._attempt(job)
+            except Exception as e:
+                logger.error(f"Dispatch worker error for session {job.session_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _attempt(self, job: DispatchJob) -> None:
+        if job.cancelled:
+            return
+        job.attempts += 1
+        if not self.breaker.allow():
+            self._stats["shortCircuited"] += 1
+            error: Exception = CircuitOpenError("dispatch circuit is open")
+        else:
+            try:
+                await job.send()
+            except Exception as e:
+                self.breaker.record_failure()
+                error = e
+            else:
+                self.breaker.record_success()
+                self._stats["dispatched"] += 1
+                self._pending.pop(job.session_id, None)
+                if self._on_dispatched is not None:
+                    await self._on_dispatched(job.session_id)
+                return
+
+        if job.attempts < self.max_attempts and is_retryable(error):
+            self._stats["retried"] += 1
+            delay = self.backoff_seconds(job.attempts)
+            retry_after = retry_after_seconds(error)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, self.retry_max_seconds))
+            task = asyncio.create_task(self._retry_later(job, delay))
+            self._retries.add(task)
+            task.add_done_callback(self._retries.discard)
+            return
+
+        self._pending.pop(job.session_id, None)
+        self._stats["failed"] += 1
+        logger.error(
+            f"Giving up dispatching session {job.session_id} "
+            f"after {job.attempts} attempts: {error}"
+        )
+        await self._on_failed(job.session_id)
+
+    async def _retry_later(self, job: DispatchJob, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._queue.put(job)
+
+
+def _create_dispatch_pipeline() -> DispatchPipeline:
+    """Create the global dispatch pipeline from runtime configuration."""
+    from src.runtime.session_manager import session_manager
+    runtime_config = get_config().runtime
+    return DispatchPipeline(
+        on_failed=session_manager.fail_session,
+        on_dispatched=session_manager.activate_session,
+        workers=runtime_config.dispatch_workers,
+        max_queue_size=runtime_config.dispatch_queue_size,
+        max_attempts=runtime_config.dispatch_max_attempts,
+        retry_base_seconds=runtime_config.dispatch_retry_base_seconds,
+        retry_max_seconds=runtime_config.dispatch_retry_max_seconds,
+        breaker=CircuitBreaker(
+            failure_threshold=runtime_config.dispatch_breaker_failure_threshold,
+            reset_timeout_seconds=runtime_config.dispatch_breaker_reset_seconds,
+        ),
+    )
+
+
+# Global instance
+dispatch_pipeline = _create_dispatch_pipeline()
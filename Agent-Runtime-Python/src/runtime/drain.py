@@ -0,0 +1,195 @@
+"""Drain mode - stops taking new sessions ahead of a shutdown."""
+
+import asyncio
+import logging
+import signal
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from src.config.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class DrainingError(ValueError):
+    """Raised when a session is requested while the runtime is draining."""
+
+    def __init__(self, retry_after_seconds: int):
+        super().__init__("Runtime is draining; retry the request")
+        self.retry_after_seconds = retry_after_seconds
+
+
+class DrainController:
+    """Drain state for this process.
+
+    While draining, ``/ready`` fails so the load balancer stops routing
+    here, and ``check`` refuses new sessions with a retry hint. Sessions
+    already running are left to finish: ``wait`` returns once none are
+    left or ``deadline_seconds`` after the drain began, whichever is first.
+
+    States: ``serving``, ``draining``, ``drained`` (no sessions left) and
+    ``expired`` (deadline passed with sessions still live).
+    """
+
+    def __init__(
+        self,
+        live_sessions: Callable[[], int],
+        deadline_seconds: float = 25.0,
+        retry_after_seconds: int = 5,
+        poll_seconds: float = 0.5,
+    ):
+        self._live_sessions = live_sessions
+        self.deadline_seconds = deadline_seconds
+        self.retry_after_seconds = retry_after_seconds
+        self.poll_seconds = poll_seconds
+        self.state = "serving"
+        self.reason: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self._started: float = 0.0
+        self._deadline: float = 0.0
+        self._monitor: Optional[asyncio.Task] = None
+        self._signalled = False
+        self._refused = 0
+
+    @property
+    def draining(self) -> bool:
+        return self.state != "serving"
+
+    def start(self, reason: str = "admin", deadline_seconds: Optional[float] = None) -> bool:
+        """Enter drain mode. Returns False if already draining."""
+        if self.draining:
+            return False
+        deadline_seconds = (
+            self.deadline_seconds if deadline_seconds is None else deadline_seconds
+        )
+        self.state = "draining"
+        self.reason = reason
+        self.started_at = datetime.utcnow()
+        self._started = time.monotonic()
+        self._deadline = self._started + deadline_seconds
+        logger.info(
+            f"Draining ({reason}): {self._live_sessions()} live sessions, "
+            f"deadline {deadline_seconds}s"
+        )
+        # Moves the state on to drained/expired even if nobody waits
+        self._monitor = asyncio.create_task(self.wait())
+        return True
+
+    def resume(self) -> bool:
+        """Leave drain mode and take sessions again. Returns False if not draining."""
+        if not self.draining:
+            return False
+        if self._monitor and not self._monitor.done():
+            self._monitor.cancel()
+        self._monitor = None
+        self.state = "serving"
+        self.reason = None
+        self.started_at = None
+        logger.info("Drain cancelled; accepting sessions again")
+        return True
+
+    def check(self) -> None:
+        """Raise DrainingError if new sessions are not being accepted."""
+        if self.draining:
+            self._refused += 1
+            raise DrainingError(self.retry_after_seconds)
+
+    async def wait(self) -> int:
+        """Wait for live sessions to finish or the deadline to pass.
+
+        Returns the number of sessions still live.
+        """
+        while True:
+            remaining = self._live_sessions()
+            if not self.draining:
+                return remaining
+            if remaining == 0:
+                if self.state == "draining":
+                    self.state = "drained"
+                    logger.info(
+                        f"Drained in {time.monotonic() - self._started:.1f}s"
+                    )
+                return 0
+            time_left = self._deadline - time.monotonic()
+            if time_left <= 0:
+                if self.state == "draining":
+                    self.state = "expired"
+                    logger.warning(
+                        f"Drain deadline passed with {remaining} sessions still live"
+                    )
+                return remaining
+            await asyncio.sleep(min(self.poll_seconds, time_left))
+
+    def install_signal_handler(self, sig: int = signal.SIGTERM) -> bool:
+        """Drain on ``sig`` before passing it to the handler it replaces.
+
+        The previous handler (uvicorn's, which starts shutdown) runs once
+        the drain finishes; a second signal is passed on straight away.
+        Returns False when not on the main thread, where handlers cannot
+        be set.
+        """
+        loop = asyncio.get_running_loop()
+        previous = signal.getsignal(sig)
+
+        def handle(signum, frame):
+            loop.call_soon_threadsafe(self._on_signal, signum, frame, previous)
+
+        try:
+            signal.signal(sig, handle)
+        except ValueError:
+            return False
+        return True
+
+    def _on_signal(self, signum, frame, previous) -> None:
+        if self._signalled:
+            _forward_signal(signum, frame, previous)
+            return
+        self._signalled = True
+        self.start(reason=signal.Signals(signum).name)
+        asyncio.create_task(self._drain_then_forward(signum, frame, previous))
+
+    async def _drain_then_forward(self, signum, frame, previous) -> None:
+        await self.wait()
+        _forward_signal(signum, frame, previous)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get drain state, live session count and refusals."""
+        elapsed = time.monotonic() - self._started if self.draining else None
+        return {
+            "state": self.state,
+            "reason": self.reason,
+            "liveSessions": self._live_sessions(),
+            "startedAt": self.started_at.isoformat() + "Z" if self.started_at else None,
+            "elapsedSeconds": round(elapsed, 3) if elapsed is not None else None,
+            "deadlineSeconds": (
+                round(self._deadline - self._started, 3)
+                if self.draining else self.deadline_seconds
+            ),
+            "retryAfterSeconds": self.retry_after_seconds,
+            "refused": self._refused,
+        }
+
+
+def _forward_signal(signum, frame, previous) -> None:
+    """Hand a signal to the handler that was installed before ours."""
+    if callable(previous):
+        previous(signum, frame)
+    elif previous == signal.SIG_DFL:
+        signal.signal(signum, signal.SIG_DFL)
+        signal.raise_signal(signum)
+
+
+def _create_drain_controller() -> DrainController:
+    """Create the global drain controller from runtime configuration."""
+    from src.runtime.session_manager import session_manager
+    runtime_config = get_config().runtime
+    return DrainController(
+        live_sessions=session_manager.live_session_count,
+        deadline_seconds=runtime_config.drain_deadline_seconds,
+        retry_after_seconds=runtime_config.drain_retry_after_seconds,
+    )
+
+
+# Global instance
+drain_controller = _create_drain_controller()
@@ -0,0 +1,208 @@
+"""Runtime heartbeat - keeps this pod's agent_runtime_instances row current."""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from src.config.config import get_config
+from src.database.db import AsyncSessionLocal
+from src.database.operations import (
+    mark_stale_runtime_instances,
+    record_runtime_heartbeat,
+)
+from src.runtime.agent_manager import AgentManager, agent_manager
+from src.runtime.session_manager import SessionManager, session_manager
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessSampler:
+    """Samples this process's CPU and resident memory from /proc.
+
+    Each sample is two small file reads. CPU is reported as the percentage
+    of one core used since the previous sample. Where /proc is missing
+    (e.g. macOS) both figures are None.
+    """
+
+    def __init__(self, proc_dir: str = "/proc/self"):
+        self.proc_dir = proc_dir
+        self._ticks_per_second = os.sysconf("SC_CLK_TCK")
+        self._page_size = os.sysconf("SC_PAGE_SIZE")
+        self._last: Optional[Tuple[float, float]] = None
+
+    def _cpu_seconds(self) -> float:
+        with open(os.path.join(self.proc_dir, "stat")) as f:
+            # The command name may contain spaces; fields resume after ")"
+            fields = f.read().rsplit(")", 1)[1].split()
+        # utime and stime are fields 14 and 15 of the full line
+        return (int(fields[11]) + int(fields[12])) / self._ticks_per_second
+
+    def rss_bytes(self) -> Optional[int]:
+        """Resident set size in bytes."""
+        try:
+            with open(os.path.join(self.proc_dir, "statm")) as f:
+                return int(f.read().split()[1]) * self._page_size
+        except (OSError, IndexError, ValueError):
+            return None
+
+    def cpu_percent(self) -> Optional[float]:
+        """CPU used since the last call, as a percentage of one core."""
+        try:
+            cpu_seconds = self._cpu_seconds()
+        except (OSError, IndexError, ValueError):
+            return None
+        now = time.monotonic()
+        last, self._last = self._last, (now, cpu_seconds)
+        if last is None or now <= last[0]:
+            return 0.0
+        return 100.0 * (cpu_seconds - last[1]) / (now - last[0])
+
+
+class HeartbeatWriter:
+    """Upserts this pod's runtime instance row every ``interval_seconds``.
+
+    Each beat writes CPU, RSS and live counts, then marks instances that
+    have not beaten for ``stale_after_seconds`` as dead. Beats are
+    best-effort: a failed write is logged and retried on the next tick.
+    """
+
+    def __init__(
+        self,
+        agents: AgentManager,
+        sessions: SessionManager,
+        pod_name: str,
+        namespace: Optional[str] = None,
+        url: Optional[str] = None,
+        session_factory=AsyncSessionLocal,
+        interval_seconds: float = 5.0,
+        stale_after_seconds: float = 30.0,
+        sampler: Optional[ProcessSampler] = None,
+    ):
+        self._agents = agents
+        self._sessions = sessions
+        self.pod_name = pod_name
+        self.namespace = namespace
+        # Where other replicas forward sessions placed on this pod
+        self.url = url
+        self._session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self._sampler = sampler or ProcessSampler()
+        self._task: Optional[asyncio.Task] = None
+        # Sessions created by this process already added to the stored total
+        self._sessions_reported = 0
+        self._last_sample: Dict[str, Any] = {}
+        self._stats: Dict[str, Any] = {
+            "beats": 0,
+            "failures": 0,
+            "markedDead": 0,
+            "lastBeatAt": None,
+            "lastError": None,
+        }
+
+    def start(self) -> None:
+        """Start beating in the background."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop beating and record this instance as stopped."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        await self.beat(status="stopped")
+
+    def sample(self, status: Optional[str] = None) -> Dict[str, Any]:
+        """Collect the figures written by one heartbeat."""
+        from src.runtime.drain import drain_controller
+        if status is None:
+            status = "draining" if drain_controller.draining else "running"
+        cpu_percent = self._sampler.cpu_percent()
+        rss_bytes = self._sampler.rss_bytes()
+        capacity = self._agents.get_capacity_stats()
+        return {
+            "status": status,
+            "cpu_usage": round(cpu_percent) if cpu_percent is not None else None,
+            "memory_usage": rss_bytes // (1024 * 1024) if rss_bytes is not None else None,
+            "active_agent_count": len(capacity),
+            "sessions_handled_delta": (
+                self._sessions.sessions_created - self._sessions_reported
+            ),
+            "metadata": {
+                "cpuPercent": round(cpu_percent, 2) if cpu_percent is not None else None,
+                "rssBytes": rss_bytes,
+                "liveSessions": self._sessions.live_session_count(),
+                "sessionCapacity": sum(stats["maxSessions"] for stats in capacity),
+                "url": self.url,
+                "agentIds": [stats["agentId"] for stats in capacity],
+            },
+        }
+
+    async def beat(self, status: Optional[str] = None) -> bool:
+        """Write one heartbeat and mark stale instances dead."""
+        sample = self.sample(status)
+        self._last_sample = sample
+        try:
+            async with self._session_factory() as db:
+                runtime_instance_id = await record_runtime_heartbeat(
+                    db, self.pod_name, self.namespace, **sample
+                )
+                stale_before = datetime.utcnow() - timedelta(
+                    seconds=self.stale_after_seconds
+                )
+                dead = await mark_stale_runtime_instances(db, stale_before)
+                await db.commit()
+        except Exception as e:
+            self._stats["failures"] += 1
+            self._stats["lastError"] = str(e)
+            logger.warning(f"Runtime heartbeat failed: {e}")
+            return False
+
+        self._sessions_reported += sample["sessions_handled_delta"]
+        if self._sessions.runtime_instance_id is None:
+            self._sessions.runtime_instance_id = runtime_instance_id
+        if dead:
+            self._stats["markedDead"] += len(dead)
+            logger.warning(f"Marked stale runtime instances dead: {', '.join(dead)}")
+        self._stats["beats"] += 1
+        self._stats["lastBeatAt"] = datetime.utcnow().isoformat() + "Z"
+        self._stats["lastError"] = None
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            await self.beat()
+            await asyncio.sleep(self.interval_seconds)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get heartbeat counters and the last figures written."""
+        return {
+            **self._stats,
+            "podName": self.pod_name,
+            "intervalSeconds": self.interval_seconds,
+            "lastSample": self._last_sample,
+        }
+
+
+def _create_heartbeat_writer() -> HeartbeatWriter:
+    """Create the global heartbeat writer from runtime configuration."""
+    from src.runtime.placement import advertised_url
+    runtime_config = get_config().runtime
+    return HeartbeatWriter(
+        agent_manager,
+        session_manager,
+        pod_name=runtime_config.pod_name,
+        namespace=runtime_config.pod_namespace,
+        url=advertised_url(),
+        interval_seconds=runtime_config.heartbeat_interval_seconds,
+        stale_after_seconds=runtime_config.heartbeat_stale_seconds,
+    )
+
+
+# Global instance
+heartbeat_writer = _create_heartbeat_writer()
@@ -0,0 +1,361 @@
+"""Session placement - sends session creation to the least-loaded replica."""
+
+import asyncio
+import hashlib
+import hmac
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, NamedTuple, Optional
+
+from src.config.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Set on forwarded requests so the receiving pod handles them itself
+FORWARDED_HEADER = "X-Agent-Runtime-Forwarded-By"
+# Shared placement secret proving a forwarded request came from a replica
+FORWARD_SECRET_HEADER = "X-Agent-Runtime-Forward-Secret"
+
+
+class PlacementForwardError(Exception):
+    """The replica a request was forwarded to refused it (4xx other than 429)."""
+
+    def __init__(self, status: int, detail: Any, retry_after: Optional[str] = None):
+        super().__init__(str(detail))
+        self.status = status
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class PlacementUnavailableError(Exception):
+    """The chosen replica could not be reached, was busy (429) or failed (5xx)."""
+
+
+class RuntimeNode(NamedTuple):
+    """One replica's load, as last reported by its heartbeat."""
+    pod_name: str
+    url: str
+    live_sessions: int
+    capacity: int
+    cpu_percent: float
+    agent_ids: FrozenSet[int]
+
+    @property
+    def utilization(self) -> float:
+        """Share of session capacity in use (1.0 when there is none)."""
+        return self.live_sessions / self.capacity if self.capacity else 1.0
+
+
+def node_from_instance(instance) -> Optional[RuntimeNode]:
+    """Read a RuntimeNode from an agent_runtime_instances row.
+
+    Rows without a URL in their heartbeat metadata cannot be forwarded to
+    and are skipped.
+    """
+    metadata = instance.metadata_json or {}
+    url = metadata.get("url")
+    if not url:
+        return None
+    return RuntimeNode(
+        pod_name=instance.pod_name,
+        url=url.rstrip("/"),
+        live_sessions=metadata.get("liveSessions") or 0,
+        capacity=metadata.get("sessionCapacity") or 0,
+        cpu_percent=metadata.get("cpuPercent") or 0.0,
+        agent_ids=frozenset(metadata.get("agentIds") or ()),
+    )
+
+
+def _hash_score(agent_id: int, pod_name: str) -> int:
+    digest = hashlib.blake2b(f"{agent_id}:{pod_name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def preferred_pods(agent_id: int, pod_names: List[str], count: int) -> List[str]:
+    """Pick an agent's preferred pods by rendezvous (highest-random-weight) hashing.
+
+    Each agent maps to the same pods for as long as they are up; adding or
+    removing a pod only moves the agents that ranked it among their top
+    ``count``.
+    """
+    return sorted(
+        pod_names, key=lambda pod_name: _hash_score(agent_id, pod_name), reverse=True
+    )[:count]
+
+
+# Returns the replicas currently able to take sessions
+NodeLoader = Callable[[], Awaitable[List[RuntimeNode]]]
+# Returns the pod name owning a live session, or None
+OwnerLoader = Callable[[str], Awaitable[Optional[str]]]
+
+
+class SessionPlacer:
+    """Chooses which replica creates a session and forwards it there.
+
+    Replica load comes from heartbeats (see ``HeartbeatWriter``) and is
+    cached for ``refresh_seconds``; placements made in between are counted
+    against the cached figures so bursts do not all land on one pod. An
+    agent's candidates are the ``preferred_pods`` replicas it hashes to
+    among those that have it registered and have free capacity; the least
+    utilized candidate wins, except that this pod keeps the session when
+    it is a candidate within ``local_slack`` of the best.
+
+    Forwarded requests carry ``secret``, which the receiving replica checks
+    with ``is_trusted``; without a secret nothing is forwarded. Ending a
+    session that lives on another replica is forwarded to its owner, found
+    with ``owner_loader``, so the owner frees the session's slot.
+    """
+
+    def __init__(
+        self,
+        pod_name: str,
+        node_loader: NodeLoader,
+        preferred_pods: int = 3,
+        refresh_seconds: float = 2.0,
+        local_slack: float = 0.1,
+        forward_timeout_seconds: float = 5.0,
+        api_key: Optional[str] = None,
+        secret: Optional[str] = None,
+        owner_loader: Optional[OwnerLoader] = None,
+    ):
+        self.pod_name = pod_name
+        self._node_loader = node_loader
+        self.preferred_pods = preferred_pods
+        self.refresh_seconds = refresh_seconds
+        self.local_slack = local_slack
+        self.forward_timeout_seconds = forward_timeout_seconds
+        self._api_key = api_key
+        self._secret = secret
+        self._owner_loader = owner_loader
+        self._nodes: Dict[str, RuntimeNode] = {}
+        self._loaded_at = 0.0
+        self._load: Optional[asyncio.Task] = None
+        self._http_session = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[str, int] = {
+            "placedLocally": 0,
+            "forwarded": 0,
+            "forwardFailed": 0,
+            "endsForwarded": 0,
+            "refreshFailed": 0,
+        }
+
+    async def nodes(self) -> List[RuntimeNode]:
+        """Replicas able to take sessions, refreshed every ``refresh_seconds``."""
+        if time.monotonic() - self._loaded_at >= self.refresh_seconds:
+            # Concurrent callers share one load
+            if self._load is None or self._load.done():
+                self._load = asyncio.create_task(self._refresh())
+            await asyncio.shield(self._load)
+        return list(self._nodes.values())
+
+    async def _refresh(self) -> None:
+        try:
+            nodes = await self._node_loader()
+        except Exception as e:
+            # Keep the last known nodes; placement degrades to local creation
+            self._stats["refreshFailed"] += 1
+            logger.warning(f"Failed to load runtime replicas for placement: {e}")
+        else:
+            self._nodes = {node.pod_name: node for node in nodes}
+        self._loaded_at = time.monotonic()
+
+    async def choose(self, agent_id: int) -> Optional[RuntimeNode]:
+        """Pick the replica that should create a session for ``agent_id``.
+
+        Returns None when no replica is known to be able to take it, or
+        when no placement secret is configured.
+        """
+        if not self._secret:
+            return None
+        eligible = [
+            node for node in await self.nodes()
+            if agent_id in node.agent_ids and node.utilization < 1.0
+        ]
+        if not eligible:
+            return None
+        preferred = set(preferred_pods(
+            agent_id, [node.pod_name for node in eligible], self.preferred_pods
+        ))
+        candidates = [node for node in eligible if node.pod_name in preferred]
+        best = min(candidates, key=lambda node: (node.utilization, node.cpu_percent))
+        local = self._nodes.get(self.pod_name)
+        if (
+            local is not None
+            and local.pod_name in preferred
+            and local.utilization <= best.utilization + self.local_slack
+        ):
+            best = local
+        # Count the session now rather than waiting for the next heartbeat
+        self._nodes[best.pod_name] = best._replace(live_sessions=best.live_sessions + 1)
+        return best
+
+    def placed_locally(self) -> None:
+        """Record a session created on this pod."""
+        self._stats["placedLocally"] += 1
+
+    def is_trusted(self, secret: Optional[str]) -> bool:
+        """Whether a forwarded request's secret matches this pod's placement secret."""
+        if not self._secret or secret is None:
+            return False
+        return hmac.compare_digest(secret.encode(), self._secret.encode())
+
+    async def forward(self, node: RuntimeNode, payload: Dict[str, Any]) -> Dict[str, str]:
+        """Create a session on another replica. Returns its session info.
+
+        Raises PlacementUnavailableError when the replica is unreachable,
+        busy or failing, so the caller can create the session itself.
+        """
+        body = await self._post(node, "/api/sessions/create", payload)
+        self._stats["forwarded"] += 1
+        return body["session"]
+
+    async def forward_end(self, session_id: str) -> bool:
+        """End a session on the replica that owns it.
+
+        Returns False when the session should be ended here instead: its
+        owner is this pod, unknown, or no longer alive.
+        """
+        if not self._secret or self._owner_loader is None:
+            return False
+        owner = await self._owner_loader(session_id)
+        if owner is None or owner == self.pod_name:
+            return False
+        await self.nodes()
+        node = self._nodes.get(owner)
+        if node is None:
+            return False
+        await self._post(node, f"/api/sessions/{session_id}/end", None)
+        self._stats["endsForwarded"] += 1
+        return True
+
+    async def _post(
+        self, node: RuntimeNode, path: str, payload: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Send a forwarded request to another replica and return its body."""
+        import aiohttp
+
+        headers = {FORWARDED_HEADER: self.pod_name, FORWARD_SECRET_HEADER: self._secret}
+        if self._api_key:
+            headers["Authorization"] = f"Bearer {self._api_key}"
+        try:
+            async with self._http().post(
+                f"{node.url}{path}", json=payload, headers=headers
+            ) as response:
+                body = await response.json(content_type=None)
+                status = response.status
+                retry_after = response.headers.get("Retry-After")
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self._drop(node)
+            raise PlacementUnavailableError(f"{node.pod_name}: {e}")
+
+        if status < 400:
+            return body
+        if status == 429:
+            # Over its admission limits; leave it in rotation for other agents
+            self._stats["forwardFailed"] += 1
+            raise PlacementUnavailableError(f"{node.pod_name} returned {status}")
+        if status < 500:
+            raise PlacementForwardError(status, body.get("detail", body), retry_after)
+        # Draining or full: stop sending it sessions until the next refresh
+        self._drop(node)
+        raise PlacementUnavailableError(f"{node.pod_name} returned {status}")
+
+    def _drop(self, node: RuntimeNode) -> None:
+        self._stats["forwardFailed"] += 1
+        self._nodes.pop(node.pod_name, None)
+
+    def _http(self):
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = self._http_session
+        if session is None or session.closed or self._http_loop is not loop:
+            session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.forward_timeout_seconds)
+            )
+            self._http_session = session
+            self._http_loop = loop
+        return session
+
+    async def close(self) -> None:
+        """Close the HTTP client used for forwarding."""
+        session, self._http_session = self._http_session, None
+        if session is not None and not session.closed and self._http_loop is asyncio.get_running_loop():
+            await session.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get placement counters and the replica loads last seen."""
+        return {
+            **self._stats,
+            "podName": self.pod_name,
+            "nodes": [
+                {
+                    "podName": node.pod_name,
+                    "liveSessions": node.live_sessions,
+                    "capacity": node.capacity,
+                    "utilization": round(node.utilization, 3),
+                    "cpuPercent": node.cpu_percent,
+                }
+                for node in self._nodes.values()
+            ],
+        }
+
+
+def advertised_url() -> str:
+    """Base URL other replicas use to reach this pod."""
+    runtime_config = get_config().runtime
+    if runtime_config.advertise_url:
+        return runtime_config.advertise_url
+    host = runtime_config.pod_ip or runtime_config.pod_name
+    return f"http://{host}:{runtime_config.port}"
+
+
+async def load_runtime_nodes() -> List[RuntimeNode]:
+    """Load replicas with a fresh heartbeat from the read database."""
+    from src.database.db import AsyncReadSessionLocal
+    from src.database.operations import list_live_runtime_instances
+    heartbeat_after = datetime.utcnow() - timedelta(
+        seconds=get_config().runtime.heartbeat_stale_seconds
+    )
+    async with AsyncReadSessionLocal() as db:
+        instances = await list_live_runtime_instances(db, heartbeat_after)
+    return [node for node in map(node_from_instance, instances) if node is not None]
+
+
+async def load_session_owner(session_id: str) -> Optional[str]:
+    """Load the pod owning a live session from the primary database.
+
+    The primary is read because the owner may have created the session
+    moments ago.
+    """
+    from src.database.db import AsyncSessionLocal
+    from src.database.operations import get_session_owner_pod
+    async with AsyncSessionLocal() as db:
+        return await get_session_owner_pod(db, session_id)
+
+
+def _create_session_placer() -> SessionPlacer:
+    """Create the global session placer from runtime configuration."""
+    runtime_config = get_config().runtime
+    if runtime_config.placement and not runtime_config.placement_secret:
+        logger.warning(
+            "Placement is enabled but no placement secret is set; "
+            "sessions will not be forwarded"
+        )
+    return SessionPlacer(
+        pod_name=runtime_config.pod_name,
+        node_loader=load_runtime_nodes,
+        preferred_pods=runtime_config.placement_preferred_pods,
+        refresh_seconds=runtime_config.placement_refresh_seconds,
+        local_slack=runtime_config.placement_local_slack,
+        forward_timeout_seconds=runtime_config.placement_forward_timeout_seconds,
+        api_key=runtime_config.api_key,
+        secret=runtime_config.placement_secret,
+        owner_loader=load_session_owner,
+    )
+
+
+# Global instance
+session_placer = _create_session_placer()
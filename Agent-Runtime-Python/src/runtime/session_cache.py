@@ -0,0 +1,99 @@
+"""Session Cache - bounded in-memory cache for session state."""
+
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+
+class SessionCache:
+    """LRU cache with per-entry TTL and pinned entries.
+
+    Pinned entries (live sessions owned by this process) are never evicted
+    or expired. Unpinned entries (sessions loaded from the database) expire
+    after ``ttl_seconds`` and are evicted least-recently-used first once
+    more than ``max_size`` are held.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl_seconds: float = 300.0):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._pinned: Dict[str, Any] = {}
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._stats: Dict[str, int] = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "expirations": 0,
+        }
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, counting the hit or miss."""
+        value = self._pinned.get(key)
+        if value is not None:
+            self._stats["hits"] += 1
+            return value
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return value
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Get a cached value without touching LRU order or counters."""
+        value = self._pinned.get(key)
+        if value is not None:
+            return value
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[1]:
+            return None
+        return entry[0]
+
+    def put(self, key: str, value: Any, pinned: bool = False) -> None:
+        """Cache a value, pinned or subject to TTL and LRU eviction."""
+        if pinned:
+            self._entries.pop(key, None)
+            self._pinned[key] = value
+            return
+
+        self._pinned.pop(key, None)
+        self._entries[key] = (value, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def pop(self, key: str) -> Optional[Any]:
+        """Remove and return a cached value."""
+        value = self._pinned.pop(key, None)
+        if value is not None:
+            return value
+        entry = self._entries.pop(key, None)
+        return entry[0] if entry else None
+
+    def __contains__(self, key: str) -> bool:
+        return self.peek(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._pinned) + len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache counters and current size."""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._stats,
+            "hitRate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "size": len(self),
+            "pinned": len(self._pinned),
+            "maxSize": self.max_size,
+        }
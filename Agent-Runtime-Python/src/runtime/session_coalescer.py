@@ -0,0 +1,125 @@
+"""Session Change Coalescer - batches live status and participant updates."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from src.database.models import TERMINAL_SESSION_STATUSES
+from src.runtime.session_record import SessionRecord
+
+logger = logging.getLogger(__name__)
+
+# Persists the current status and participant count of the given sessions
+WriteCallback = Callable[[List[SessionRecord]], Awaitable[None]]
+
+
+class SessionChangeCoalescer:
+    """Persists status and participant-count changes after a short window.
+
+    The first change to a session opens a window of ``window_seconds``;
+    further changes inside it are absorbed, and when it closes the
+    session's current state is written once. Sessions whose windows close
+    together are written in one batch. The window is the same for every
+    session, so deadlines are kept in a FIFO queue.
+    """
+
+    def __init__(
+        self,
+        write: WriteCallback,
+        window_seconds: float = 0.5,
+        batch_size: int = 500,
+    ):
+        self._write = write
+        self.window_seconds = window_seconds
+        self.batch_size = batch_size
+        self._pending: Dict[str, SessionRecord] = {}
+        self._deadlines: Deque[Tuple[float, str]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stats: Dict[str, int] = {
+            "changes": 0,
+            "coalesced": 0,
+            "written": 0,
+            "batches": 0,
+            "failedBatches": 0,
+        }
+
+    def record(self, session: SessionRecord) -> None:
+        """Note that a session's status or participant count changed."""
+        self.start()
+        self._stats["changes"] += 1
+        if session.session_id in self._pending:
+            self._stats["coalesced"] += 1
+            return
+        self._pending[session.session_id] = session
+        self._deadlines.append(
+            (time.monotonic() + self.window_seconds, session.session_id)
+        )
+        self._wakeup.set()
+
+    def discard(self, session_id: str) -> None:
+        """Drop a pending change (e.g. the session ended and is written anyway)."""
+        self._pending.pop(session_id, None)
+
+    def start(self) -> None:
+        """Start the background flusher if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def flush(self) -> None:
+        """Write every pending change now."""
+        while self._deadlines:
+            await self._write_batch(self._take(due_before=None))
+
+    async def close(self) -> None:
+        """Write pending changes and stop the background flusher."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get coalescing counters and the number of pending sessions."""
+        return {**self._stats, "pending": len(self._pending)}
+
+    def _take(self, due_before: Optional[float]) -> List[SessionRecord]:
+        """Pop up to batch_size pending sessions whose window has closed."""
+        batch: List[SessionRecord] = []
+        while self._deadlines and len(batch) < self.batch_size:
+            deadline, session_id = self._deadlines[0]
+            if due_before is not None and deadline > due_before:
+                break
+            self._deadlines.popleft()
+            session = self._pending.pop(session_id, None)
+            # Ended and failed sessions are persisted by the end path
+            if session is not None and session.status not in TERMINAL_SESSION_STATUSES:
+                batch.append(session)
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            if not self._deadlines:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            delay = self._deadlines[0][0] - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._write_batch(self._take(due_before=time.monotonic()))
+
+    async def _write_batch(self, batch: List[SessionRecord]) -> None:
+        if not batch:
+            return
+        try:
+            await self._write(batch)
+            self._stats["batches"] += 1
+            self._stats["written"] += len(batch)
+        except Exception as e:
+            self._stats["failedBatches"] += 1
+            logger.error(f"Failed to persist {len(batch)} session changes: {e}")
@@ -0,0 +1,73 @@
+"""Session ID generation."""
+
+import os
+import threading
+import time
+from typing import Callable, Dict
+
+from nanoid import generate as nanoid_generate
+
+# Crockford base32: URL-safe, and digits sort before uppercase letters in
+# both byte order and common collations, so IDs sort by creation time.
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_TIME_CHARS = 10     # 48-bit millisecond timestamp
+_RANDOM_CHARS = 16   # 80 random bits
+_RANDOM_BITS = 80
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+class TimeOrderedIdGenerator:
+    """Generates 26-character ULID-style IDs.
+
+    The first 10 characters encode the creation time in milliseconds and
+    the last 16 are random, so new IDs land at the right edge of a B-tree
+    index instead of at random pages. IDs generated within the same
+    millisecond increment the random part, so they stay strictly ordered.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_random = 0
+
+    def __call__(self) -> str:
+        with self._lock:
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms <= self._last_ms:
+                # Same millisecond (or clock moved back): stay monotonic
+                now_ms = self._last_ms
+                random_part = self._last_random + 1
+                if random_part >> _RANDOM_BITS:
+                    now_ms += 1
+                    random_part = int.from_bytes(os.urandom(10), "big")
+            else:
+                random_part = int.from_bytes(os.urandom(10), "big")
+            self._last_ms = now_ms
+            self._last_random = random_part
+        return _encode(now_ms, _TIME_CHARS) + _encode(random_part, _RANDOM_CHARS)
+
+
+time_ordered_id = TimeOrderedIdGenerator()
+
+SESSION_ID_GENERATORS: Dict[str, Callable[[], str]] = {
+    "nanoid": nanoid_generate,
+    "ulid": time_ordered_id,
+}
+
+
+def get_session_id_generator(name: str) -> Callable[[], str]:
+    """Get the session ID generator for a configured format name."""
+    try:
+        return SESSION_ID_GENERATORS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown session ID format {name!r}; "
+            f"expected one of {sorted(SESSION_ID_GENERATORS)}"
+        ) from None
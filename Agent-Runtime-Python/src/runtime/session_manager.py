@@ -1,24 +1,89 @@
 """Session Manager - manages agent sessions."""
 
-from typing import Dict, Any, Set, Optional, List
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Any, Set, Optional, List, Tuple
 from datetime import datetime
-from sqlalchemy.ext.asyncio import AsyncSession
 from nanoid import generate as nanoid_generate
 
-from src.database.db import get_db
+from src.config.config import get_config
+from src.database.models import TERMINAL_SESSION_STATUSES
 from src.database.operations import (
     create_session as db_create_session,
-    update_session_status as db_update_session_status,
-    end_session as db_end_session,
+    update_session_states as db_update_session_states,
+    end_sessions as db_end_sessions,
+    end_sessions_at as db_end_sessions_at,
+    rollup_session_metrics as db_rollup_session_metrics,
 )
+from src.runtime.session_cache import SessionCache
+from src.runtime.session_coalescer import SessionChangeCoalescer
+from src.runtime.session_ids import get_session_id_generator
+from src.runtime.session_reaper import SessionReaper
+from src.runtime.session_record import SessionRecord
+from src.runtime.session_writer import SessionWriter
 
 
 class SessionManager:
-    """Manages agent sessions."""
+    """Manages agent sessions.
+
+    When a SessionWriter is supplied, lifecycle writes are queued and
+    persisted in the background instead of awaited inline.
+    
+    Database reads go to the read replica, except for sessions this process
+    wrote within the last ``read_your_writes_seconds``, which are read from
+    the primary so replica lag never hides them.
+    
+    Live sessions are pinned in the session cache; sessions loaded from the
+    database are cached with a TTL and evicted least-recently-used first.
+    IDs the database doesn't know are remembered in a short-lived negative
+    cache, and concurrent lookups of the same ID share one query.
     
-    def __init__(self):
-        self._sessions: Dict[str, Dict[str, Any]] = {}
+    Live sessions are also indexed by tenant, with per-tenant counts by
+    status kept up to date on every transition. When a SessionReaper is
+    supplied, live sessions still connecting past their deadline (their
+    agent was never dispatched) are ended in bulk.
+    
+    Status and participant-count changes short of ending are persisted
+    after ``coalesce_window_seconds``, so a burst of changes to one session
+    becomes one write and concurrent sessions share a batch.
+    """
+    
+    def __init__(
+        self,
+        writer: Optional[SessionWriter] = None,
+        read_your_writes_seconds: float = 10.0,
+        cache: Optional[SessionCache] = None,
+        negative_cache: Optional[SessionCache] = None,
+        id_generator: Callable[[], str] = nanoid_generate,
+        reaper: Optional[SessionReaper] = None,
+        coalesce_window_seconds: Optional[float] = 0.5,
+    ):
+        self._generate_id = id_generator
+        self._coalescer = None
+        if coalesce_window_seconds is not None:
+            self._coalescer = SessionChangeCoalescer(
+                self._persist_states, window_seconds=coalesce_window_seconds
+            )
+        self._reaper = reaper
+        self._sessions = cache or SessionCache()
+        self._missing = negative_cache or SessionCache(ttl_seconds=5.0)
+        self._loads: Dict[str, asyncio.Task] = {}
+        self._load_stats: Dict[str, int] = {
+            "negativeHits": 0,
+            "dbLoads": 0,
+            "coalescedLoads": 0,
+        }
         self._agent_sessions: Dict[int, Set[str]] = {}
+        self._tenant_sessions: Dict[int, Set[str]] = {}
+        self._tenant_status_counts: Dict[int, Dict[str, int]] = {}
+        self._writer = writer
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._recent_writes: "OrderedDict[str, float]" = OrderedDict()
+        # Set at startup once this process is registered as a runtime instance
+        self.runtime_instance_id: Optional[int] = None
+        # Sessions created by this process since it started
+        self.sessions_created = 0
     
     async def create_session(
         self,
@@ -26,30 +91,64 @@ class SessionManager:
         tenant_id: int,
         room_name: str,
         runtime_instance_id: Optional[int] = None
-    ) -> Dict[str, Any]:
+    ) -> SessionRecord:
         """Create a new session."""
-        session_id = nanoid_generate()
-        session: Dict[str, Any] = {
-            "sessionId": session_id,
-            "agentId": agent_id,
-            "tenantId": tenant_id,
-            "roomName": room_name,
-            "status": "connecting",
-            "startedAt": datetime.utcnow(),
-            "participantCount": 0,
-        }
+        if runtime_instance_id is None:
+            runtime_instance_id = self.runtime_instance_id
+        session_id = self._generate_id()
+        session = SessionRecord(
+            session_id=session_id,
+            agent_id=agent_id,
+            tenant_id=tenant_id,
+            room_name=room_name,
+            status="connecting",
+            started_at=datetime.utcnow(),
+        )
         
-        self._sessions[session_id] = session
+        self._sessions.put(session_id, session, pinned=True)
+        self._missing.pop(session_id)
+        self.sessions_created += 1
         
         if agent_id not in self._agent_sessions:
             self._agent_sessions[agent_id] = set()
         self._agent_sessions[agent_id].add(session_id)
+        self._track_tenant_session(session)
         
         # Store in database
-        await self._save_session_to_db(session, runtime_instance_id)
+        self._mark_written(session_id)
+        if self._writer:
+            await self._writer.enqueue_insert({
+                "agent_id": agent_id,
+                "tenant_id": tenant_id,
+                "session_id": session_id,
+                "room_name": room_name,
+                "status": session.status,
+                "runtime_instance_id": runtime_instance_id,
+                "started_at": session.started_at,
+            })
+        else:
+            await self._save_session_to_db(session, runtime_instance_id)
         
         return session
     
+    def restore_sessions(self, sessions: List[SessionRecord]) -> int:
+        """Adopt live sessions reloaded from the database (e.g. after a restart).
+        
+        They are pinned and indexed like newly created sessions, and their
+        reaper deadlines start over. Nothing is written back.
+        """
+        restored = 0
+        for session in sessions:
+            agent_sessions = self._agent_sessions.setdefault(session.agent_id, set())
+            if session.status in TERMINAL_SESSION_STATUSES or session.session_id in agent_sessions:
+                continue
+            self._sessions.put(session.session_id, session, pinned=True)
+            self._missing.pop(session.session_id)
+            agent_sessions.add(session.session_id)
+            self._track_tenant_session(session)
+            restored += 1
+        return restored
+    
     async def update_session_status(
         self,
         session_id: str,
@@ -57,74 +156,362 @@ class SessionManager:
         participant_count: Optional[int] = None
     ) -> None:
         """Update session status."""
-        session = self._sessions.get(session_id)
+        session = self._sessions.peek(session_id)
         if not session:
             return
+        if session.status in TERMINAL_SESSION_STATUSES:
+            # Already ended or failed (e.g. reloaded from DB); a terminal
+            # status never changes, and must not be rolled up twice
+            return
         
-        session["status"] = status
+        status_changed = session.status != status
+        changed = status_changed or (
+            participant_count is not None
+            and participant_count != session.participant_count
+        )
+        if status_changed:
+            # Re-arms the reaper only on a real transition, so repeated
+            # updates can't keep pushing a deadline back
+            self._set_status(session, status)
         if participant_count is not None:
-            session["participantCount"] = participant_count
+            session.participant_count = participant_count
+        
+        if status not in TERMINAL_SESSION_STATUSES:
+            if changed and self._coalescer:
+                self._coalescer.record(session)
+            return
         
-        if status == "ended":
-            session["endedAt"] = datetime.utcnow()
+        if self._coalescer:
+            # The ended write carries the latest status and count
+            self._coalescer.discard(session_id)
+        session.ended_at = datetime.utcnow()
+        self._mark_written(session_id)
+        if self._writer:
+            await self._writer.enqueue_update(
+                session_id, self._ended_values(session)
+            )
+        else:
             await self._update_session_in_db(session_id, session)
     
+    async def activate_session(self, session_id: str) -> None:
+        """Mark a connecting session active once its agent has been dispatched."""
+        await self.update_session_status(session_id, "active")
+    
     async def end_session(self, session_id: str) -> None:
         """End a session."""
         await self.update_session_status(session_id, "ended")
-        session = self._sessions.get(session_id)
+        session = self._sessions.pop(session_id)
+        if session:
+            agent_sessions = self._agent_sessions.get(session.agent_id)
+            if agent_sessions:
+                agent_sessions.discard(session_id)
+    
+    async def fail_session(self, session_id: str) -> None:
+        """Mark a session failed (e.g. its agent could not be dispatched).
+        
+        Like ending it, this is final: the session stops being live and its
+        capacity slot on the agent instance is freed.
+        """
+        from src.runtime.agent_manager import agent_manager
+        await self.update_session_status(session_id, "failed")
+        session = self._sessions.pop(session_id)
         if session:
-            del self._sessions[session_id]
-            agent_sessions = self._agent_sessions.get(session["agentId"])
+            agent_sessions = self._agent_sessions.get(session.agent_id)
             if agent_sessions:
                 agent_sessions.discard(session_id)
+            instance = agent_manager.get_agent_instance(session.agent_id)
+            if instance:
+                instance.release_session(session_id)
+    
+    async def end_sessions(self, session_ids: List[str]) -> List[SessionRecord]:
+        """End many live sessions and persist them together.
+        
+        Frees the sessions' capacity slots on their agent instances.
+        Unknown or already ended sessions are skipped.
+        """
+        from src.runtime.agent_manager import agent_manager
+        ended: List[SessionRecord] = []
+        for session_id in session_ids:
+            session = self._sessions.peek(session_id)
+            if not session or session.status in TERMINAL_SESSION_STATUSES:
+                continue
+            self._set_status(session, "ended")
+            if self._coalescer:
+                self._coalescer.discard(session_id)
+            session.ended_at = datetime.utcnow()
+            self._mark_written(session_id)
+            self._sessions.pop(session_id)
+            agent_sessions = self._agent_sessions.get(session.agent_id)
+            if agent_sessions:
+                agent_sessions.discard(session_id)
+            instance = agent_manager.get_agent_instance(session.agent_id)
+            if instance:
+                instance.release_session(session_id)
+            ended.append(session)
+        
+        if not ended:
+            return ended
+        if self._writer:
+            for session in ended:
+                await self._writer.enqueue_update(
+                    session.session_id, self._ended_values(session)
+                )
+        else:
+            await self._end_sessions_in_db([session.session_id for session in ended])
+        return ended
+    
+    async def _reap(self, expired: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """End sessions whose connecting deadline passed."""
+        stale = {}
+        for session_id, status in expired:
+            session = self._sessions.peek(session_id)
+            if session and session.status == status:
+                stale[session_id] = status
+        ended = await self.end_sessions(list(stale))
+        return [(session.session_id, stale[session.session_id]) for session in ended]
+    
+    def start_reaper(self) -> None:
+        """Start expiring sessions stuck connecting, if configured."""
+        if self._reaper:
+            self._reaper.start(self._reap)
+    
+    def get_reaper_stats(self) -> Optional[Dict[str, int]]:
+        """Get stale-session reaper statistics, if enabled."""
+        return self._reaper.get_stats() if self._reaper else None
+    
+    def _track_tenant_session(self, session: SessionRecord) -> None:
+        """Add a live session to the tenant index and counters."""
+        tenant_id = session.tenant_id
+        self._tenant_sessions.setdefault(tenant_id, set()).add(session.session_id)
+        counts = self._tenant_status_counts.setdefault(tenant_id, {})
+        counts[session.status] = counts.get(session.status, 0) + 1
+        if self._reaper:
+            self._reaper.watch(session.session_id, session.status)
+    
+    def _set_status(self, session: SessionRecord, status: str) -> None:
+        """Change a session's status, keeping tenant counters in step."""
+        old_status = session.status
+        session.status = status
+        
+        tenant_id = session.tenant_id
+        tenant_sessions = self._tenant_sessions.get(tenant_id)
+        if not tenant_sessions or session.session_id not in tenant_sessions:
+            # Not a live session of this process (e.g. loaded from the DB)
+            return
+        
+        if self._reaper:
+            self._reaper.watch(session.session_id, status)
+        
+        counts = self._tenant_status_counts[tenant_id]
+        counts[old_status] -= 1
+        if not counts[old_status]:
+            del counts[old_status]
+        
+        if status in TERMINAL_SESSION_STATUSES:
+            tenant_sessions.discard(session.session_id)
+            if not tenant_sessions:
+                del self._tenant_sessions[tenant_id]
+                del self._tenant_status_counts[tenant_id]
+        else:
+            counts[status] = counts.get(status, 0) + 1
+    
+    def get_tenant_live_status(self, tenant_id: int) -> Dict[str, Any]:
+        """Get live session counts for a tenant without touching the database."""
+        counts = self._tenant_status_counts.get(tenant_id, {})
+        return {
+            "tenantId": tenant_id,
+            "liveSessions": len(self._tenant_sessions.get(tenant_id, ())),
+            "byStatus": dict(counts),
+        }
+    
+    def is_live(self, session_id: str) -> bool:
+        """Whether this process is tracking the session as live."""
+        session = self._sessions.peek(session_id)
+        return session is not None and session_id in self._tenant_sessions.get(
+            session.tenant_id, ()
+        )
+    
+    def live_session_count(self) -> int:
+        """Count this process's live (non-terminal) sessions."""
+        return sum(len(sessions) for sessions in self._tenant_sessions.values())
     
-    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_tenant_sessions(self, tenant_id: int) -> List[SessionRecord]:
+        """Get a tenant's live sessions."""
+        session_ids = self._tenant_sessions.get(tenant_id, ())
+        return [
+            session
+            for session in (self._sessions.peek(sid) for sid in session_ids)
+            if session
+        ]
+    
+    async def get_session(self, session_id: str) -> Optional[SessionRecord]:
         """Get session by ID."""
         # First check in-memory cache
         session = self._sessions.get(session_id)
         if session:
             return session
         
-        # If not in cache, try to load from database
+        # Recently confirmed missing from the database
+        if self._missing.get(session_id) is not None:
+            self._load_stats["negativeHits"] += 1
+            return None
+        
+        # If not in cache, load from database, sharing any load already in flight
+        load = self._loads.get(session_id)
+        if load is None:
+            load = asyncio.create_task(self._load_session(session_id))
+            self._loads[session_id] = load
+            load.add_done_callback(lambda _: self._loads.pop(session_id, None))
+        else:
+            self._load_stats["coalescedLoads"] += 1
+        
         try:
-            from src.database.db import AsyncSessionLocal
-            from src.database.operations import get_session_by_id
-            async with AsyncSessionLocal() as db:
-                db_session = await get_session_by_id(db, session_id)
-                if db_session:
-                    # Convert database model to dict format
-                    session = {
-                        "sessionId": db_session.session_id,
-                        "agentId": db_session.agent_id,
-                        "tenantId": db_session.tenant_id,
-                        "roomName": db_session.room_name,
-                        "status": db_session.status,
-                        "startedAt": db_session.started_at,
-                        "endedAt": db_session.ended_at,
-                        "participantCount": db_session.participant_count or 0,
-                    }
-                    # Cache it
-                    self._sessions[session_id] = session
-                    return session
+            # Shielded so one caller being cancelled doesn't fail the others
+            return await asyncio.shield(load)
         except Exception as e:
             print(f"Failed to load session from DB: {e}")
         
         return None
     
-    async def get_agent_sessions(self, agent_id: int) -> List[Dict[str, Any]]:
-        """Get all sessions for an agent."""
+    async def _load_session(self, session_id: str) -> Optional[SessionRecord]:
+        """Load a session from the database into the cache."""
+        from src.database.operations import get_session_by_id
+        self._load_stats["dbLoads"] += 1
+        async with self._session_factory_for(session_id)() as db:
+            db_session = await get_session_by_id(db, session_id)
+        
+        if not db_session:
+            # Errors propagate instead, so they are never negatively cached
+            self._missing.put(session_id, True)
+            return None
+        
+        session = SessionRecord.from_model(db_session)
+        # Cache it (evictable; only live sessions are pinned)
+        self._sessions.put(session_id, session)
+        return session
+    
+    async def get_agent_sessions(self, agent_id: int) -> List[SessionRecord]:
+        """Get all sessions for an agent.
+        
+        Cache misses are loaded together with one bulk query.
+        """
         session_ids = self._agent_sessions.get(agent_id, set())
         sessions = []
+        missing = []
         for sid in session_ids:
-            session = await self.get_session(sid)
+            session = self._sessions.get(sid)
             if session:
                 sessions.append(session)
+            elif self._missing.get(sid) is not None:
+                self._load_stats["negativeHits"] += 1
+            else:
+                missing.append(sid)
+        
+        if missing:
+            try:
+                sessions.extend(await self._load_sessions(missing))
+            except Exception as e:
+                print(f"Failed to load sessions from DB: {e}")
         return sessions
     
+    async def _load_sessions(self, session_ids: List[str]) -> List[SessionRecord]:
+        """Load many sessions from the database into the cache."""
+        from src.database.db import AsyncSessionLocal, AsyncReadSessionLocal
+        from src.database.operations import get_sessions_by_ids
+        self._load_stats["dbLoads"] += 1
+        # Any recent write among them sends the whole batch to the primary
+        factories = {self._session_factory_for(sid) for sid in session_ids}
+        factory = AsyncSessionLocal if AsyncSessionLocal in factories else AsyncReadSessionLocal
+        async with factory() as db:
+            db_sessions = await get_sessions_by_ids(db, session_ids)
+        
+        sessions = []
+        for db_session in db_sessions:
+            session = SessionRecord.from_model(db_session)
+            self._sessions.put(session.session_id, session)
+            sessions.append(session)
+        
+        found = {session.session_id for session in sessions}
+        for sid in session_ids:
+            if sid not in found:
+                self._missing.put(sid, True)
+        return sessions
+    
+    def _mark_written(self, session_id: str) -> None:
+        """Record a write so reads of this session stay on the primary for a while."""
+        now = time.monotonic()
+        self._recent_writes[session_id] = now
+        self._recent_writes.move_to_end(session_id)
+        
+        # Entries are ordered by write time; drop the ones outside the window
+        cutoff = now - self._read_your_writes_seconds
+        while self._recent_writes:
+            oldest_id, written_at = next(iter(self._recent_writes.items()))
+            if written_at >= cutoff:
+                break
+            del self._recent_writes[oldest_id]
+    
+    def _session_factory_for(self, session_id: str):
+        """Pick the primary or replica session factory for reading a session."""
+        from src.database.db import AsyncSessionLocal, AsyncReadSessionLocal
+        written_at = self._recent_writes.get(session_id)
+        if (
+            written_at is not None
+            and time.monotonic() - written_at < self._read_your_writes_seconds
+        ):
+            return AsyncSessionLocal
+        return AsyncReadSessionLocal
+    
+    async def flush(self) -> None:
+        """Wait for coalesced and queued session writes to reach the database."""
+        if self._coalescer:
+            await self._coalescer.flush()
+        if self._writer:
+            await self._writer.flush()
+    
+    async def close(self) -> None:
+        """Stop the reaper, flush pending session writes and stop the writers."""
+        if self._reaper:
+            await self._reaper.stop()
+        if self._coalescer:
+            await self._coalescer.close()
+        if self._writer:
+            await self._writer.close()
+    
+    def get_coalescer_stats(self) -> Optional[Dict[str, int]]:
+        """Get status/participant update coalescing statistics, if enabled."""
+        return self._coalescer.get_stats() if self._coalescer else None
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get session cache, negative cache and database load counters."""
+        return {
+            **self._sessions.get_stats(),
+            **self._load_stats,
+            "negativeSize": len(self._missing),
+            "inflightLoads": len(self._loads),
+        }
+    
+    def get_writer_stats(self) -> Optional[Dict[str, int]]:
+        """Get write-behind queue statistics, if enabled."""
+        return self._writer.get_stats() if self._writer else None
+    
+    @staticmethod
+    def _ended_values(session: SessionRecord) -> Dict[str, Any]:
+        """Column values persisted when a session ends."""
+        ended_at = session.ended_at
+        duration_seconds = None
+        if ended_at and session.started_at:
+            duration_seconds = int((ended_at - session.started_at).total_seconds())
+        return {
+            "status": session.status,
+            "ended_at": ended_at,
+            "duration_seconds": duration_seconds,
+            "participant_count": session.participant_count,
+        }
+    
     async def _save_session_to_db(
         self,
-        session: Dict[str, Any],
+        session: SessionRecord,
         runtime_instance_id: Optional[int] = None
     ) -> None:
         """Save session to database."""
@@ -133,45 +520,102 @@ class SessionManager:
             async with AsyncSessionLocal() as db:
                 await db_create_session(
                     db,
-                    agent_id=session["agentId"],
-                    tenant_id=session["tenantId"],
-                    session_id=session["sessionId"],
-                    room_name=session["roomName"],
-                    status=session["status"],
+                    agent_id=session.agent_id,
+                    tenant_id=session.tenant_id,
+                    session_id=session.session_id,
+                    room_name=session.room_name,
+                    status=session.status,
                     runtime_instance_id=runtime_instance_id,
                 )
                 await db.commit()
         except Exception as e:
             print(f"Failed to save session to DB: {e}")
     
+    async def _persist_states(self, sessions: List[SessionRecord]) -> None:
+        """Write the current status and participant count of live sessions."""
+        for session in sessions:
+            self._mark_written(session.session_id)
+        if self._writer:
+            for session in sessions:
+                await self._writer.enqueue_update(session.session_id, {
+                    "status": session.status,
+                    "participant_count": session.participant_count,
+                })
+            return
+        
+        from src.database.db import AsyncSessionLocal
+        async with AsyncSessionLocal() as db:
+            await db_update_session_states(db, [
+                {
+                    "session_id": session.session_id,
+                    "status": session.status,
+                    "participant_count": session.participant_count,
+                }
+                for session in sessions
+            ])
+            await db.commit()
+    
+    async def _end_sessions_in_db(self, session_ids: List[str]) -> None:
+        """End sessions in the database with one bulk UPDATE."""
+        try:
+            from src.database.db import AsyncSessionLocal
+            async with AsyncSessionLocal() as db:
+                ended = await db_end_sessions(db, session_ids)
+                # Sessions another writer already ended are not rolled up again
+                await db_rollup_session_metrics(
+                    db, [session.session_id for session in ended]
+                )
+                await db.commit()
+        except Exception as e:
+            print(f"Failed to end sessions in DB: {e}")
+    
     async def _update_session_in_db(
         self,
         session_id: str,
-        session: Dict[str, Any]
+        session: SessionRecord
     ) -> None:
-        """Update session in database."""
+        """Persist a session's ended or failed status to the database."""
         try:
             from src.database.db import AsyncSessionLocal
             async with AsyncSessionLocal() as db:
-                ended_at = session.get("endedAt")
-                duration_seconds = None
-                if ended_at and session.get("startedAt"):
-                    duration = (ended_at - session["startedAt"]).total_seconds()
-                    duration_seconds = int(duration)
-                
-                await db_update_session_status(
-                    db,
-                    session_id=session_id,
-                    status=session["status"],
-                    ended_at=ended_at,
-                    duration_seconds=duration_seconds,
-                    participant_count=session.get("participantCount"),
-                )
+                ended = await db_end_sessions_at(db, [
+                    {"session_id": session_id, **self._ended_values(session)}
+                ])
+                await db_rollup_session_metrics(db, ended)
                 await db.commit()
         except Exception as e:
             print(f"Failed to update session in DB: {e}")
 
 
+def _create_session_manager() -> SessionManager:
+    """Create the global session manager from runtime configuration."""
+    runtime_config = get_config().runtime
+    writer = None
+    if runtime_config.session_write_behind:
+        writer = SessionWriter(
+            max_queue_size=runtime_config.session_write_queue_size,
+            batch_size=runtime_config.session_write_batch_size,
+        )
+    return SessionManager(
+        writer=writer,
+        read_your_writes_seconds=get_config().database.read_your_writes_seconds,
+        cache=SessionCache(
+            max_size=runtime_config.session_cache_size,
+            ttl_seconds=runtime_config.session_cache_ttl_seconds,
+        ),
+        negative_cache=SessionCache(
+            max_size=runtime_config.session_cache_size,
+            ttl_seconds=runtime_config.session_negative_cache_ttl_seconds,
+        ),
+        id_generator=get_session_id_generator(runtime_config.session_id_format),
+        reaper=SessionReaper(
+            connecting_timeout_seconds=runtime_config.session_connecting_timeout_seconds,
+            tick_seconds=runtime_config.session_reaper_tick_seconds,
+        ),
+        coalesce_window_seconds=runtime_config.session_update_coalesce_seconds,
+    )
+
+
 # Global instance
-session_manager = SessionManager()
+session_manager = _create_session_manager()
 
@@ -0,0 +1,108 @@
+"""Session Reaper - expires sessions stuck in connecting."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.runtime.timing_wheel import TimingWheel
+
+logger = logging.getLogger(__name__)
+
+# Ends expired (session_id, status) pairs and returns the pairs it ended
+ReapCallback = Callable[[List[Tuple[str, str]]], Awaitable[List[Tuple[str, str]]]]
+
+
+class SessionReaper:
+    """Tracks status deadlines on a timing wheel and reaps expired sessions.
+
+    ``watch`` is called on every status change; statuses with a deadline are
+    (re)scheduled, others cancel any pending deadline. Only ``connecting``
+    has one: a session leaves it once its agent dispatch succeeds. A background task
+    advances the wheel once per tick and hands expired sessions to the
+    reap callback in one batch.
+    """
+
+    def __init__(
+        self,
+        connecting_timeout_seconds: float = 60.0,
+        tick_seconds: float = 1.0,
+    ):
+        self._deadlines: Dict[str, float] = {
+            status: timeout
+            for status, timeout in (("connecting", connecting_timeout_seconds),)
+            if timeout > 0
+        }
+        self._wheel = TimingWheel(tick_seconds=tick_seconds)
+        self._statuses: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stats: Dict[str, int] = {
+            "reaped": 0,
+            "reapedConnecting": 0,
+            "runs": 0,
+            "failedRuns": 0,
+        }
+
+    def watch(self, session_id: str, status: str) -> None:
+        """Start, restart or cancel the deadline for a session's new status."""
+        timeout = self._deadlines.get(status)
+        if timeout is None:
+            self.forget(session_id)
+            return
+        self._statuses[session_id] = status
+        self._wheel.schedule(session_id, timeout)
+
+    def forget(self, session_id: str) -> None:
+        """Stop tracking a session."""
+        if self._wheel.cancel(session_id):
+            del self._statuses[session_id]
+
+    def expire(self) -> List[Tuple[str, str]]:
+        """Advance one tick and return expired (session_id, status) pairs."""
+        return [
+            (session_id, self._statuses.pop(session_id))
+            for session_id in self._wheel.tick()
+        ]
+
+    async def reap(self, callback: ReapCallback) -> int:
+        """Advance one tick and reap whatever expired."""
+        expired = self.expire()
+        if not expired:
+            return 0
+        self._stats["runs"] += 1
+        try:
+            reaped = await callback(expired)
+        except Exception as e:
+            self._stats["failedRuns"] += 1
+            logger.error(f"Failed to reap {len(expired)} stale sessions: {e}")
+            return 0
+        self._stats["reaped"] += len(reaped)
+        self._stats["reapedConnecting"] += sum(
+            1 for _, status in reaped if status == "connecting"
+        )
+        if reaped:
+            logger.info(f"Reaped {len(reaped)} stale sessions")
+        return len(reaped)
+
+    def start(self, callback: ReapCallback) -> None:
+        """Start the background reaper if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(callback))
+
+    async def stop(self) -> None:
+        """Stop the background reaper."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get reap counters and the number of pending deadlines."""
+        return {**self._stats, "pending": len(self._wheel)}
+
+    async def _run(self, callback: ReapCallback) -> None:
+        while True:
+            await asyncio.sleep(self._wheel.tick_seconds)
+            await self.reap(callback)
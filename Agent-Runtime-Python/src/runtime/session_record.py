@@ -0,0 +1,75 @@
+"""Session Record - compact in-memory session state."""
+
+import sys
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+
+class SessionRecord:
+    """In-memory state of one agent session.
+
+    Uses ``__slots__`` instead of a per-session dict, which keeps the
+    footprint of many tracked sessions small.
+    """
+
+    __slots__ = (
+        "session_id",
+        "agent_id",
+        "tenant_id",
+        "room_name",
+        "status",
+        "started_at",
+        "ended_at",
+        "participant_count",
+    )
+
+    def __init__(
+        self,
+        session_id: str,
+        agent_id: int,
+        tenant_id: int,
+        room_name: str,
+        status: str,
+        started_at: Optional[datetime],
+        ended_at: Optional[datetime] = None,
+        participant_count: int = 0,
+    ):
+        self.session_id = session_id
+        self.agent_id = agent_id
+        self.tenant_id = tenant_id
+        self.room_name = room_name
+        # Interned so rows loaded from the DB share one string per status
+        self.status = sys.intern(status)
+        self.started_at = started_at
+        self.ended_at = ended_at
+        self.participant_count = participant_count
+
+    @classmethod
+    def from_model(cls, db_session) -> "SessionRecord":
+        """Build a record from an AgentInstanceSession row."""
+        return cls(
+            session_id=db_session.session_id,
+            agent_id=db_session.agent_id,
+            tenant_id=db_session.tenant_id,
+            room_name=db_session.room_name,
+            status=db_session.status,
+            started_at=db_session.started_at,
+            ended_at=db_session.ended_at,
+            participant_count=db_session.participant_count or 0,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the API dict format."""
+        return {
+            "sessionId": self.session_id,
+            "agentId": self.agent_id,
+            "tenantId": self.tenant_id,
+            "roomName": self.room_name,
+            "status": self.status,
+            "startedAt": self.started_at,
+            "endedAt": self.ended_at,
+            "participantCount": self.participant_count,
+        }
+
+    def __repr__(self) -> str:
+        return f"SessionRecord(session_id={self.session_id!r}, status={self.status!r})"
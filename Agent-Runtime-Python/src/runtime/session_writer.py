@@ -0,0 +1,216 @@
+"""Session Writer - write-behind persistence for session lifecycle changes."""
+
+import asyncio
+import logging
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlalchemy import exc as sa_exc
+
+from src.database.models import TERMINAL_SESSION_STATUSES
+from src.database.operations import (
+    create_sessions as db_create_sessions,
+    update_sessions as db_update_sessions,
+    end_sessions_at as db_end_sessions_at,
+    rollup_session_metrics as db_rollup_session_metrics,
+)
+
+logger = logging.getLogger(__name__)
+
+INSERT = "insert"
+UPDATE = "update"
+
+Write = Tuple[str, Dict[str, Any]]
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed write may succeed unchanged (e.g. the database is down)."""
+    return isinstance(error, (
+        OSError,
+        asyncio.TimeoutError,
+        sa_exc.OperationalError,
+        sa_exc.InterfaceError,
+        sa_exc.TimeoutError,
+    )) or getattr(error, "connection_invalidated", False)
+
+
+class SessionWriter:
+    """Queues session writes and flushes them to the database in batches.
+
+    Callers enqueue inserts and updates; a background task drains the queue
+    and writes each batch with multi-row statements in a single transaction.
+    When the queue is full, enqueue waits for the flusher to catch up.
+
+    A batch that fails with a transient error (connection lost, timeout) is
+    retried up to ``max_attempts`` times with exponential backoff. A batch
+    rejected for its data is split in halves until the offending writes
+    are isolated; only those are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        max_attempts: int = 3,
+        retry_base_seconds: float = 0.2,
+    ):
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.retry_base_seconds = retry_base_seconds
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._stats: Dict[str, int] = {
+            "enqueued": 0,
+            "written": 0,
+            "batches": 0,
+            "failedBatches": 0,
+            "retries": 0,
+            "splits": 0,
+            "droppedWrites": 0,
+            "backpressureWaits": 0,
+        }
+
+    def start(self) -> None:
+        """Start the background flusher if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def enqueue_insert(self, row: Dict[str, Any]) -> None:
+        """Queue a new session row (AgentInstanceSession attribute names)."""
+        await self._enqueue((INSERT, row))
+
+    async def enqueue_update(self, session_id: str, values: Dict[str, Any]) -> None:
+        """Queue column updates for an existing session."""
+        await self._enqueue((UPDATE, {"session_id": session_id, **values}))
+
+    async def _enqueue(self, item: Tuple[str, Dict[str, Any]]) -> None:
+        self.start()
+        if self._queue.full():
+            self._stats["backpressureWaits"] += 1
+        await self._queue.put(item)
+        self._stats["enqueued"] += 1
+
+    async def flush(self) -> None:
+        """Wait until every queued write has been flushed."""
+        if self._task is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush pending writes and stop the background flusher."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get writer counters and current queue depth."""
+        return {**self._stats, "queueDepth": self._queue.qsize()}
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _write_batch(self, batch: List[Write]) -> None:
+        """Write one batch, retrying or splitting it on failure."""
+        self._stats["batches"] += 1
+        error = await self._write_with_retry(batch)
+        if error is None:
+            self._stats["written"] += len(batch)
+            return
+        self._stats["failedBatches"] += 1
+        if _is_transient(error):
+            self._drop(batch, error)
+        else:
+            await self._write_split(batch)
+
+    async def _write_with_retry(self, batch: List[Write]) -> Optional[Exception]:
+        """Write a batch, retrying transient failures. Returns the last error."""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                await self._write_once(batch)
+                return None
+            except Exception as e:
+                if not _is_transient(e) or attempt == self.max_attempts:
+                    return e
+                self._stats["retries"] += 1
+                logger.warning(
+                    f"Retrying {len(batch)} session changes after error: {e}"
+                )
+                await asyncio.sleep(self.retry_base_seconds * 2 ** (attempt - 1))
+
+    async def _write_split(self, batch: List[Write]) -> None:
+        """Bisect a rejected batch so only the failing writes are dropped.
+
+        Halves are written in order, so an insert still lands before later
+        updates to the same session.
+        """
+        if len(batch) == 1:
+            error = await self._write_with_retry(batch)
+            if error is None:
+                self._stats["written"] += 1
+            else:
+                self._drop(batch, error)
+            return
+        self._stats["splits"] += 1
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            error = await self._write_with_retry(half)
+            if error is None:
+                self._stats["written"] += len(half)
+            elif _is_transient(error):
+                self._drop(half, error)
+            else:
+                await self._write_split(half)
+
+    def _drop(self, writes: List[Write], error: Exception) -> None:
+        self._stats["droppedWrites"] += len(writes)
+        session_ids = ", ".join(sorted({values["session_id"] for _, values in writes}))
+        logger.error(
+            f"Dropped {len(writes)} session changes ({session_ids}): {error}"
+        )
+
+    async def _write_once(self, batch: List[Write]) -> None:
+        """Write a batch in one transaction.
+
+        Inserts go first, then updates of live sessions, then ends. Only the
+        sessions the guarded end actually ended are added to the metrics
+        rollup, so a replayed or duplicate end is never counted twice.
+        """
+        inserts: List[Dict[str, Any]] = []
+        updates: Dict[str, Dict[str, Any]] = {}
+        for kind, values in batch:
+            if kind == INSERT:
+                inserts.append(values)
+            else:
+                # Later updates for the same session win
+                updates.setdefault(values["session_id"], {}).update(values)
+
+        ends = [
+            values for values in updates.values()
+            if values.get("status") in TERMINAL_SESSION_STATUSES
+        ]
+        live = [
+            values for values in updates.values()
+            if values.get("status") not in TERMINAL_SESSION_STATUSES
+        ]
+
+        from src.database.db import AsyncSessionLocal
+        async with AsyncSessionLocal() as db:
+            await db_create_sessions(db, inserts)
+            await db_update_sessions(db, live)
+            ended = await db_end_sessions_at(db, ends)
+            await db_rollup_session_metrics(db, ended)
+            await db.commit()
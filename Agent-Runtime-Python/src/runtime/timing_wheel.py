@@ -0,0 +1,56 @@
+"""Hashed timing wheel for cheap per-key timeouts."""
+
+import math
+from typing import Dict, Hashable, List
+
+
+class TimingWheel:
+    """Hashed timing wheel.
+
+    Keys are hashed into ``slots`` buckets by deadline tick; each tick only
+    looks at one bucket. Scheduling and cancelling are O(1). Deadlines
+    longer than one revolution carry a rounds counter that is decremented
+    each time the cursor passes their bucket.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, slots: int = 512):
+        self.tick_seconds = tick_seconds
+        self._slots: List[Dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._positions: Dict[Hashable, int] = {}
+        self._cursor = 0
+
+    def schedule(self, key: Hashable, delay_seconds: float) -> None:
+        """Schedule (or reschedule) a key to expire after a delay."""
+        self.cancel(key)
+        ticks = max(1, math.ceil(delay_seconds / self.tick_seconds))
+        slot = (self._cursor + ticks) % len(self._slots)
+        self._slots[slot][key] = (ticks - 1) // len(self._slots)
+        self._positions[key] = slot
+
+    def cancel(self, key: Hashable) -> bool:
+        """Cancel a scheduled key. Returns whether it was scheduled."""
+        slot = self._positions.pop(key, None)
+        if slot is None:
+            return False
+        del self._slots[slot][key]
+        return True
+
+    def tick(self) -> List[Hashable]:
+        """Advance one tick and return the keys that expired."""
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        bucket = self._slots[self._cursor]
+        expired = []
+        for key, rounds in list(bucket.items()):
+            if rounds:
+                bucket[key] = rounds - 1
+            else:
+                del bucket[key]
+                del self._positions[key]
+                expired.append(key)
+        return expired
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
@@ -0,0 +1,262 @@
+"""Warm start - rebuilds runtime state from the database at boot."""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.config.config import get_config
+from src.database.db import AsyncSessionLocal
+from src.database.models import Agent
+from src.database.operations import (
+    end_sessions_at,
+    get_settings,
+    register_runtime_instance,
+    rollup_session_metrics,
+    stream_deployed_agents,
+    stream_live_sessions,
+)
+from src.runtime.agent_manager import AgentManager, agent_manager
+from src.runtime.session_manager import SessionManager, session_manager
+from src.runtime.session_record import SessionRecord
+
+logger = logging.getLogger(__name__)
+
+
+def _load_json(value: Optional[str]) -> Any:
+    """Parse a JSON text column, tolerating empty or malformed values."""
+    if not value:
+        return None
+    try:
+        return json.loads(value)
+    except ValueError:
+        return None
+
+
+# Agent-Builder settings that make up livekitConfig and langfuseConfig
+SERVICE_SETTING_KEYS = (
+    "livekit_url",
+    "livekit_api_key",
+    "livekit_api_secret",
+    "langfuse_enabled",
+    "langfuse_public_key",
+    "langfuse_secret_key",
+    "langfuse_base_url",
+)
+
+
+def service_configs_from_settings(settings: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Build livekitConfig and langfuseConfig from the settings table.
+
+    Mirrors ``serializeAgentConfig`` in Agent-Builder/server/k8s-client.ts,
+    which reads the same settings when it registers an agent.
+    """
+    livekit_config = None
+    if settings.get("livekit_url"):
+        livekit_config = {
+            "url": settings["livekit_url"],
+            "apiKey": settings.get("livekit_api_key"),
+            "apiSecret": settings.get("livekit_api_secret"),
+        }
+    langfuse_config = None
+    if settings.get("langfuse_enabled") == "true":
+        langfuse_config = {
+            "enabled": True,
+            "publicKey": settings.get("langfuse_public_key"),
+            "secretKey": settings.get("langfuse_secret_key"),
+            "baseUrl": settings.get("langfuse_base_url"),
+        }
+    return {"livekitConfig": livekit_config, "langfuseConfig": langfuse_config}
+
+
+def agent_config_from_model(
+    agent: Agent,
+    service_configs: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build the registration config for an agent row.
+
+    Produces the same camelCase keys the Agent-Builder sends to
+    ``POST /api/agents/register``; ``service_configs`` supplies
+    livekitConfig and langfuseConfig, which the agents table doesn't hold.
+    """
+    return {
+        **(service_configs or {"livekitConfig": None, "langfuseConfig": None}),
+        "agentId": agent.id,
+        "tenantId": agent.tenant_id,
+        "name": agent.name,
+        "description": agent.description,
+        "sttProvider": agent.stt_provider,
+        "sttConfig": _load_json(agent.stt_config),
+        "ttsProvider": agent.tts_provider,
+        "ttsConfig": _load_json(agent.tts_config),
+        "voiceId": agent.voice_id,
+        "llmProvider": agent.llm_provider,
+        "llmModel": agent.llm_model,
+        "llmConfig": _load_json(agent.llm_config),
+        "visionEnabled": bool(agent.vision_enabled),
+        "screenShareEnabled": bool(agent.screen_share_enabled),
+        "transcribeEnabled": bool(agent.transcribe_enabled),
+        "languages": _load_json(agent.languages) or [],
+        "avatarModel": agent.avatar_model,
+        "systemPrompt": agent.system_prompt,
+        "mcpGatewayUrl": agent.mcp_gateway_url,
+        "mcpConfig": _load_json(agent.mcp_config),
+        "maxConcurrentSessions": agent.max_concurrent_sessions or 10,
+        "resourceLimits": _load_json(agent.resource_limits) or {},
+    }
+
+
+class WarmStart:
+    """Reloads deployed agents and this instance's live sessions.
+
+    Registers the process in ``agent_runtime_instances`` (keyed by pod name,
+    so a restarted pod gets its old ID back), streams deployed agents and
+    initializes them concurrently, then streams the sessions this instance
+    still owns and adopts those whose agent registered; the rest are
+    marked failed. The service reports not-ready from
+    ``start()`` until the load finishes; a failed load is logged and the
+    service comes up empty, as it did before warm start existed.
+    """
+
+    def __init__(
+        self,
+        agents: AgentManager,
+        sessions: SessionManager,
+        session_factory=AsyncSessionLocal,
+        concurrency: int = 16,
+    ):
+        self._agents = agents
+        self._sessions = sessions
+        self._session_factory = session_factory
+        self.concurrency = concurrency
+        self.state = "idle"
+        self._task: Optional[asyncio.Task] = None
+        self._stats: Dict[str, Any] = {
+            "agents": 0,
+            "agentsFailed": 0,
+            "sessions": 0,
+            "sessionsOrphaned": 0,
+            "durationMs": None,
+            "error": None,
+        }
+
+    @property
+    def ready(self) -> bool:
+        """Whether warm start is not holding readiness back."""
+        return self.state != "loading"
+
+    def start(self) -> asyncio.Task:
+        """Run the load in the background; readiness waits for it."""
+        if self._task is None:
+            self.state = "loading"
+            self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def wait(self) -> None:
+        """Wait for a started load to finish."""
+        if self._task is not None:
+            await asyncio.shield(self._task)
+
+    async def run(self) -> Dict[str, Any]:
+        """Load agents and sessions from the database."""
+        self.state = "loading"
+        started = time.perf_counter()
+        try:
+            await self._load()
+            self.state = "ready"
+        except Exception as e:
+            self.state = "failed"
+            self._stats["error"] = str(e)
+            logger.error(f"Warm start failed: {e}")
+        self._stats["durationMs"] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(
+            f"Warm start {self.state}: {self._stats['agents']} agents, "
+            f"{self._stats['sessions']} sessions in {self._stats['durationMs']}ms"
+        )
+        return self.get_stats()
+
+    async def _load(self) -> None:
+        runtime_config = get_config().runtime
+        async with self._session_factory() as db:
+            runtime_instance_id = await register_runtime_instance(
+                db, runtime_config.pod_name, runtime_config.pod_namespace
+            )
+            await db.commit()
+            self._sessions.runtime_instance_id = runtime_instance_id
+
+            service_configs = service_configs_from_settings(
+                await get_settings(db, SERVICE_SETTING_KEYS)
+            )
+            if service_configs["livekitConfig"] is None:
+                logger.warning(
+                    "No livekit_url setting; warm-started agents will dispatch "
+                    "with the LIVEKIT_* environment credentials"
+                )
+            configs: List[Tuple[int, Dict[str, Any]]] = [
+                (agent.id, agent_config_from_model(agent, service_configs))
+                async for agent in stream_deployed_agents(db)
+            ]
+            records = [
+                SessionRecord.from_model(db_session)
+                async for db_session in stream_live_sessions(db, runtime_instance_id)
+            ]
+
+        # Agent initialization happens after the connection is returned
+        registered = await self._agents.register_agents(
+            configs, concurrency=self.concurrency
+        )
+        self._stats["agents"] = registered
+        self._stats["agentsFailed"] = len(configs) - registered
+
+        await self._adopt_sessions(records)
+
+    async def _adopt_sessions(self, records: List[SessionRecord]) -> None:
+        """Restore sessions whose agent is registered and fail the rest.
+
+        A session whose agent failed to register or is no longer deployed
+        can't continue; restoring it would keep it live here for good.
+        """
+        adopted: List[SessionRecord] = []
+        orphaned: List[str] = []
+        for record in records:
+            instance = self._agents.get_agent_instance(record.agent_id)
+            if instance:
+                instance.restore_session(record.session_id)
+                adopted.append(record)
+            else:
+                orphaned.append(record.session_id)
+        self._stats["sessions"] = self._sessions.restore_sessions(adopted)
+        self._stats["sessionsOrphaned"] = len(orphaned)
+        if orphaned:
+            logger.warning(
+                f"Failing {len(orphaned)} sessions whose agents are not registered"
+            )
+            await self._fail_sessions(orphaned)
+
+    async def _fail_sessions(self, session_ids: List[str]) -> None:
+        """Mark sessions failed in the database; logged, not raised, on error."""
+        ended_at = datetime.utcnow()
+        try:
+            async with self._session_factory() as db:
+                failed = await end_sessions_at(db, [
+                    {"session_id": session_id, "status": "failed", "ended_at": ended_at}
+                    for session_id in session_ids
+                ])
+                await rollup_session_metrics(db, failed)
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to mark orphaned sessions failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the warm start state and what it loaded."""
+        return {"state": self.state, **self._stats}
+
+
+# Global instance
+warm_start = WarmStart(
+    agent_manager,
+    session_manager,
+    concurrency=get_config().runtime.warm_start_concurrency,
+)
@@ -7,6 +7,10 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sess
 from sqlalchemy.pool import NullPool
 from sqlalchemy import text
 
+# TestClient runs each request on its own event loop, and asyncpg connections
+# cannot move between loops, so the shared engine must not pool in tests.
+os.environ.setdefault("DB_POOL_SIZE", "0")
+
 from src.database.models import Base
 from src.database.db import AsyncSessionLocal, engine
 
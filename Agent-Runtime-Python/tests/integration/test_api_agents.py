@@ -129,3 +129,16 @@ async def test_unregister_agent(client):
     assert data["success"] is True
 
 
+def test_list_agent_sessions_invalid_cursor(client):
+    """Test a malformed pagination cursor is rejected."""
+    response = client.get("/api/agents/1/sessions", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_agent_sessions_cursor_round_trip():
+    """Test cursors decode to the keyset they were built from."""
+    from datetime import datetime
+    from src.api.agents import _encode_cursor, _decode_cursor
+
+    started_at = datetime(2024, 1, 1, 12, 30, 15, 123456)
+    assert _decode_cursor(_encode_cursor(started_at, 42)) == (started_at, 42)
@@ -0,0 +1,111 @@
+"""Benchmark session status transitions: SELECT + flush vs UPDATE ... RETURNING.
+
+Requires the test database. Run with ``pytest tests/performance -s`` to see
+the printed round-trip counts and timings.
+"""
+
+import time
+import pytest
+from datetime import datetime
+from sqlalchemy import event, select
+
+from src.database.models import AgentInstanceSession
+from src.database.operations import create_session, end_session, end_sessions
+
+SESSION_COUNT = 200
+
+
+async def _orm_end_session(db_session, session_id):
+    """Previous implementation: load the row, mutate it, flush."""
+    result = await db_session.execute(
+        select(AgentInstanceSession).where(AgentInstanceSession.session_id == session_id)
+    )
+    agent_session = result.scalar_one_or_none()
+    if agent_session:
+        agent_session.status = "ended"
+        agent_session.ended_at = datetime.utcnow()
+        duration = (agent_session.ended_at - agent_session.started_at).total_seconds()
+        agent_session.duration_seconds = int(duration)
+        await db_session.flush()
+    return agent_session
+
+
+async def _seed_sessions(db_session, prefix):
+    session_ids = [f"test-bench-{prefix}-{i}" for i in range(SESSION_COUNT)]
+    for session_id in session_ids:
+        await create_session(
+            db_session,
+            agent_id=1,
+            tenant_id=1,
+            session_id=session_id,
+            room_name="bench-room",
+            status="active",
+        )
+    await db_session.commit()
+    db_session.expunge_all()
+    return session_ids
+
+
+class _StatementCounter:
+    """Counts statements sent to the database on an engine."""
+
+    def __init__(self, engine):
+        self.count = 0
+        self._engine = engine.sync_engine
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self._engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self._engine, "before_cursor_execute", self._on_execute)
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_end_session_round_trips(db_session, test_engine):
+    """Compare statements and latency for ending sessions one at a time."""
+    orm_ids = await _seed_sessions(db_session, "orm")
+    returning_ids = await _seed_sessions(db_session, "returning")
+
+    with _StatementCounter(test_engine) as orm_counter:
+        start = time.perf_counter()
+        for session_id in orm_ids:
+            await _orm_end_session(db_session, session_id)
+        orm_elapsed = time.perf_counter() - start
+    await db_session.commit()
+
+    with _StatementCounter(test_engine) as returning_counter:
+        start = time.perf_counter()
+        for session_id in returning_ids:
+            await end_session(db_session, session_id)
+        returning_elapsed = time.perf_counter() - start
+    await db_session.commit()
+
+    print(
+        f"\nSELECT+flush: {orm_counter.count} statements, {orm_elapsed * 1000:.1f} ms"
+        f"\nUPDATE RETURNING: {returning_counter.count} statements, "
+        f"{returning_elapsed * 1000:.1f} ms"
+    )
+    assert returning_counter.count == SESSION_COUNT
+    assert orm_counter.count >= 2 * SESSION_COUNT
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_bulk_end_sessions_round_trips(db_session, test_engine):
+    """Ending many sessions at once is a single statement."""
+    session_ids = await _seed_sessions(db_session, "bulk")
+
+    with _StatementCounter(test_engine) as counter:
+        start = time.perf_counter()
+        ended = await end_sessions(db_session, session_ids)
+        elapsed = time.perf_counter() - start
+    await db_session.commit()
+
+    print(f"\nBulk UPDATE RETURNING: {counter.count} statement, {elapsed * 1000:.1f} ms")
+    assert len(ended) == SESSION_COUNT
+    assert counter.count == 1
@@ -0,0 +1,140 @@
+"""Unit tests for the tenant admission scheduler."""
+
+import asyncio
+import json
+
+import pytest
+
+from src.runtime.admission import (
+    AdmissionRejectedError,
+    AdmissionScheduler,
+    TenantQuota,
+    parse_resource_quota,
+)
+
+
+def _quota_loader(quotas):
+    async def load(tenant_id):
+        return json.dumps(quotas[tenant_id]) if tenant_id in quotas else None
+    return load
+
+
+def test_parse_resource_quota():
+    """Test quota keys are read and bad values fall back to defaults."""
+    assert parse_resource_quota(None) == TenantQuota()
+    assert parse_resource_quota("not json") == TenantQuota()
+    assert parse_resource_quota(
+        '{"sessionWeight": 3, "maxConcurrentSessions": 20, "maxQueuedSessions": "5"}'
+    ) == TenantQuota(weight=3.0, max_sessions=20, max_queued=5)
+    assert parse_resource_quota('{"sessionWeight": 0, "maxConcurrentSessions": null}') == TenantQuota()
+
+
+@pytest.mark.asyncio
+async def test_tenants_are_admitted_by_weight():
+    """Test a backlogged heavy tenant doesn't starve a lighter one."""
+    scheduler = AdmissionScheduler(
+        concurrency=1,
+        quota_loader=_quota_loader({1: {"sessionWeight": 3}, 2: {"sessionWeight": 1}}),
+    )
+    order = []
+
+    async def create(tenant_id):
+        async with scheduler.admit(tenant_id):
+            order.append(tenant_id)
+            await asyncio.sleep(0)
+
+    # Tenant 1 bursts first, tenant 2 arrives right behind it
+    await scheduler.acquire(0)
+    tasks = [asyncio.create_task(create(1)) for _ in range(6)]
+    tasks += [asyncio.create_task(create(2)) for _ in range(2)]
+    await asyncio.sleep(0)
+    scheduler.release(0)
+    await asyncio.gather(*tasks)
+
+    # Three admissions for tenant 1 per admission for tenant 2
+    assert order == [1, 2, 1, 1, 1, 2, 1, 1]
+    stats = {t["tenantId"]: t for t in scheduler.get_stats()["tenants"]}
+    assert stats[1]["admitted"] == 6
+    assert stats[2]["admitted"] == 2
+    assert stats[2]["maxAdmissionMs"] > 0
+
+
+@pytest.mark.asyncio
+async def test_tenant_queue_is_bounded():
+    """Test a tenant's waiting admissions are capped."""
+    scheduler = AdmissionScheduler(
+        concurrency=1, quota_loader=_quota_loader({1: {"maxQueuedSessions": 1}})
+    )
+    await scheduler.acquire(1)
+    waiting = asyncio.create_task(scheduler.acquire(1))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejectedError):
+        await scheduler.acquire(1)
+
+    scheduler.release(1)
+    await waiting
+    assert scheduler.get_tenant_stats(1)["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_session_quota_counts_live_sessions():
+    """Test a tenant at its concurrent-session quota is rejected."""
+    scheduler = AdmissionScheduler(
+        quota_loader=_quota_loader({1: {"maxConcurrentSessions": 3}}),
+        live_sessions=lambda tenant_id: 2,
+    )
+    await scheduler.acquire(1)
+
+    with pytest.raises(AdmissionRejectedError):
+        await scheduler.acquire(1)
+
+
+@pytest.mark.asyncio
+async def test_live_admitted_session_is_counted_once():
+    """Test a session is not counted both as live and as being admitted."""
+    live = {1: 0}
+    scheduler = AdmissionScheduler(
+        quota_loader=_quota_loader({1: {"maxConcurrentSessions": 2}}),
+        live_sessions=lambda tenant_id: live[tenant_id],
+    )
+
+    async with scheduler.admit(1) as admission:
+        live[1] += 1
+        admission.mark_live()
+        # One session in use of two: a second admission still fits
+        async with scheduler.admit(1) as inner:
+            live[1] += 1
+            inner.mark_live()
+        with pytest.raises(AdmissionRejectedError):
+            await scheduler.acquire(1)
+
+    live[1] = 0
+    async with scheduler.admit(1):
+        pass
+    assert scheduler._queues[1].creating == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_admission_times_out():
+    """Test a queued admission fails after the timeout and leaves the queue."""
+    scheduler = AdmissionScheduler(concurrency=1, queue_timeout_seconds=0.05)
+    await scheduler.acquire(1)
+
+    with pytest.raises(AdmissionRejectedError):
+        await scheduler.acquire(2)
+
+    assert scheduler.get_stats()["queued"] == 0
+    assert scheduler.get_tenant_stats(2)["timedOut"] == 1
+
+
+@pytest.mark.asyncio
+async def test_quota_load_failure_uses_default():
+    """Test an unreachable quota source doesn't block admission."""
+    async def failing_loader(tenant_id):
+        raise ConnectionError("database unavailable")
+
+    scheduler = AdmissionScheduler(quota_loader=failing_loader)
+    async with scheduler.admit(1):
+        assert scheduler.get_tenant_stats(1)["inFlight"] == 1
+    assert scheduler.get_tenant_stats(1)["weight"] == 1.0
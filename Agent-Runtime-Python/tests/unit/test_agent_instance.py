@@ -0,0 +1,163 @@
+"""Unit tests for AgentInstance session slots and the join queue."""
+
+import asyncio
+
+import pytest
+
+from src.runtime.agent_instance import AgentAtCapacityError, AgentInstance
+from src.runtime.dispatch_pipeline import dispatch_pipeline
+
+
+def _instance(max_sessions, queue_size=0, queue_timeout_seconds=5.0):
+    config = {"agentId": 1, "tenantId": 1, "maxConcurrentSessions": max_sessions}
+    return AgentInstance(
+        1,
+        config,
+        queue_size=queue_size,
+        queue_timeout_seconds=queue_timeout_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_joins_never_overshoot_capacity():
+    """Test slots are reserved before the first await."""
+    instance = _instance(max_sessions=2)
+
+    results = await asyncio.gather(
+        *(instance.join_room(f"room-{i}") for i in range(5)),
+        return_exceptions=True,
+    )
+
+    joined = [r for r in results if not isinstance(r, Exception)]
+    rejected = [r for r in results if isinstance(r, AgentAtCapacityError)]
+    assert len(joined) == 2
+    assert len(rejected) == 3
+    assert len(instance.active_sessions) == 2
+    assert instance.get_queue_stats()["rejected"] == 3
+
+
+@pytest.mark.asyncio
+async def test_queued_join_gets_freed_slot():
+    """Test a join at capacity waits and takes the next freed slot."""
+    instance = _instance(max_sessions=1, queue_size=1)
+    first = await instance.join_room("room-1")
+
+    waiting = asyncio.create_task(instance.join_room("room-2"))
+    await asyncio.sleep(0)
+    assert instance.get_queue_stats()["queueDepth"] == 1
+
+    # Queue is full, so a third join is rejected straight away
+    with pytest.raises(AgentAtCapacityError):
+        await instance.join_room("room-3")
+
+    await instance.leave_room(first.session_id)
+    second = await waiting
+
+    assert instance.active_sessions == {second.session_id}
+    stats = instance.get_queue_stats()
+    assert stats["queueDepth"] == 0
+    assert stats["queued"] == 1
+    assert stats["reservedSlots"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_join_times_out():
+    """Test a queued join fails once its deadline passes."""
+    instance = _instance(max_sessions=1, queue_size=5, queue_timeout_seconds=0.05)
+    await instance.join_room("room-1")
+
+    with pytest.raises(AgentAtCapacityError):
+        await instance.join_room("room-2")
+
+    stats = instance.get_queue_stats()
+    assert stats["timedOut"] == 1
+    assert stats["queueDepth"] == 0
+    assert stats["maxWaitMs"] >= 50
+
+
+@pytest.mark.asyncio
+async def test_cleanup_fails_waiting_joins():
+    """Test unregistering an agent releases joins still in its queue."""
+    instance = _instance(max_sessions=1, queue_size=1)
+    await instance.join_room("room-1")
+    waiting = asyncio.create_task(instance.join_room("room-2"))
+    await asyncio.sleep(0)
+
+    await instance.cleanup()
+
+    with pytest.raises(AgentAtCapacityError):
+        await waiting
+    assert instance.get_queue_stats()["reservedSlots"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cleanup_ends_sessions_in_bulk():
+    """Test cleanup ends every active session and reports progress."""
+    from src.runtime.session_manager import session_manager
+
+    instance = _instance(max_sessions=10)
+    sessions = [await instance.join_room(f"room-{i}") for i in range(5)]
+
+    progress = await instance.cleanup(concurrency=2)
+
+    assert progress.state == "completed"
+    assert progress.total_sessions == 5
+    assert progress.ended_sessions == 5
+    assert instance.active_sessions == set()
+    assert all(session.status == "ended" for session in sessions)
+    assert all(
+        session_manager._sessions.peek(session.session_id) is None
+        for session in sessions
+    )
+
+
+class _Forbidden(Exception):
+    status = 403
+
+
+class _DispatchingInstance(AgentInstance):
+    """Instance whose LiveKit dispatch call is answered without a server."""
+
+    def __init__(self, error=None):
+        config = {
+            "agentId": 1,
+            "tenantId": 1,
+            "maxConcurrentSessions": 5,
+            "livekitConfig": {
+                "url": "ws://livekit.test",
+                "apiKey": "key",
+                "apiSecret": "secret",
+            },
+        }
+        super().__init__(1, config, queue_size=0)
+        self.error = error
+        self.dispatched = []
+
+    async def _send_dispatch(self, livekit_url, api_key, api_secret, room_name, agent_name, session_id):
+        self.dispatched.append((room_name, session_id))
+        if self.error:
+            raise self.error
+
+
+@pytest.mark.asyncio
+async def test_join_stays_connecting_until_dispatched():
+    """Test a joined session only becomes active once its dispatch is sent."""
+    instance = _DispatchingInstance()
+
+    session = await instance.join_room("room-1")
+    assert session.status == "connecting"
+
+    await dispatch_pipeline.drain()
+    assert instance.dispatched == [("room-1", session.session_id)]
+    assert session.status == "active"
+
+
+@pytest.mark.asyncio
+async def test_join_fails_when_dispatch_is_rejected():
+    """Test a rejected dispatch fails the session instead of activating it."""
+    instance = _DispatchingInstance(error=_Forbidden("agent not allowed"))
+
+    session = await instance.join_room("room-1")
+    await dispatch_pipeline.drain()
+
+    assert session.status == "failed"
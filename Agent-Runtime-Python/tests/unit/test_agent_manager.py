@@ -1,5 +1,7 @@
 """Unit tests for AgentManager using real database."""
 
+import asyncio
+
 import pytest
 from src.runtime.agent_manager import AgentManager
 
@@ -83,3 +85,51 @@ def agent_manager():
     return AgentManager()
 
 
+
+
+@pytest.mark.asyncio
+async def test_register_agents_concurrently(agent_manager, sample_agent_config):
+    """Test bulk registration initializes every agent."""
+    configs = [
+        (agent_id, {**sample_agent_config, "agentId": agent_id})
+        for agent_id in range(1, 6)
+    ]
+    
+    registered = await agent_manager.register_agents(configs, concurrency=2)
+    
+    assert registered == 5
+    assert sorted(agent_manager.list_agents()) == [1, 2, 3, 4, 5]
+    assert all(
+        agent_manager.get_agent_instance(agent_id).initialized
+        for agent_id in range(1, 6)
+    )
+
+
+@pytest.mark.asyncio
+async def test_unregister_agent_in_background(agent_manager, sample_agent_config):
+    """Test background unregistration reports teardown progress."""
+    await agent_manager.register_agent(1, sample_agent_config)
+    
+    progress = await agent_manager.unregister_agent(1, wait=False)
+    
+    assert progress.state == "running"
+    assert agent_manager.get_agent_instance(1) is None
+    await agent_manager._teardown_tasks[1]
+    assert agent_manager.get_teardown_progress(1).state == "completed"
+    assert await agent_manager.unregister_agent(1) is None
+
+
+@pytest.mark.asyncio
+async def test_finished_teardowns_are_forgotten(sample_agent_config):
+    """Test teardown records are dropped once their retention passes."""
+    manager = AgentManager(teardown_retention_seconds=0)
+    await manager.register_agent(1, sample_agent_config)
+    await manager.register_agent(2, sample_agent_config)
+    
+    await manager.unregister_agent(1)
+    await manager.unregister_agent(2, wait=False)
+    await manager._teardown_tasks[2]
+    await asyncio.sleep(0.01)
+    
+    assert manager._teardown_tasks == {}
+    assert manager._teardowns == {}
@@ -1,18 +1,33 @@
 """Unit tests for database operations using real database."""
 
 import pytest
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from src.database.operations import (
     get_agent_by_id,
     create_session,
+    create_sessions,
     update_session_status,
+    update_sessions,
+    update_session_states,
     end_session,
+    end_sessions,
+    end_sessions_at,
     get_session_by_id,
+    get_sessions_by_ids,
+    list_agent_sessions,
+    register_runtime_instance,
+    record_runtime_heartbeat,
+    mark_stale_runtime_instances,
+    list_live_runtime_instances,
+    stream_live_sessions,
     get_agent_metrics,
     get_tenant_metrics,
     get_session_metrics,
+    rollup_session_metrics,
+    backfill_agent_daily_metrics,
 )
-from src.database.models import Agent, AgentInstanceSession
+from src.database.models import Agent, AgentInstanceSession, AgentRuntimeInstance, SessionMetric
+from sqlalchemy import select, text
 
 
 @pytest.mark.asyncio
@@ -106,6 +121,160 @@ async def test_end_session(db_session):
     await db_session.commit()
 
 
+@pytest.mark.asyncio
+async def test_create_and_update_sessions_batch(db_session):
+    """Test multi-row insert and keyed batch update."""
+    await create_sessions(db_session, [
+        {
+            "agent_id": 1,
+            "tenant_id": 1,
+            "session_id": f"test-session-batch-{i}",
+            "room_name": "test-room",
+            "status": "connecting",
+            "started_at": datetime.utcnow(),
+        }
+        for i in range(3)
+    ])
+    await update_sessions(db_session, [
+        {"session_id": "test-session-batch-0", "status": "active"},
+        {"session_id": "test-session-batch-1", "status": "active", "participant_count": 2},
+    ])
+    await db_session.commit()
+
+    first = await get_session_by_id(db_session, "test-session-batch-0")
+    second = await get_session_by_id(db_session, "test-session-batch-1")
+    third = await get_session_by_id(db_session, "test-session-batch-2")
+    assert first.status == "active"
+    assert second.status == "active"
+    assert second.participant_count == 2
+    assert third.status == "connecting"
+
+
+@pytest.mark.asyncio
+async def test_update_session_states(db_session):
+    """Test one UPDATE writes live sessions and leaves ended ones alone."""
+    await create_sessions(db_session, [
+        {
+            "agent_id": 1,
+            "tenant_id": 1,
+            "session_id": f"test-session-states-{i}",
+            "room_name": "test-room",
+            "status": "ended" if i == 2 else "connecting",
+            "started_at": datetime.utcnow(),
+        }
+        for i in range(3)
+    ])
+    await db_session.commit()
+
+    updated = await update_session_states(db_session, [
+        {"session_id": f"test-session-states-{i}", "status": "active", "participant_count": i + 1}
+        for i in range(3)
+    ])
+    await db_session.commit()
+
+    assert updated == 2
+    first = await get_session_by_id(db_session, "test-session-states-0")
+    ended = await get_session_by_id(db_session, "test-session-states-2")
+    assert (first.status, first.participant_count) == ("active", 1)
+    assert ended.status == "ended"
+
+
+@pytest.mark.asyncio
+async def test_end_session_already_ended(db_session):
+    """Test ending an already ended session is a no-op."""
+    await create_session(
+        db_session,
+        agent_id=1,
+        tenant_id=1,
+        session_id="test-session-end-twice",
+        room_name="test-room",
+        status="active",
+    )
+    await db_session.commit()
+
+    assert await end_session(db_session, "test-session-end-twice") is not None
+    assert await end_session(db_session, "test-session-end-twice") is None
+
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_end_sessions(db_session):
+    """Test ending several sessions in one statement."""
+    for suffix in ("a", "b", "c"):
+        await create_session(
+            db_session,
+            agent_id=1,
+            tenant_id=1,
+            session_id=f"test-session-bulk-{suffix}",
+            room_name="test-room",
+            status="active",
+        )
+    await db_session.commit()
+
+    ended = await end_sessions(
+        db_session, ["test-session-bulk-a", "test-session-bulk-b", "test-missing"]
+    )
+
+    assert sorted(s.session_id for s in ended) == ["test-session-bulk-a", "test-session-bulk-b"]
+    assert all(s.status == "ended" for s in ended)
+    assert all(s.duration_seconds is not None and s.duration_seconds >= 0 for s in ended)
+
+    untouched = await get_session_by_id(db_session, "test-session-bulk-c")
+    assert untouched.status == "active"
+
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_end_sessions_empty(db_session):
+    """Test ending an empty list of sessions is a no-op."""
+    assert await end_sessions(db_session, []) == []
+
+
+@pytest.mark.asyncio
+async def test_end_sessions_at_skips_terminal_sessions(db_session):
+    """Test per-session ends return only sessions they ended, and updates never reopen one."""
+    started_at = datetime.utcnow() - timedelta(seconds=90)
+    await create_sessions(db_session, [
+        {
+            "agent_id": 1,
+            "tenant_id": 1,
+            "session_id": f"test-session-end-at-{i}",
+            "room_name": "test-room",
+            "status": "ended" if i == 2 else "active",
+            "started_at": started_at,
+        }
+        for i in range(3)
+    ])
+    await db_session.commit()
+
+    ended_at = started_at + timedelta(seconds=60)
+    ended = await end_sessions_at(db_session, [
+        {"session_id": "test-session-end-at-0", "status": "ended", "ended_at": ended_at},
+        {
+            "session_id": "test-session-end-at-1",
+            "status": "failed",
+            "ended_at": ended_at,
+            "participant_count": 3,
+        },
+        {"session_id": "test-session-end-at-2", "status": "ended", "ended_at": ended_at},
+    ])
+    await update_sessions(db_session, [
+        {"session_id": "test-session-end-at-1", "status": "active"},
+    ])
+    assert await update_session_status(
+        db_session, "test-session-end-at-0", status="active"
+    ) is None
+    await db_session.commit()
+
+    assert sorted(ended) == ["test-session-end-at-0", "test-session-end-at-1"]
+    first = await get_session_by_id(db_session, "test-session-end-at-0")
+    failed = await get_session_by_id(db_session, "test-session-end-at-1")
+    assert (first.status, first.duration_seconds) == ("ended", 60)
+    assert (failed.status, failed.participant_count) == ("failed", 3)
+
+
 @pytest.mark.asyncio
 async def test_get_session_by_id(db_session):
     """Test getting session by ID."""
@@ -128,6 +297,126 @@ async def test_get_session_by_id(db_session):
     assert retrieved.agent_id == 1
 
 
+LIST_AGENT_ID = 990002
+
+
+@pytest.mark.asyncio
+async def test_get_sessions_by_ids(db_session):
+    """Test bulk lookup across several IN chunks."""
+    session_ids = [f"test-session-bulk-get-{i}" for i in range(5)]
+    await create_sessions(db_session, [
+        {
+            "agent_id": 1,
+            "tenant_id": 1,
+            "session_id": session_id,
+            "room_name": "test-room",
+            "status": "active",
+            "started_at": datetime.utcnow(),
+        }
+        for session_id in session_ids
+    ])
+    await db_session.commit()
+
+    found = await get_sessions_by_ids(
+        db_session, session_ids + ["test-missing"], chunk_size=2
+    )
+
+    assert sorted(s.session_id for s in found) == sorted(session_ids)
+
+
+@pytest.mark.asyncio
+async def test_list_agent_sessions_keyset(db_session):
+    """Test paging through an agent's sessions newest first."""
+    await create_sessions(db_session, [
+        {
+            "agent_id": LIST_AGENT_ID,
+            "tenant_id": 1,
+            "session_id": f"test-session-list-{i}",
+            "room_name": "test-room",
+            "status": "ended" if i % 2 else "active",
+            "started_at": datetime(2024, 1, 1, 12, 0, i),
+        }
+        for i in range(5)
+    ])
+    await db_session.commit()
+
+    first_page = await list_agent_sessions(db_session, LIST_AGENT_ID, limit=3)
+    last = first_page[-1]
+    second_page = await list_agent_sessions(
+        db_session, LIST_AGENT_ID, limit=3, before=(last.started_at, last.id)
+    )
+    ended = await list_agent_sessions(db_session, LIST_AGENT_ID, status="ended")
+
+    assert [s.session_id for s in first_page + second_page] == [
+        f"test-session-list-{i}" for i in (4, 3, 2, 1, 0)
+    ]
+    assert [s.session_id for s in ended] == ["test-session-list-3", "test-session-list-1"]
+
+
+@pytest.mark.asyncio
+async def test_register_runtime_instance_and_stream_live_sessions(db_session):
+    """Test a restarted pod keeps its instance ID and finds its live sessions."""
+    instance_id = await register_runtime_instance(db_session, "test-runtime-pod")
+    assert await register_runtime_instance(db_session, "test-runtime-pod") == instance_id
+
+    await create_sessions(db_session, [
+        {
+            "agent_id": 1,
+            "tenant_id": 1,
+            "session_id": f"test-session-owned-{i}",
+            "room_name": "test-room",
+            "status": "ended" if i == 2 else "active",
+            "runtime_instance_id": instance_id,
+            "started_at": datetime.utcnow(),
+        }
+        for i in range(3)
+    ])
+    await db_session.commit()
+
+    live = [s.session_id async for s in stream_live_sessions(db_session, instance_id)]
+    assert sorted(live) == ["test-session-owned-0", "test-session-owned-1"]
+
+
+@pytest.mark.asyncio
+async def test_runtime_heartbeat_and_stale_instances(db_session):
+    """Test heartbeats update load figures and silent instances are marked dead."""
+    instance_id = await record_runtime_heartbeat(
+        db_session, "test-heartbeat-pod", cpu_usage=40, memory_usage=512,
+        active_agent_count=3, sessions_handled_delta=10,
+    )
+    assert await record_runtime_heartbeat(
+        db_session, "test-heartbeat-pod", cpu_usage=55, active_agent_count=4,
+        sessions_handled_delta=5,
+    ) == instance_id
+    total = await db_session.scalar(
+        select(AgentRuntimeInstance.total_sessions_handled)
+        .where(AgentRuntimeInstance.id == instance_id)
+    )
+    assert total == 15
+
+    dead = await mark_stale_runtime_instances(
+        db_session, datetime.utcnow() + timedelta(seconds=1)
+    )
+    assert "test-heartbeat-pod" in dead
+    assert "test-heartbeat-pod" not in await mark_stale_runtime_instances(
+        db_session, datetime.utcnow() + timedelta(seconds=1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_live_runtime_instances(db_session):
+    """Test only running instances with a fresh heartbeat are listed."""
+    await record_runtime_heartbeat(db_session, "test-live-pod", metadata={"url": "http://a"})
+    await record_runtime_heartbeat(db_session, "test-draining-pod", status="draining")
+
+    live = await list_live_runtime_instances(
+        db_session, datetime.utcnow() - timedelta(seconds=30)
+    )
+    pod_names = {instance.pod_name for instance in live}
+    assert "test-live-pod" in pod_names
+    assert "test-draining-pod" not in pod_names
+
+
 @pytest.mark.asyncio
 async def test_get_agent_metrics_empty(db_session):
     """Test getting agent metrics when no data exists."""
@@ -161,3 +450,51 @@ async def test_get_session_metrics_not_found(db_session):
     assert metrics is None
 
 
+
+
+ROLLUP_AGENT_ID = 990001
+
+
+async def _seed_session_metric(db_session, session_id, latency, cost):
+    await create_session(
+        db_session,
+        agent_id=ROLLUP_AGENT_ID,
+        tenant_id=1,
+        session_id=session_id,
+        room_name="test-room",
+        status="active",
+    )
+    db_session.add(SessionMetric(
+        session_id=session_id,
+        agent_id=ROLLUP_AGENT_ID,
+        tenant_id=1,
+        date=date.today(),
+        avg_llm_latency=latency,
+        total_cost=cost,
+    ))
+    await db_session.flush()
+
+
+@pytest.mark.asyncio
+async def test_rollup_session_metrics(db_session):
+    """Test ended sessions are added to the daily rollup read by agent metrics."""
+    await db_session.execute(
+        text("DELETE FROM agent_daily_metrics WHERE agent_id = :agent_id"),
+        {"agent_id": ROLLUP_AGENT_ID},
+    )
+    await _seed_session_metric(db_session, "test-rollup-1", 100, 5)
+    await _seed_session_metric(db_session, "test-rollup-2", 300, 7)
+
+    await rollup_session_metrics(db_session, ["test-rollup-1"])
+    await rollup_session_metrics(db_session, ["test-rollup-2"])
+
+    metrics = await get_agent_metrics(db_session, agent_id=ROLLUP_AGENT_ID)
+    assert metrics["totalSessions"] == 2
+    assert metrics["avgLatency"] == 200.0
+    assert metrics["totalCost"] == 12.0
+
+    # Backfill rebuilds the same totals instead of adding to them
+    assert await backfill_agent_daily_metrics(db_session, agent_id=ROLLUP_AGENT_ID) == 1
+    assert await get_agent_metrics(db_session, agent_id=ROLLUP_AGENT_ID) == metrics
+
+    await db_session.rollback()
@@ -0,0 +1,93 @@
+"""Unit tests for database engine and pool configuration."""
+
+import pytest
+from src.config.config import DatabaseConfig
+from src.database.db import (
+    ASYNC_DATABASE_URL,
+    _build_engine,
+    get_lazy_db,
+    get_pool_stats,
+    InstrumentedQueuePool,
+    LazySession,
+    PoolStats,
+)
+
+
+@pytest.fixture
+def pooled_engine(monkeypatch):
+    """Create an engine with pooling enabled from environment settings."""
+    monkeypatch.setenv("DB_POOL_SIZE", "4")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "2")
+    monkeypatch.setenv("DB_POOL_RECYCLE", "600")
+    return _build_engine(ASYNC_DATABASE_URL, DatabaseConfig())
+
+
+def test_engine_uses_instrumented_pool(pooled_engine):
+    """Test the engine is built with a real pool sized from DatabaseConfig."""
+    pool = pooled_engine.sync_engine.pool
+    assert isinstance(pool, InstrumentedQueuePool)
+    assert pool.size() == 4
+    assert pool._max_overflow == 2
+    assert pool._recycle == 600
+    assert pool._pre_ping is True
+
+
+def test_engine_pooling_disabled(monkeypatch):
+    """Test DB_POOL_SIZE=0 falls back to unpooled connections."""
+    monkeypatch.setenv("DB_POOL_SIZE", "0")
+    unpooled = _build_engine(ASYNC_DATABASE_URL, DatabaseConfig())
+
+    assert get_pool_stats(unpooled) == {"pooled": False}
+
+
+def test_pool_stats_record_wait():
+    """Test checkout wait accounting."""
+    stats = PoolStats()
+    stats.checkouts = 2
+    stats.record_wait(4.0)
+    stats.record_wait(2.0)
+    stats.record_wait(30.0, timed_out=True)
+
+    snapshot = stats.snapshot()
+    assert snapshot["checkouts"] == 2
+    assert snapshot["timeouts"] == 1
+    assert snapshot["maxWaitMs"] == 30.0
+    assert snapshot["avgWaitMs"] == 12.0
+
+
+def test_get_pool_stats(pooled_engine):
+    """Test pool statistics format."""
+    stats = get_pool_stats(pooled_engine)
+
+    assert stats["pooled"] is True
+    assert stats["size"] == 4
+    assert stats["maxOverflow"] == 2
+    assert stats["checkedOut"] == 0
+    assert stats["checkouts"] == 0
+    assert "avgWaitMs" in stats
+
+
+@pytest.mark.asyncio
+async def test_lazy_session_untouched():
+    """Test an unused lazy session never creates a database session."""
+    dependency = get_lazy_db()
+    lazy_session = await dependency.__anext__()
+
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    assert lazy_session.touched is False
+
+
+@pytest.mark.asyncio
+async def test_lazy_session_created_on_first_use():
+    """Test the session is created on first attribute access and closed on finish."""
+    lazy_session = LazySession()
+    assert lazy_session.touched is False
+
+    assert len(lazy_session.new) == 0
+    assert lazy_session.touched is True
+
+    # Nothing was executed, so finishing must not need a connection
+    await lazy_session.finish()
+    assert lazy_session.touched is False
@@ -0,0 +1,175 @@
+"""Unit tests for the background dispatch pipeline."""
+
+import asyncio
+
+import pytest
+
+from src.runtime.dispatch_pipeline import (
+    CircuitBreaker,
+    DispatchJob,
+    DispatchPipeline,
+)
+
+
+class FlakySender:
+    """Dispatch call that fails a set number of times before succeeding."""
+
+    def __init__(self, failures=0, error=ConnectionError("livekit unavailable")):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+
+
+class ClientError(Exception):
+    """Error carrying an HTTP status like livekit.api.ServerError."""
+
+    def __init__(self, status, metadata=None):
+        super().__init__(f"status {status}")
+        self.status = status
+        self.metadata = metadata or {}
+
+
+def _pipeline(failed, **kwargs):
+    async def on_failed(session_id):
+        failed.append(session_id)
+
+    kwargs.setdefault("retry_base_seconds", 0.001)
+    return DispatchPipeline(on_failed, workers=2, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_succeeds_after_retries():
+    """Test transient failures are retried until the dispatch goes through."""
+    failed = []
+    pipeline = _pipeline(failed, max_attempts=5)
+    sender = FlakySender(failures=2)
+
+    await pipeline.submit(DispatchJob("session-1", sender))
+    await pipeline.drain()
+
+    assert sender.calls == 3
+    assert failed == []
+    stats = pipeline.get_stats()
+    assert stats["dispatched"] == 1
+    assert stats["retried"] == 2
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_session_fails_when_retries_run_out():
+    """Test the failure callback runs once every attempt has failed."""
+    failed = []
+    pipeline = _pipeline(failed, max_attempts=3)
+    sender = FlakySender(failures=10)
+
+    await pipeline.submit(DispatchJob("session-1", sender))
+    await pipeline.drain()
+
+    assert sender.calls == 3
+    assert failed == ["session-1"]
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried():
+    """Test a 4xx response fails the session without retrying."""
+    failed = []
+    pipeline = _pipeline(failed)
+    sender = FlakySender(failures=1, error=ClientError(404))
+
+    await pipeline.submit(DispatchJob("session-1", sender))
+    await pipeline.drain()
+
+    assert sender.calls == 1
+    assert failed == ["session-1"]
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_dispatch_is_retried():
+    """Test a 429 is retried after its Retry-After and then goes through."""
+    failed = []
+    pipeline = _pipeline(failed)
+    sender = FlakySender(
+        failures=1, error=ClientError(429, metadata={"Retry-After": "0.05"})
+    )
+
+    started = asyncio.get_running_loop().time()
+    await pipeline.submit(DispatchJob("session-1", sender))
+    await pipeline.drain()
+
+    assert sender.calls == 2
+    assert failed == []
+    assert asyncio.get_running_loop().time() - started >= 0.05
+    assert pipeline.get_stats()["dispatched"] == 1
+    await pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast():
+    """Test dispatches stop reaching LiveKit once the circuit opens."""
+    failed = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60)
+    pipeline = _pipeline(failed, max_attempts=3, breaker=breaker)
+    sender = FlakySender(failures=100)
+
+    for i in range(3):
+        await pipeline.submit(DispatchJob(f"session-{i}", sender))
+    await pipeline.drain()
+
+    # Two real failures open the circuit; everything after is short-circuited
+    assert sender.calls == 2
+    assert sorted(failed) == ["session-0", "session-1", "session-2"]
+    stats = pipeline.get_stats()
+    assert stats["circuitState"] == "open"
+    assert stats["shortCircuited"] == 7
+    await pipeline.close()
+
+
+def test_circuit_half_opens_after_reset_timeout():
+    """Test one trial call is allowed after the reset timeout."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=0)
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_backoff_is_capped_and_jittered():
+    """Test retry delays grow exponentially up to the cap."""
+    pipeline = DispatchPipeline(None, retry_base_seconds=1, retry_max_seconds=4)
+
+    for attempt, ceiling in ((1, 1), (2, 2), (3, 4), (10, 4)):
+        delays = [pipeline.backoff_seconds(attempt) for _ in range(50)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert len(set(delays)) > 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_dispatch_is_not_sent():
+    """Test dispatches for ended sessions are dropped, including retries."""
+    failed = []
+    pipeline = _pipeline(failed, retry_base_seconds=0.05)
+    sender = FlakySender(failures=1)
+
+    await pipeline.submit(DispatchJob("session-1", sender))
+    # Cancel while the retry is waiting out its (jittered) backoff
+    while not sender.calls:
+        await asyncio.sleep(0)
+    assert pipeline.cancel(["session-1", "unknown"]) == 1
+    await pipeline.drain()
+
+    assert sender.calls == 1
+    assert failed == []
+    assert pipeline.get_stats()["cancelled"] == 1
+    await pipeline.close()
@@ -0,0 +1,102 @@
+"""Unit tests for drain mode."""
+
+import asyncio
+import os
+import signal
+
+import pytest
+
+from src.runtime.drain import DrainController, DrainingError
+
+
+class LiveSessions:
+    """Settable live-session count."""
+
+    def __init__(self, count=0):
+        self.count = count
+
+    def __call__(self):
+        return self.count
+
+
+def _controller(live, deadline_seconds=5.0):
+    return DrainController(
+        live, deadline_seconds=deadline_seconds, retry_after_seconds=7, poll_seconds=0.01
+    )
+
+
+@pytest.mark.asyncio
+async def test_draining_refuses_new_sessions():
+    """Test check passes while serving and refuses with a retry hint once draining."""
+    controller = _controller(LiveSessions(1))
+    controller.check()
+
+    assert controller.start(reason="admin")
+    assert not controller.start(reason="admin")
+    with pytest.raises(DrainingError) as exc_info:
+        controller.check()
+
+    assert exc_info.value.retry_after_seconds == 7
+    assert controller.get_stats()["refused"] == 1
+    controller.resume()
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_when_sessions_finish():
+    """Test the drain completes as soon as the last session ends."""
+    live = LiveSessions(2)
+    controller = _controller(live)
+    controller.start()
+
+    async def finish_sessions():
+        await asyncio.sleep(0.05)
+        live.count = 0
+
+    asyncio.create_task(finish_sessions())
+    assert await controller.wait() == 0
+    assert controller.state == "drained"
+
+
+@pytest.mark.asyncio
+async def test_wait_gives_up_at_deadline():
+    """Test the drain stops waiting once its deadline passes."""
+    controller = _controller(LiveSessions(3), deadline_seconds=0.05)
+    controller.start()
+
+    assert await controller.wait() == 3
+    assert controller.state == "expired"
+    assert controller.draining
+
+
+@pytest.mark.asyncio
+async def test_resume_accepts_sessions_again():
+    """Test cancelling a drain lets sessions through again."""
+    controller = _controller(LiveSessions(1))
+    controller.start()
+
+    assert controller.resume()
+    controller.check()
+    assert controller.get_stats()["state"] == "serving"
+
+
+@pytest.mark.asyncio
+async def test_signal_drains_before_previous_handler_runs():
+    """Test the replaced signal handler only runs once the drain finishes."""
+    live = LiveSessions(1)
+    controller = _controller(live)
+    received = []
+    original = signal.signal(signal.SIGUSR1, lambda signum, frame: received.append(signum))
+    try:
+        assert controller.install_signal_handler(signal.SIGUSR1)
+        os.kill(os.getpid(), signal.SIGUSR1)
+        await asyncio.sleep(0.05)
+
+        assert controller.state == "draining"
+        assert controller.reason == "SIGUSR1"
+        assert received == []
+
+        live.count = 0
+        await asyncio.sleep(0.05)
+        assert received == [signal.SIGUSR1]
+    finally:
+        signal.signal(signal.SIGUSR1, original)
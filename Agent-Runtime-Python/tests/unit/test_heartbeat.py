@@ -0,0 +1,72 @@
+"""Unit tests for the runtime instance heartbeat."""
+
+import pytest
+
+from src.runtime.agent_manager import AgentManager
+from src.runtime.heartbeat import HeartbeatWriter, ProcessSampler
+from src.runtime.session_manager import SessionManager
+
+
+def _write_proc(proc_dir, utime, stime, resident_pages):
+    # Command name with a space and a ")" to check field parsing
+    fields = ["S"] + ["0"] * 10 + [str(utime), str(stime)] + ["0"] * 30
+    (proc_dir / "stat").write_text(f"123 (python (main)) {' '.join(fields)}\n")
+    (proc_dir / "statm").write_text(f"1000 {resident_pages} 50 5 0 100 0\n")
+
+
+def test_sampler_reads_proc(tmp_path):
+    """Test CPU and RSS are read from stat/statm."""
+    _write_proc(tmp_path, utime=100, stime=50, resident_pages=256)
+    sampler = ProcessSampler(proc_dir=str(tmp_path))
+
+    assert sampler.rss_bytes() == 256 * sampler._page_size
+    assert sampler.cpu_percent() == 0.0
+    assert sampler._last[1] == 150 / sampler._ticks_per_second
+
+
+def test_sampler_without_proc(tmp_path):
+    """Test missing /proc files give no figures rather than errors."""
+    sampler = ProcessSampler(proc_dir=str(tmp_path / "missing"))
+
+    assert sampler.rss_bytes() is None
+    assert sampler.cpu_percent() is None
+
+
+@pytest.mark.asyncio
+async def test_sample_reports_live_counts():
+    """Test a heartbeat carries agent and session counts."""
+    agents = AgentManager()
+    sessions = SessionManager()
+    await agents.register_agent(1, {"agentId": 1, "maxConcurrentSessions": 4})
+    sessions.sessions_created = 7
+    writer = HeartbeatWriter(agents, sessions, pod_name="runtime-0")
+
+    sample = writer.sample()
+
+    assert sample["status"] == "running"
+    assert sample["active_agent_count"] == 1
+    assert sample["sessions_handled_delta"] == 7
+    assert sample["metadata"]["liveSessions"] == 0
+    assert sample["metadata"]["sessionCapacity"] == 4
+
+
+def _unreachable_database():
+    raise ConnectionError("database unavailable")
+
+
+@pytest.mark.asyncio
+async def test_failed_beat_is_counted():
+    """Test a heartbeat that cannot reach the database is logged, not raised."""
+    writer = HeartbeatWriter(
+        AgentManager(),
+        SessionManager(),
+        pod_name="runtime-0",
+        session_factory=_unreachable_database,
+    )
+
+    assert not await writer.beat()
+
+    stats = writer.get_stats()
+    assert stats["beats"] == 0
+    assert stats["failures"] == 1
+    assert "database unavailable" in stats["lastError"]
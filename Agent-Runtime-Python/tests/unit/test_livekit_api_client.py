@@ -0,0 +1,40 @@
+"""Unit tests for the shared LiveKit API client registry."""
+
+import pytest
+
+from src.livekit.api_client import LiveKitAPIRegistry
+
+URL = "ws://localhost:7880"
+KEY = "devkey-livekit-api-key-2024"
+SECRET = "devkey-livekit-api-secret-2024-min-32-chars"
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_per_credentials():
+    """Test one client is reused per (url, key, secret)."""
+    registry = LiveKitAPIRegistry()
+
+    first = registry.get(URL, KEY, SECRET)
+    assert registry.get(URL, KEY, SECRET) is first
+    assert registry.get(URL, KEY, SECRET + "-other") is not first
+
+    stats = registry.get_stats()
+    assert stats["created"] == 2
+    assert stats["reused"] == 1
+    assert stats["clients"] == 2
+    await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_close_releases_client_sessions():
+    """Test close shuts every HTTP session and later calls get a new client."""
+    registry = LiveKitAPIRegistry()
+    client = registry.get(URL, KEY, SECRET)
+    session = registry._clients[(URL, KEY, SECRET)][1]
+
+    await registry.close()
+
+    assert session.closed
+    assert registry.get_stats()["clients"] == 0
+    assert registry.get(URL, KEY, SECRET) is not client
+    await registry.close()
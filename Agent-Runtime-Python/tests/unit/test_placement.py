@@ -0,0 +1,244 @@
+"""Unit tests for cross-replica session placement."""
+
+import pytest
+from aiohttp import web
+
+from src.runtime.placement import (
+    FORWARD_SECRET_HEADER,
+    FORWARDED_HEADER,
+    PlacementForwardError,
+    PlacementUnavailableError,
+    RuntimeNode,
+    SessionPlacer,
+    preferred_pods,
+)
+
+
+def _node(pod_name, live_sessions=0, capacity=10, agent_ids=(1,), url="http://unused"):
+    return RuntimeNode(
+        pod_name=pod_name,
+        url=url,
+        live_sessions=live_sessions,
+        capacity=capacity,
+        cpu_percent=0.0,
+        agent_ids=frozenset(agent_ids),
+    )
+
+
+def _placer(nodes, pod_name="pod-0", **kwargs):
+    async def load():
+        return list(nodes)
+
+    kwargs.setdefault("refresh_seconds", 60)
+    kwargs.setdefault("secret", "placement-secret")
+    return SessionPlacer(pod_name, load, **kwargs)
+
+
+def test_preferred_pods_are_stable():
+    """Test removing a pod only moves the agents that preferred it."""
+    pods = [f"pod-{i}" for i in range(6)]
+    before = {agent_id: preferred_pods(agent_id, pods, 2) for agent_id in range(200)}
+    after = {
+        agent_id: preferred_pods(agent_id, pods[:-1], 2) for agent_id in range(200)
+    }
+
+    for agent_id, preferred in before.items():
+        if "pod-5" not in preferred:
+            assert after[agent_id] == preferred
+    # Agents spread over every pod
+    assert {pod for preferred in before.values() for pod in preferred} == set(pods)
+
+
+@pytest.mark.asyncio
+async def test_choose_picks_least_loaded_preferred_pod():
+    """Test the least utilized of the agent's preferred pods is chosen."""
+    nodes = [
+        _node("pod-1", live_sessions=8),
+        _node("pod-2", live_sessions=2),
+        _node("pod-3", live_sessions=5),
+    ]
+    placer = _placer(nodes, pod_name="pod-9", preferred_pods=3)
+
+    assert (await placer.choose(1)).pod_name == "pod-2"
+
+
+@pytest.mark.asyncio
+async def test_choose_skips_full_pods_and_pods_without_the_agent():
+    """Test only pods with the agent and free capacity are eligible."""
+    nodes = [
+        _node("pod-1", live_sessions=10),
+        _node("pod-2", agent_ids=(2,)),
+        _node("pod-3", live_sessions=9),
+    ]
+    placer = _placer(nodes, pod_name="pod-9", preferred_pods=3)
+
+    assert (await placer.choose(1)).pod_name == "pod-3"
+    # The placement is counted, so pod-3 is now full too
+    assert await placer.choose(1) is None
+
+
+@pytest.mark.asyncio
+async def test_local_pod_keeps_session_within_slack():
+    """Test this pod keeps the session when it is nearly as idle as the best."""
+    nodes = [_node("pod-0", live_sessions=3), _node("pod-1", live_sessions=2)]
+    placer = _placer(nodes, preferred_pods=2, local_slack=0.15)
+
+    assert (await placer.choose(1)).pod_name == "pod-0"
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_placed_elsewhere_without_a_secret():
+    """Test placement keeps every session local until a secret is configured."""
+    placer = _placer([_node("pod-1")], pod_name="pod-9", secret=None)
+
+    assert await placer.choose(1) is None
+    assert not placer.is_trusted(None)
+
+
+def test_forwarded_requests_need_the_shared_secret():
+    """Test only the configured secret marks a request as forwarded."""
+    placer = _placer([])
+
+    assert placer.is_trusted("placement-secret")
+    assert not placer.is_trusted("guess")
+    assert not placer.is_trusted(None)
+
+
+@pytest.mark.asyncio
+async def test_burst_spreads_across_pods():
+    """Test placements between refreshes are counted against the cached load."""
+    nodes = [_node(f"pod-{i}", capacity=100) for i in range(1, 4)]
+    placer = _placer(nodes, pod_name="pod-9", preferred_pods=3)
+
+    chosen = [(await placer.choose(1)).pod_name for _ in range(30)]
+
+    assert {pod: chosen.count(pod) for pod in set(chosen)} == {
+        "pod-1": 10, "pod-2": 10, "pod-3": 10
+    }
+
+
+async def _serve(handler, path="/api/sessions/create"):
+    app = web.Application()
+    app.router.add_post(path, handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+@pytest.mark.asyncio
+async def test_forward_creates_session_on_other_pod():
+    """Test a forwarded request is marked and returns the remote session."""
+    received = []
+
+    async def create(request):
+        received.append((
+            request.headers.get(FORWARDED_HEADER),
+            request.headers.get(FORWARD_SECRET_HEADER),
+            await request.json(),
+        ))
+        return web.json_response({
+            "success": True, "session": {"sessionId": "s-1", "roomName": "room-1"}
+        })
+
+    runner, url = await _serve(create)
+    placer = _placer([])
+    try:
+        session = await placer.forward(_node("pod-1", url=url), {"agentId": 1})
+    finally:
+        await placer.close()
+        await runner.cleanup()
+
+    assert session == {"sessionId": "s-1", "roomName": "room-1"}
+    assert received == [("pod-0", "placement-secret", {"agentId": 1})]
+    assert placer.get_stats()["forwarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_forward_passes_client_errors_through():
+    """Test a 4xx from the other pod is returned to the caller."""
+    async def create(request):
+        return web.json_response({"detail": "room name taken"}, status=409)
+
+    runner, url = await _serve(create)
+    placer = _placer([])
+    try:
+        with pytest.raises(PlacementForwardError) as exc_info:
+            await placer.forward(_node("pod-1", url=url), {"agentId": 1})
+    finally:
+        await placer.close()
+        await runner.cleanup()
+
+    assert exc_info.value.status == 409
+    assert exc_info.value.detail == "room name taken"
+
+
+@pytest.mark.asyncio
+async def test_busy_pod_falls_back_to_local_creation():
+    """Test a 429 from the other pod lets this pod create the session."""
+    async def create(request):
+        return web.json_response({"detail": "over quota"}, status=429)
+
+    runner, url = await _serve(create)
+    node = _node("pod-1", url=url)
+    placer = _placer([node], pod_name="pod-9")
+    try:
+        assert (await placer.choose(1)).pod_name == "pod-1"
+        with pytest.raises(PlacementUnavailableError):
+            await placer.forward(node, {"agentId": 1})
+    finally:
+        await placer.close()
+        await runner.cleanup()
+
+    # Busy, not broken: it stays eligible for other sessions
+    assert (await placer.choose(1)).pod_name == "pod-1"
+    assert placer.get_stats()["forwardFailed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_end_is_forwarded_to_the_owning_pod():
+    """Test ending a session owned by another pod is sent to that pod."""
+    received = []
+
+    async def end(request):
+        received.append((
+            request.match_info["session_id"],
+            request.headers.get(FORWARD_SECRET_HEADER),
+        ))
+        return web.json_response({"success": True})
+
+    owners = {"s-1": "pod-1", "s-2": "pod-0"}
+
+    async def load_owner(session_id):
+        return owners.get(session_id)
+
+    runner, url = await _serve(end, path="/api/sessions/{session_id}/end")
+    placer = _placer([_node("pod-1", url=url)], owner_loader=load_owner)
+    try:
+        assert await placer.forward_end("s-1")
+        # Owned here, or by no live pod: end it locally
+        assert not await placer.forward_end("s-2")
+        assert not await placer.forward_end("s-unknown")
+    finally:
+        await placer.close()
+        await runner.cleanup()
+
+    assert received == [("s-1", "placement-secret")]
+    assert placer.get_stats()["endsForwarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unreachable_pod_is_dropped():
+    """Test a pod that cannot be reached is not chosen again until refresh."""
+    node = _node("pod-1", url="http://127.0.0.1:9")
+    placer = _placer([node], pod_name="pod-9")
+    assert (await placer.choose(1)).pod_name == "pod-1"
+
+    with pytest.raises(PlacementUnavailableError):
+        await placer.forward(node, {"agentId": 1})
+    await placer.close()
+
+    assert await placer.choose(1) is None
+    assert placer.get_stats()["forwardFailed"] == 1
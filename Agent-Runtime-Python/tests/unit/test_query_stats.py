@@ -0,0 +1,117 @@
+"""Unit tests for per-statement query statistics."""
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from src.database import query_stats as query_stats_module
+from src.database.query_stats import (
+    QueryStats,
+    fingerprint,
+    instrument_engine,
+    parameter_shape,
+)
+
+
+def test_fingerprint_normalizes_literals_and_in_lists():
+    """Test statements differing only in literals share a fingerprint."""
+    first = fingerprint("SELECT *  FROM t\n WHERE id = 42 AND name = 'a''b'")
+    second = fingerprint("SELECT * FROM t WHERE id = 7 AND name = 'x'")
+    assert first == second == "SELECT * FROM t WHERE id = ? AND name = ?"
+
+    assert fingerprint("SELECT * FROM t WHERE id IN ($1, $2, $3)") == fingerprint(
+        "SELECT * FROM t WHERE id IN ($1, $2)"
+    )
+    assert "(...)" in fingerprint("SELECT * FROM t WHERE id IN ($1, $2)")
+
+
+def test_fingerprint_keeps_identifiers_with_digits():
+    """Test numbers inside identifiers are not replaced."""
+    assert fingerprint("SELECT col1 FROM t2") == "SELECT col1 FROM t2"
+
+
+def test_parameter_shape_reports_types_only():
+    """Test parameter shapes never include values."""
+    assert parameter_shape(None) is None
+    assert parameter_shape({"id": 1, "name": "secret"}) == {"id": "int", "name": "str"}
+    assert parameter_shape((1, "secret", [1, 2])) == ["int", "str", "list[2]"]
+    assert parameter_shape([(1, "a"), (2, "b")]) == {
+        "executemany": 2,
+        "first": ["int", "str"],
+    }
+
+
+def test_record_builds_histogram_and_totals():
+    """Test record aggregates counts, rows, pool wait and buckets."""
+    stats = QueryStats(slow_query_ms=1000)
+    stats.record("SELECT 1", 0.5, rows=1, pool_wait_ms=2.0)
+    stats.record("SELECT 2", 30.0, rows=1)
+    stats.record("SELECT 3", 6000.0, error=True)
+
+    [entry] = stats.snapshot()
+    assert entry["fingerprint"] == "SELECT ?"
+    assert entry["count"] == 3
+    assert entry["rows"] == 2
+    assert entry["poolWaitMs"] == 2.0
+    assert entry["errors"] == 1
+    assert entry["maxMs"] == 6000.0
+    assert entry["histogram"]["le1ms"] == 1
+    assert entry["histogram"]["le50ms"] == 1
+    assert entry["histogram"]["inf"] == 1
+    assert stats.slow_queries == 1
+
+
+def test_snapshot_orders_by_total_time_and_limits():
+    """Test snapshot returns the most expensive fingerprints first."""
+    stats = QueryStats()
+    stats.record("SELECT * FROM a", 1.0)
+    stats.record("SELECT * FROM b", 10.0)
+
+    entries = stats.snapshot()
+    assert [e["fingerprint"] for e in entries] == ["SELECT * FROM b", "SELECT * FROM a"]
+    assert len(stats.snapshot(limit=1)) == 1
+
+    stats.reset()
+    assert stats.snapshot() == []
+
+
+def test_fingerprints_are_capped(monkeypatch):
+    """Test distinct fingerprints beyond the cap are grouped together."""
+    monkeypatch.setattr(query_stats_module, "MAX_FINGERPRINTS", 2)
+    stats = QueryStats()
+    stats.record("SELECT * FROM a", 1.0)
+    stats.record("SELECT * FROM b", 1.0)
+    stats.record("SELECT * FROM c", 1.0)
+    stats.record("SELECT * FROM d", 1.0)
+
+    other = [e for e in stats.snapshot() if e["fingerprint"] == "<other>"]
+    assert other and other[0]["count"] == 2
+
+
+def test_slow_query_is_logged_with_parameter_shape(caplog):
+    """Test slow statements are logged with parameter types but not values."""
+    stats = QueryStats(slow_query_ms=100)
+    with caplog.at_level("WARNING", logger="src.database.query_stats"):
+        stats.record("SELECT * FROM t WHERE id = $1", 150.0, parameters=("secret",))
+
+    assert "Slow query" in caplog.text
+    assert "'str'" in caplog.text
+    assert "secret" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_instrument_engine_records_statements(test_engine):
+    """Test engine events record executed statements."""
+    engine = create_async_engine(test_engine.url, poolclass=NullPool)
+    stats = QueryStats()
+    instrument_engine(engine, stats)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            await conn.execute(text("SELECT 2"))
+    finally:
+        await engine.dispose()
+
+    entry = next(e for e in stats.snapshot() if e["fingerprint"] == "SELECT ?")
+    assert entry["count"] == 2
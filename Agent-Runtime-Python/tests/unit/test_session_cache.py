@@ -0,0 +1,69 @@
+"""Unit tests for SessionCache."""
+
+import time
+
+from src.runtime.session_cache import SessionCache
+
+
+def test_get_counts_hits_and_misses():
+    """Test lookups are counted."""
+    cache = SessionCache()
+    cache.put("a", {"sessionId": "a"})
+
+    assert cache.get("a") == {"sessionId": "a"}
+    assert cache.get("missing") is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hitRate"] == 0.5
+
+
+def test_lru_eviction():
+    """Test the least recently used unpinned entry is evicted first."""
+    cache = SessionCache(max_size=2)
+    cache.put("a", {"sessionId": "a"})
+    cache.put("b", {"sessionId": "b"})
+    cache.get("a")
+    cache.put("c", {"sessionId": "c"})
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert cache.get_stats()["evictions"] == 1
+
+
+def test_pinned_entries_are_not_evicted_or_counted():
+    """Test pinned entries survive eviction and don't use up max_size."""
+    cache = SessionCache(max_size=1, ttl_seconds=0)
+    cache.put("live", {"sessionId": "live"}, pinned=True)
+    cache.put("a", {"sessionId": "a"})
+    cache.put("b", {"sessionId": "b"})
+
+    assert cache.get("live") == {"sessionId": "live"}
+    assert len(cache) == 2
+    assert cache.get_stats()["pinned"] == 1
+
+
+def test_ttl_expiry():
+    """Test unpinned entries expire after their TTL."""
+    cache = SessionCache(ttl_seconds=0.01)
+    cache.put("a", {"sessionId": "a"})
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    stats = cache.get_stats()
+    assert stats["expirations"] == 1
+    assert stats["size"] == 0
+
+
+def test_repinning_as_unpinned_makes_entry_evictable():
+    """Test putting a pinned entry again unpinned moves it into the LRU."""
+    cache = SessionCache(max_size=1)
+    cache.put("a", {"sessionId": "a"}, pinned=True)
+    cache.put("a", {"sessionId": "a"})
+    cache.put("b", {"sessionId": "b"})
+
+    assert "a" not in cache
+    assert cache.pop("b") == {"sessionId": "b"}
+    assert len(cache) == 0
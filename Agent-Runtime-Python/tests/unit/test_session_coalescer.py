@@ -0,0 +1,86 @@
+"""Unit tests for SessionChangeCoalescer."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from src.runtime.session_coalescer import SessionChangeCoalescer
+from src.runtime.session_record import SessionRecord
+
+
+def make_session(session_id: str) -> SessionRecord:
+    return SessionRecord(
+        session_id=session_id,
+        agent_id=1,
+        tenant_id=1,
+        room_name="room-1",
+        status="active",
+        started_at=datetime.utcnow(),
+    )
+
+
+class RecordingWriter:
+    """Collects written batches as (session_id, status, participant_count)."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, sessions):
+        self.batches.append(
+            [(s.session_id, s.status, s.participant_count) for s in sessions]
+        )
+
+
+@pytest.mark.asyncio
+async def test_burst_of_changes_is_written_once():
+    """Test changes to one session inside the window become one write."""
+    writer = RecordingWriter()
+    coalescer = SessionChangeCoalescer(writer, window_seconds=0.05)
+    session = make_session("a")
+    for count in range(1, 6):
+        session.participant_count = count
+        coalescer.record(session)
+
+    await asyncio.sleep(0.15)
+    await coalescer.close()
+
+    assert writer.batches == [[("a", "active", 5)]]
+    stats = coalescer.get_stats()
+    assert stats["changes"] == 5
+    assert stats["coalesced"] == 4
+    assert stats["written"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_a_batch():
+    """Test sessions whose windows close together are written together."""
+    writer = RecordingWriter()
+    coalescer = SessionChangeCoalescer(writer, window_seconds=0.05)
+    for session_id in ("a", "b", "c"):
+        coalescer.record(make_session(session_id))
+
+    await asyncio.sleep(0.15)
+    await coalescer.close()
+
+    assert [sorted(s[0] for s in batch) for batch in writer.batches] == [["a", "b", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_discarded_and_ended_sessions_are_skipped():
+    """Test the end path supersedes pending changes."""
+    writer = RecordingWriter()
+    coalescer = SessionChangeCoalescer(writer, window_seconds=10)
+    discarded = make_session("a")
+    ended = make_session("b")
+    kept = make_session("c")
+    for session in (discarded, ended, kept):
+        coalescer.record(session)
+    coalescer.discard("a")
+    ended.status = "ended"
+
+    await coalescer.flush()
+    await coalescer.close()
+
+    assert writer.batches == [[("c", "active", 0)]]
+    assert coalescer.get_stats()["pending"] == 0
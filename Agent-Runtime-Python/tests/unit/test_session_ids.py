@@ -0,0 +1,37 @@
+"""Unit tests for session ID generation."""
+
+import re
+
+import pytest
+from nanoid import generate as nanoid_generate
+
+from src.runtime.session_ids import (
+    TimeOrderedIdGenerator,
+    get_session_id_generator,
+    time_ordered_id,
+)
+
+
+def test_time_ordered_ids_are_url_safe_and_fixed_length():
+    """Test IDs are 26 Crockford base32 characters."""
+    session_id = time_ordered_id()
+
+    assert len(session_id) == 26
+    assert re.fullmatch(r"[0-9A-HJKMNP-TV-Z]{26}", session_id)
+
+
+def test_time_ordered_ids_sort_by_creation():
+    """Test IDs generated in sequence are strictly increasing."""
+    generate = TimeOrderedIdGenerator()
+    ids = [generate() for _ in range(10000)]
+
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_get_session_id_generator():
+    """Test configured format names map to generators."""
+    assert get_session_id_generator("nanoid") is nanoid_generate
+    assert get_session_id_generator("ulid") is time_ordered_id
+    with pytest.raises(ValueError):
+        get_session_id_generator("uuid4")
@@ -14,11 +14,11 @@ async def test_create_session(session_manager):
     )
     
     assert session is not None
-    assert session["sessionId"] is not None
-    assert session["agentId"] == 1
-    assert session["tenantId"] == 1
-    assert session["roomName"] == "test-room"
-    assert session["status"] == "connecting"
+    assert session.session_id is not None
+    assert session.agent_id == 1
+    assert session.tenant_id == 1
+    assert session.room_name == "test-room"
+    assert session.status == "connecting"
 
 
 @pytest.mark.asyncio
@@ -29,14 +29,14 @@ async def test_update_session_status(session_manager):
         tenant_id=1,
         room_name="test-room",
     )
-    session_id = session["sessionId"]
+    session_id = session.session_id
     
     await session_manager.update_session_status(session_id, "active", participant_count=1)
     
     updated = await session_manager.get_session(session_id)
     assert updated is not None
-    assert updated["status"] == "active"
-    assert updated["participantCount"] == 1
+    assert updated.status == "active"
+    assert updated.participant_count == 1
 
 
 @pytest.mark.asyncio
@@ -47,7 +47,7 @@ async def test_end_session(session_manager):
         tenant_id=1,
         room_name="test-room",
     )
-    session_id = session["sessionId"]
+    session_id = session.session_id
     
     await session_manager.end_session(session_id)
     
@@ -70,9 +70,9 @@ async def test_get_agent_sessions(session_manager):
     agent_sessions = await session_manager.get_agent_sessions(1)
     
     assert len(agent_sessions) == 2
-    session_ids = [s["sessionId"] for s in agent_sessions]
-    assert session1["sessionId"] in session_ids
-    assert session2["sessionId"] in session_ids
+    session_ids = [s.session_id for s in agent_sessions]
+    assert session1.session_id in session_ids
+    assert session2.session_id in session_ids
 
 
 @pytest.fixture
@@ -80,3 +80,199 @@ def session_manager():
     """Create a fresh SessionManager instance for each test."""
     return SessionManager()
 
+
+
+@pytest.mark.asyncio
+async def test_reads_route_to_primary_after_write(session_manager):
+    """Test sessions written by this process are read from the primary."""
+    from src.database.db import AsyncSessionLocal, AsyncReadSessionLocal
+
+    session = await session_manager.create_session(agent_id=1, tenant_id=1, room_name="room-1")
+
+    assert session_manager._session_factory_for(session.session_id) is AsyncSessionLocal
+    assert session_manager._session_factory_for("unknown-session") is AsyncReadSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_reads_route_to_replica_after_window():
+    """Test the read-your-writes window expires."""
+    from src.database.db import AsyncReadSessionLocal
+
+    manager = SessionManager(read_your_writes_seconds=0)
+    session = await manager.create_session(agent_id=1, tenant_id=1, room_name="room-1")
+
+    assert manager._session_factory_for(session.session_id) is AsyncReadSessionLocal
+    assert len(manager._recent_writes) <= 1
+
+
+@pytest.mark.asyncio
+async def test_live_sessions_are_pinned():
+    """Test sessions created by this process are never evicted."""
+    from src.runtime.session_cache import SessionCache
+
+    manager = SessionManager(cache=SessionCache(max_size=0))
+    session = await manager.create_session(agent_id=1, tenant_id=1, room_name="room-1")
+
+    assert await manager.get_session(session.session_id) is session
+    stats = manager.get_cache_stats()
+    assert stats["pinned"] == 1
+    assert stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_load():
+    """Test concurrent lookups of the same unknown ID issue one query."""
+    import asyncio
+
+    manager = SessionManager()
+    results = await asyncio.gather(*(manager.get_session("no-such-session") for _ in range(10)))
+
+    assert results == [None] * 10
+    stats = manager.get_cache_stats()
+    assert stats["dbLoads"] == 1
+    assert stats["coalescedLoads"] == 9
+    assert stats["inflightLoads"] == 0
+
+
+@pytest.mark.asyncio
+async def test_missing_session_is_negatively_cached(db_session):
+    """Test a lookup of an unknown ID is answered from the negative cache."""
+    manager = SessionManager()
+
+    assert await manager.get_session("no-such-session") is None
+    assert await manager.get_session("no-such-session") is None
+
+    stats = manager.get_cache_stats()
+    assert stats["dbLoads"] == 1
+    assert stats["negativeHits"] == 1
+    assert stats["negativeSize"] == 1
+
+
+@pytest.mark.asyncio
+async def test_time_ordered_session_ids():
+    """Test the session ID generator can be swapped for time-ordered IDs."""
+    from src.runtime.session_ids import time_ordered_id
+
+    manager = SessionManager(id_generator=time_ordered_id)
+    first = await manager.create_session(agent_id=1, tenant_id=1, room_name="room-1")
+    second = await manager.create_session(agent_id=1, tenant_id=1, room_name="room-2")
+
+    assert len(first.session_id) == 26
+    assert first.session_id < second.session_id
+
+
+@pytest.mark.asyncio
+async def test_tenant_live_status_counters():
+    """Test per-tenant live counters follow session transitions."""
+    manager = SessionManager()
+    first = await manager.create_session(agent_id=1, tenant_id=7, room_name="room-1")
+    second = await manager.create_session(agent_id=2, tenant_id=7, room_name="room-2")
+    await manager.create_session(agent_id=1, tenant_id=8, room_name="room-3")
+
+    await manager.update_session_status(first.session_id, "active")
+    assert manager.get_tenant_live_status(7) == {
+        "tenantId": 7,
+        "liveSessions": 2,
+        "byStatus": {"connecting": 1, "active": 1},
+    }
+
+    await manager.end_session(first.session_id)
+    await manager.end_session(second.session_id)
+    assert manager.get_tenant_live_status(7) == {
+        "tenantId": 7,
+        "liveSessions": 0,
+        "byStatus": {},
+    }
+    assert [s.room_name for s in manager.get_tenant_sessions(8)] == ["room-3"]
+
+
+@pytest.mark.asyncio
+async def test_reaper_ends_sessions_stuck_connecting():
+    """Test sessions left connecting past their deadline are ended."""
+    from src.runtime.session_reaper import SessionReaper
+
+    reaper = SessionReaper(connecting_timeout_seconds=1, tick_seconds=1)
+    manager = SessionManager(reaper=reaper)
+    stuck = await manager.create_session(agent_id=1, tenant_id=1, room_name="room-1")
+    joined = await manager.create_session(agent_id=1, tenant_id=1, room_name="room-2")
+    await manager.activate_session(joined.session_id)
+
+    assert await reaper.reap(manager._reap) == 1
+
+    assert stuck.status == "ended"
+    assert joined.status == "active"
+    assert manager.get_tenant_live_status(1)["liveSessions"] == 1
+    stats = manager.get_reaper_stats()
+    assert stats["reapedConnecting"] == 1
+    assert stats["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_same_status_updates_do_not_extend_deadline():
+    """Test participant-count updates while connecting keep the original deadline."""
+    from src.runtime.session_reaper import SessionReaper
+
+    reaper = SessionReaper(connecting_timeout_seconds=2, tick_seconds=1)
+    manager = SessionManager(reaper=reaper)
+    session = await manager.create_session(agent_id=1, tenant_id=1, room_name="room-1")
+
+    assert await reaper.reap(manager._reap) == 0
+    await manager.update_session_status(session.session_id, "connecting", participant_count=1)
+    assert await reaper.reap(manager._reap) == 1
+
+    assert session.status == "ended"
+    assert manager.get_reaper_stats()["reapedConnecting"] == 1
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_restore_sessions_adopts_live_sessions():
+    """Test sessions reloaded at startup are pinned, indexed and counted."""
+    from datetime import datetime
+    from src.runtime.session_record import SessionRecord
+
+    manager = SessionManager()
+    records = [
+        SessionRecord("restored-1", 1, 7, "room-1", "active", datetime.utcnow()),
+        SessionRecord("restored-2", 1, 7, "room-2", "idle", datetime.utcnow()),
+        SessionRecord("restored-3", 2, 7, "room-3", "ended", datetime.utcnow()),
+    ]
+
+    assert manager.restore_sessions(records) == 2
+    # Restoring again is a no-op
+    assert manager.restore_sessions(records) == 0
+
+    assert await manager.get_session("restored-1") is records[0]
+    assert manager.get_cache_stats()["pinned"] == 2
+    assert manager.get_tenant_live_status(7)["byStatus"] == {"active": 1, "idle": 1}
+    assert {s.session_id for s in await manager.get_agent_sessions(1)} == {
+        "restored-1",
+        "restored-2",
+    }
+
+
+@pytest.mark.asyncio
+async def test_fail_session_is_terminal():
+    """Test a failed session leaves the live indexes and stays failed."""
+    manager = SessionManager()
+    session = await manager.create_session(agent_id=1, tenant_id=7, room_name="room-1")
+
+    await manager.fail_session(session.session_id)
+    assert session.status == "failed"
+    assert manager.get_tenant_live_status(7)["liveSessions"] == 0
+
+    # A late status change never reopens it
+    await manager.update_session_status(session.session_id, "active")
+    assert session.status == "failed"
+
+
+@pytest.mark.asyncio
+async def test_is_live_only_for_sessions_this_process_runs():
+    """Test ended and unknown sessions are not reported live."""
+    manager = SessionManager()
+    session = await manager.create_session(agent_id=1, tenant_id=1, room_name="room-1")
+
+    assert manager.is_live(session.session_id)
+    await manager.end_session(session.session_id)
+    assert not manager.is_live(session.session_id)
+    assert not manager.is_live("unknown")
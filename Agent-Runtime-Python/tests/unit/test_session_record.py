@@ -0,0 +1,49 @@
+"""Unit tests for SessionRecord."""
+
+import sys
+from datetime import datetime
+
+from src.runtime.session_record import SessionRecord
+
+
+def make_record(**overrides):
+    values = dict(
+        session_id="abc",
+        agent_id=1,
+        tenant_id=2,
+        room_name="room-1",
+        status="active",
+        started_at=datetime(2024, 1, 1, 12, 0, 0),
+    )
+    values.update(overrides)
+    return SessionRecord(**values)
+
+
+def test_to_dict_matches_api_format():
+    """Test serialization uses the camelCase API keys."""
+    record = make_record(participant_count=3)
+
+    assert record.to_dict() == {
+        "sessionId": "abc",
+        "agentId": 1,
+        "tenantId": 2,
+        "roomName": "room-1",
+        "status": "active",
+        "startedAt": datetime(2024, 1, 1, 12, 0, 0),
+        "endedAt": None,
+        "participantCount": 3,
+    }
+
+
+def test_record_has_no_instance_dict():
+    """Test records are slotted and smaller than the equivalent dict."""
+    record = make_record()
+
+    assert not hasattr(record, "__dict__")
+    assert sys.getsizeof(record) < sys.getsizeof(record.to_dict())
+
+
+def test_status_is_interned():
+    """Test equal status strings share one object."""
+    status = "".join(["act", "ive"])
+    assert make_record(status=status).status is make_record().status
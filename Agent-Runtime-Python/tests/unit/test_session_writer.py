@@ -0,0 +1,132 @@
+"""Unit tests for SessionWriter write-behind queue."""
+
+import pytest
+from datetime import datetime
+from src.runtime.session_manager import SessionManager
+from src.runtime.session_writer import SessionWriter
+
+
+def _row(session_id):
+    return {
+        "agent_id": 1,
+        "tenant_id": 1,
+        "session_id": session_id,
+        "room_name": "test-room",
+        "status": "connecting",
+        "started_at": datetime.utcnow(),
+    }
+
+
+@pytest.mark.asyncio
+async def test_writes_are_batched():
+    """Test writes queued before the flusher runs go out as one batch."""
+    writer = SessionWriter(batch_size=100, retry_base_seconds=0.0)
+    for i in range(10):
+        await writer.enqueue_insert(_row(f"test-writer-{i}"))
+    await writer.enqueue_update("test-writer-0", {"status": "active"})
+
+    await writer.close()
+
+    stats = writer.get_stats()
+    assert stats["enqueued"] == 11
+    assert stats["queueDepth"] == 0
+    assert stats["batches"] == 1
+    assert stats["written"] + stats["droppedWrites"] == 11
+
+
+@pytest.mark.asyncio
+async def test_batch_size_limit():
+    """Test batches never exceed the configured size."""
+    writer = SessionWriter(batch_size=4, retry_base_seconds=0.0)
+    for i in range(10):
+        await writer.enqueue_insert(_row(f"test-writer-{i}"))
+
+    await writer.close()
+
+    stats = writer.get_stats()
+    assert stats["batches"] == 3
+
+
+class _FlakyWriter(SessionWriter):
+    """Writer whose database rejects some rows and drops the first connection."""
+
+    def __init__(self, bad_ids=(), connection_failures=0, **kwargs):
+        super().__init__(retry_base_seconds=0.0, **kwargs)
+        self.bad_ids = set(bad_ids)
+        self.connection_failures = connection_failures
+        self.stored = []
+
+    async def _write_once(self, batch):
+        if self.connection_failures:
+            self.connection_failures -= 1
+            raise ConnectionError("connection reset")
+        if any(values["session_id"] in self.bad_ids for _, values in batch):
+            raise ValueError("violates check constraint")
+        self.stored.extend(values["session_id"] for _, values in batch)
+
+
+@pytest.mark.asyncio
+async def test_transient_failure_is_retried():
+    """Test a batch is retried after a dropped connection instead of lost."""
+    writer = _FlakyWriter(connection_failures=2, batch_size=100)
+    for i in range(5):
+        await writer.enqueue_insert(_row(f"test-writer-{i}"))
+
+    await writer.close()
+
+    stats = writer.get_stats()
+    assert stats["retries"] == 2
+    assert stats["failedBatches"] == 0
+    assert stats["written"] == 5
+    assert len(writer.stored) == 5
+
+
+@pytest.mark.asyncio
+async def test_only_rejected_rows_are_dropped():
+    """Test a rejected batch is split so the other rows are still written."""
+    writer = _FlakyWriter(bad_ids={"test-writer-6"}, batch_size=100)
+    for i in range(10):
+        await writer.enqueue_insert(_row(f"test-writer-{i}"))
+
+    await writer.close()
+
+    stats = writer.get_stats()
+    assert stats["failedBatches"] == 1
+    assert stats["droppedWrites"] == 1
+    assert stats["written"] == 9
+    assert writer.stored == [f"test-writer-{i}" for i in range(10) if i != 6]
+
+
+@pytest.mark.asyncio
+async def test_backpressure_when_queue_full():
+    """Test enqueue waits for the flusher when the queue is full."""
+    writer = SessionWriter(max_queue_size=2, batch_size=2, retry_base_seconds=0.0)
+    for i in range(6):
+        await writer.enqueue_insert(_row(f"test-writer-{i}"))
+
+    await writer.close()
+
+    stats = writer.get_stats()
+    assert stats["backpressureWaits"] >= 1
+    assert stats["written"] + stats["droppedWrites"] == 6
+
+
+@pytest.mark.asyncio
+async def test_session_manager_write_behind():
+    """Test SessionManager queues lifecycle writes instead of awaiting them."""
+    manager = SessionManager(writer=SessionWriter())
+    session = await manager.create_session(agent_id=1, tenant_id=1, room_name="test-room")
+    await manager.end_session(session.session_id)
+
+    assert manager.get_writer_stats()["enqueued"] == 2
+
+    await manager.close()
+    assert manager.get_writer_stats()["queueDepth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_session_manager_without_writer():
+    """Test write-behind stats are absent when the writer is disabled."""
+    manager = SessionManager()
+    assert manager.get_writer_stats() is None
+    await manager.close()
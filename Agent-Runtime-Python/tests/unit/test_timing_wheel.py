@@ -0,0 +1,53 @@
+"""Unit tests for TimingWheel."""
+
+from src.runtime.timing_wheel import TimingWheel
+
+
+def test_keys_expire_after_their_delay():
+    """Test keys expire on the tick matching their delay."""
+    wheel = TimingWheel(tick_seconds=1.0, slots=8)
+    wheel.schedule("a", 1)
+    wheel.schedule("b", 3)
+
+    assert wheel.tick() == ["a"]
+    assert wheel.tick() == []
+    assert wheel.tick() == ["b"]
+    assert len(wheel) == 0
+
+
+def test_delays_longer_than_one_revolution():
+    """Test rounds carry deadlines past a full turn of the wheel."""
+    wheel = TimingWheel(tick_seconds=1.0, slots=4)
+    wheel.schedule("a", 4)
+    wheel.schedule("b", 9)
+
+    expired = {}
+    for tick in range(1, 11):
+        for key in wheel.tick():
+            expired[key] = tick
+
+    assert expired == {"a": 4, "b": 9}
+
+
+def test_cancel_and_reschedule():
+    """Test cancelled keys never expire and rescheduling moves the deadline."""
+    wheel = TimingWheel(tick_seconds=1.0, slots=8)
+    wheel.schedule("a", 1)
+    wheel.schedule("b", 1)
+    assert wheel.cancel("a") is True
+    assert wheel.cancel("a") is False
+    wheel.schedule("b", 2)
+
+    assert wheel.tick() == []
+    assert "b" in wheel
+    assert wheel.tick() == ["b"]
+
+
+def test_sub_tick_delay_rounds_up():
+    """Test delays shorter than a tick expire on the next tick."""
+    wheel = TimingWheel(tick_seconds=0.5, slots=8)
+    wheel.schedule("a", 0.1)
+    wheel.schedule("b", 0.6)
+
+    assert wheel.tick() == ["a"]
+    assert wheel.tick() == ["b"]
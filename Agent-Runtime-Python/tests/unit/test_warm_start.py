@@ -0,0 +1,133 @@
+"""Unit tests for startup warm start."""
+
+from datetime import datetime
+
+import pytest
+
+from src.database.models import Agent, DeploymentStatusEnum
+from src.runtime.agent_manager import AgentManager
+from src.runtime.session_manager import SessionManager
+from src.runtime.agent_instance import AgentInstance
+from src.runtime.session_record import SessionRecord
+from src.runtime.warm_start import (
+    WarmStart,
+    agent_config_from_model,
+    service_configs_from_settings,
+)
+
+
+def test_agent_config_from_model():
+    """Test an agent row maps to the registration config format."""
+    agent = Agent(
+        id=42,
+        tenant_id=3,
+        name="Support",
+        stt_provider="assemblyai",
+        tts_provider="cartesia",
+        llm_provider="openai",
+        llm_model="gpt-4.1-mini",
+        llm_config='{"temperature": 0.2}',
+        vision_enabled=1,
+        screen_share_enabled=0,
+        transcribe_enabled=1,
+        languages='["en", "tr"]',
+        mcp_config="not json",
+        max_concurrent_sessions=None,
+        deployment_status=DeploymentStatusEnum.DEPLOYED,
+    )
+
+    config = agent_config_from_model(agent)
+
+    assert config["agentId"] == 42
+    assert config["tenantId"] == 3
+    assert config["llmConfig"] == {"temperature": 0.2}
+    assert config["visionEnabled"] is True
+    assert config["screenShareEnabled"] is False
+    assert config["languages"] == ["en", "tr"]
+    assert config["mcpConfig"] is None
+    assert config["maxConcurrentSessions"] == 10
+    assert config["livekitConfig"] is None
+    assert config["langfuseConfig"] is None
+
+
+def test_service_configs_from_settings():
+    """Test LiveKit and Langfuse configs are rebuilt like Agent-Builder does."""
+    configs = service_configs_from_settings({
+        "livekit_url": "wss://livekit.example.com",
+        "livekit_api_key": "key",
+        "livekit_api_secret": "secret",
+        "langfuse_enabled": "true",
+        "langfuse_public_key": "pk",
+    })
+
+    assert configs["livekitConfig"] == {
+        "url": "wss://livekit.example.com", "apiKey": "key", "apiSecret": "secret"
+    }
+    assert configs["langfuseConfig"]["enabled"] is True
+    assert configs["langfuseConfig"]["publicKey"] == "pk"
+    assert service_configs_from_settings({"langfuse_enabled": "false"}) == {
+        "livekitConfig": None, "langfuseConfig": None
+    }
+
+
+def test_rebuilt_agent_uses_settings_then_env_credentials(monkeypatch):
+    """Test warm-started agents dispatch with stored settings, else the env."""
+    monkeypatch.setenv("LIVEKIT_URL", "ws://env-livekit:7880")
+    monkeypatch.setenv("LIVEKIT_API_KEY", "env-key")
+    monkeypatch.setenv("LIVEKIT_API_SECRET", "env-secret")
+    agent = Agent(id=7, tenant_id=1, name="Support", max_concurrent_sessions=2)
+
+    without_settings = AgentInstance(7, agent_config_from_model(agent))
+    assert without_settings._livekit_credentials() == (
+        "ws://env-livekit:7880", "env-key", "env-secret"
+    )
+
+    configs = service_configs_from_settings({
+        "livekit_url": "wss://stored", "livekit_api_key": "k", "livekit_api_secret": "s"
+    })
+    with_settings = AgentInstance(7, agent_config_from_model(agent, configs))
+    assert with_settings._livekit_credentials() == ("wss://stored", "k", "s")
+
+
+def _unreachable_database():
+    raise ConnectionError("database unavailable")
+
+
+@pytest.mark.asyncio
+async def test_failed_warm_start_does_not_block_readiness():
+    """Test readiness is held during the load and released when it fails."""
+    warm_start = WarmStart(
+        AgentManager(), SessionManager(), session_factory=_unreachable_database
+    )
+    assert warm_start.ready
+
+    task = warm_start.start()
+    assert not warm_start.ready
+    stats = await task
+
+    assert warm_start.ready
+    assert stats["state"] == "failed"
+    assert "database unavailable" in stats["error"]
+
+
+@pytest.mark.asyncio
+async def test_sessions_of_unregistered_agents_are_not_restored():
+    """Test only sessions whose agent registered are adopted as live."""
+    agents = AgentManager()
+    sessions = SessionManager()
+    await agents.register_agent(1, {"agentId": 1, "tenantId": 7, "maxConcurrentSessions": 4})
+    warm_start = WarmStart(agents, sessions, session_factory=_unreachable_database)
+    records = [
+        SessionRecord("warm-1", 1, 7, "room-1", "active", datetime.utcnow()),
+        SessionRecord("warm-2", 2, 7, "room-2", "active", datetime.utcnow()),
+    ]
+
+    await warm_start._adopt_sessions(records)
+
+    assert sessions.is_live("warm-1")
+    assert not sessions.is_live("warm-2")
+    assert sessions.get_tenant_live_status(7)["liveSessions"] == 1
+    assert agents.get_agent_instance(1).active_sessions == {"warm-1"}
+    stats = warm_start.get_stats()
+    assert stats["sessions"] == 1
+    assert stats["sessionsOrphaned"] == 1